@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from functools import lru_cache
+
 from .shared import *
 from .constants import *
 from .helpers import *
@@ -914,7 +916,8 @@ class ActionsInputMixin:
         self._sync_shadow_transport_from_primary(self.player)
         self.seek_slider.setValue(clamped_display)
         self._apply_main_jog_outside_cue_behavior(absolute)
-        self._mtc_sender.request_resync()
+        if self._mtc_sender_instance is not None:
+            self._mtc_sender_instance.request_resync()
         return clamped_display, absolute
 
     def _on_seek_value_changed(self, value: int) -> None:
@@ -1051,7 +1054,6 @@ class ActionsInputMixin:
             out_ratio = out_ms / float(self.current_duration_ms)
 
         self.progress_label.set_transport_state(fill_stop, in_ratio, out_ratio, audio_file_mode)
-        self.progress_label.set_waveform(self._main_progress_waveform)
 
         if self.main_progress_show_text:
             if self.main_transport_timeline_mode == "audio_file":
@@ -1079,6 +1081,7 @@ class ActionsInputMixin:
         self.settings.volume = value
 
     def _reset_set_data(self) -> None:
+        self._invalidate_sound_binding_caches()
         self.data = {
             group: [[SoundButtonData() for _ in range(SLOTS_PER_PAGE)] for _ in range(PAGE_COUNT)]
             for group in GROUPS
@@ -1270,7 +1273,7 @@ class ActionsInputMixin:
                             lines.append(f"pysspcueend{slot_index}={cue_end}")
                         timecode_offset = format_timecode_offset_hhmmss(
                             slot.timecode_offset_ms,
-                            nominal_fps(self.timecode_fps),
+                            self._timecode_nominal_fps,
                         )
                         if timecode_offset is not None:
                             lines.append(f"pyssptimecodeoffset{slot_index}={timecode_offset}")
@@ -1386,6 +1389,8 @@ class ActionsInputMixin:
     def _open_options_dialog(self, initial_page: Optional[str] = None) -> None:
         available_devices = sorted(list_output_devices(), key=lambda v: v.lower())
         available_midi_output_devices = list_midi_output_devices()
+        self._midi_output_devices_cache = dict(available_midi_output_devices)
+        self._midi_output_devices_cache_t = time.monotonic()
         total_ram_mb, _reserved_ram_mb, preload_cap_mb = get_preload_memory_limits_mb()
         dialog = OptionsDialog(
             active_group_color=self.active_group_color,
@@ -1626,7 +1631,7 @@ class ActionsInputMixin:
             selected_timecode_mode == TIMECODE_MODE_FOLLOW_FREEZE
             and self.timecode_mode != TIMECODE_MODE_FOLLOW_FREEZE
         ):
-            self._timecode_follow_frozen_ms = self._timecode_current_follow_ms()
+            self._tc.follow_frozen_ms = self._timecode_current_follow_ms()
         self.timecode_mode = selected_timecode_mode
         self.timecode_fps = dialog.selected_timecode_fps()
         self.timecode_mtc_fps = dialog.selected_timecode_mtc_fps()
@@ -1755,6 +1760,7 @@ class ActionsInputMixin:
         if selected_device != self.audio_output_device:
             if self._switch_audio_device(selected_device):
                 self.audio_output_device = selected_device
+        self._on_timecode_audio_device_changed()
         self._apply_talk_state_volume(fade=True)
         self._update_talk_button_visual()
         self._sync_playlist_shuffle_buttons()
@@ -1929,24 +1935,14 @@ class ActionsInputMixin:
         tokens: set[str] = set()
         for key in SYSTEM_HOTKEY_ORDER_DEFAULT:
             h1, h2 = self._normalized_hotkey_pair(key)
-            for seq_text in [h1, h2]:
-                key_token = self._normalize_hotkey_text(seq_text)
-                if not key_token:
-                    continue
-                modifier_key = self._modifier_key_from_hotkey_text(seq_text)
-                if modifier_key is not None:
-                    tokens.add(key_token)
-                    continue
-                seq = self._key_sequence_from_hotkey_text(seq_text)
-                if seq is not None:
-                    tokens.add(key_token)
+            if h1:
+                tokens.add(h1)
+            if h2:
+                tokens.add(h2)
         if self.quick_action_enabled:
             for raw in self.quick_action_keys[:48]:
                 key_token = self._normalize_hotkey_text(raw)
-                if not key_token:
-                    continue
-                seq = self._key_sequence_from_hotkey_text(raw)
-                if seq is not None:
+                if key_token:
                     tokens.add(key_token)
         return tokens
 
@@ -1984,7 +1980,13 @@ class ActionsInputMixin:
                         badges.append(badge)
         return badges
 
+    def _invalidate_sound_binding_caches(self) -> None:
+        self._sound_bindings_cache = None
+        self._sound_midi_bindings_cache = None
+
     def _collect_sound_button_hotkey_bindings(self) -> Dict[str, Tuple[str, int, int]]:
+        if self._sound_bindings_cache is not None:
+            return self._sound_bindings_cache
         bindings: Dict[str, Tuple[str, int, int]] = {}
         for group in GROUPS:
             for page_index in range(PAGE_COUNT):
@@ -2002,9 +2004,12 @@ class ActionsInputMixin:
             if not token or token in bindings:
                 continue
             bindings[token] = ("Q", 0, slot_index)
+        self._sound_bindings_cache = bindings
         return bindings
 
     def _collect_sound_button_midi_bindings(self) -> Dict[str, Tuple[str, int, int]]:
+        if self._sound_midi_bindings_cache is not None:
+            return self._sound_midi_bindings_cache
         bindings: Dict[str, Tuple[str, int, int]] = {}
         for group in GROUPS:
             for page_index in range(PAGE_COUNT):
@@ -2022,6 +2027,7 @@ class ActionsInputMixin:
             if not token or token in bindings:
                 continue
             bindings[token] = ("Q", 0, slot_index)
+        self._sound_midi_bindings_cache = bindings
         return bindings
 
     def _sound_button_hotkey_trigger(self, slot_key: Tuple[str, int, int]) -> None:
@@ -2498,6 +2504,7 @@ class ActionsInputMixin:
         return selector == source_selector
 
     @staticmethod
+    @lru_cache(maxsize=16)
     def _normalize_midi_relative_mode(mode: str) -> str:
         token = str(mode or "").strip().lower()
         if token in {"auto", "twos_complement", "sign_magnitude", "binary_offset"}:
@@ -2764,14 +2771,11 @@ class ActionsInputMixin:
                     event.ignore()
                     return
         self._hard_stop_all()
-        try:
-            self._ltc_sender.shutdown()
-        except Exception:
-            pass
-        try:
-            self._mtc_sender.shutdown()
-        except Exception:
-            pass
+        for sender in self._timecode_senders():
+            try:
+                sender.shutdown()
+            except Exception:
+                pass
         try:
             self._audio_service.shutdown()
         except Exception:
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from typing import Dict, List
 
+from PyQt5.QtGui import QColor
+
 LOSSY_AUDIO_EXTENSIONS = {".mp3", ".m4a", ".aac", ".ogg", ".wma"}
 FFMPEG_AUDIO_CODEC_FLAGS = {
     ".mp3": ["-c:a", "libmp3lame", "-q:a", "2"],
@@ -33,7 +35,9 @@ COLORS = {
     "vocal_removed_indicator": "#8E7CFF",
     "midi_indicator": "#FF9E4A",
     "lyric_indicator": "#57C3A4",
+    "ram_loaded": "#2ED573",
 }
+COLOR_OBJECTS: Dict[str, QColor] = {key: QColor(value) for key, value in COLORS.items()}
 TIMECODE_SLOT_INDICATOR_COLOR = "#9C4DFF"
 
 HOTKEY_DEFAULTS: Dict[str, tuple[str, str]] = {
@@ -72,7 +76,7 @@ HOTKEY_DEFAULTS: Dict[str, tuple[str, str]] = {
     "open_hide_lyric_navigator": ("", ""),
 }
 
-MIDI_HOTKEY_DEFAULTS: Dict[str, tuple[str, str]] = {key: ("", "") for key in HOTKEY_DEFAULTS.keys()}
+MIDI_HOTKEY_DEFAULTS: Dict[str, tuple[str, str]] = {key: ("", "") for key in HOTKEY_DEFAULTS}
 
 SYSTEM_HOTKEY_ORDER_DEFAULT: List[str] = [
     "new_set",
@@ -13,8 +13,17 @@ __all__ = [
     "clean_set_value",
     "to_set_color_value",
     "elide_text",
+    "_TCDBG_ENABLED",
+    "_tcdbg",
 ]
 
+_TCDBG_ENABLED = os.environ.get("PYSSP_TCDBG") == "1"
+
+
+def _tcdbg(message: str) -> None:
+    print(f"[TCDBG] {message}")
+
+
 def build_lock_icon(size: int = 18, color: str = "#202020") -> QPixmap:
     pixmap = QPixmap(size, size)
     pixmap.fill(Qt.transparent)
@@ -434,7 +434,7 @@ class PagesSlotsMixin:
                 lines.append(f"pysspcuestart{slot_index}={cue_start}")
             if cue_end is not None:
                 lines.append(f"pysspcueend{slot_index}={cue_end}")
-            timecode_offset = format_timecode_offset_hhmmss(slot.timecode_offset_ms, nominal_fps(self.timecode_fps))
+            timecode_offset = format_timecode_offset_hhmmss(slot.timecode_offset_ms, self._timecode_nominal_fps)
             if timecode_offset is not None:
                 lines.append(f"pyssptimecodeoffset{slot_index}={timecode_offset}")
             timecode_timeline = normalize_slot_timecode_timeline_mode(slot.timecode_timeline_mode)
@@ -637,6 +637,7 @@ class PagesSlotsMixin:
         self.vocal_removed_warning_banner.setVisible(bool(message))
 
     def _set_dirty(self, dirty: bool = True) -> None:
+        self._invalidate_sound_binding_caches()
         if self._dirty == dirty:
             return
         self._dirty = dirty
@@ -1921,7 +1922,7 @@ class PagesSlotsMixin:
         dialog = TimecodeSetupDialog(
             offset_ms=slot.timecode_offset_ms,
             timeline_mode=slot.timecode_timeline_mode,
-            fps=nominal_fps(self.timecode_fps),
+            fps=self._timecode_nominal_fps,
             language=self.ui_language,
             parent=self,
         )
@@ -2135,11 +2136,15 @@ class PagesSlotsMixin:
         matches.sort(key=lambda value: (0 if os.path.splitext(value)[1].lower() == ".lrc" else 1, value.casefold()))
         return matches[0]
 
-    def _diagnose_slot_lyric_issue(self, slot: SoundButtonData) -> Optional[str]:
+    def _diagnose_slot_lyric_issue(
+        self,
+        slot: SoundButtonData,
+        path_exists: Callable[[str], bool] = os.path.exists,
+    ) -> Optional[str]:
         linked_path = str(slot.lyric_file or "").strip()
         if not linked_path:
             return None
-        if os.path.exists(linked_path):
+        if path_exists(linked_path):
             return None
         return "Linked lyric file path is missing."
 
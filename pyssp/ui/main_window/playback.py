@@ -6,6 +6,14 @@ from .helpers import *
 from .widgets import *
 
 
+_PRELOAD_ICON_IDLE_QSS = (
+    "QLabel{font-size:9pt;font-weight:bold;color:#4A4F55;background:#C8CDD4;border:1px solid #8C939D;border-radius:8px;}"
+)
+_PRELOAD_ICON_ACTIVE_QSS = (
+    "QLabel{font-size:9pt;font-weight:bold;color:#0B4A1F;background:#5FE088;border:1px solid #219653;border-radius:8px;}"
+)
+
+
 class PlaybackMixin:
     @staticmethod
     def _is_audio_player(player) -> bool:
@@ -30,8 +38,7 @@ class PlaybackMixin:
     def _dispose_audio_players(self) -> None:
         self._cancel_all_pending_player_media_loads()
         self._clear_all_vocal_shadow_players()
-        for name in ["player", "player_b"]:
-            player = getattr(self, name, None)
+        for player in (self.player, self.player_b):
             if player is None:
                 continue
             try:
@@ -42,7 +49,8 @@ class PlaybackMixin:
                 player.deleteLater()
             except Exception:
                 pass
-            setattr(self, name, None)
+        self.player = None
+        self.player_b = None
 
     def _init_silent_audio_players(self) -> None:
         self.player = NoAudioPlayer(self)
@@ -96,10 +104,11 @@ class PlaybackMixin:
 
         group_key = self._view_group_key()
         playing_key = (group_key, self.current_page, slot_index)
-        print(
-            f"[TCDBG] {click_t:.6f} play_click key={playing_key} title={(slot.title or '<untitled>')} "
-            f"mode={self._current_fade_mode()} multi={self._is_multi_play_enabled()}"
-        )
+        if _TCDBG_ENABLED:
+            _tcdbg(
+                f"{click_t:.6f} play_click key={playing_key} title={(slot.title or '<untitled>')} "
+                f"mode={self._current_fade_mode()} multi={self._is_multi_play_enabled()}"
+            )
         self._prune_multi_players()
         force_single_play = False
         if (not self._is_multi_play_enabled()) and self._multi_players:
@@ -144,7 +153,8 @@ class PlaybackMixin:
             and fade_out_on
             and not cross_mode
         ):
-            print(f"[TCDBG] {time.perf_counter():.6f} delayed_start_due_to_fadeout key={playing_key}")
+            if _TCDBG_ENABLED:
+                _tcdbg(f"{time.perf_counter():.6f} delayed_start_due_to_fadeout key={playing_key}")
             self._schedule_start_after_fadeout(group_key, self.current_page, slot_index)
             return True
 
@@ -181,18 +191,20 @@ class PlaybackMixin:
                 self._refresh_sound_grid()
                 return True
             if not load_result:
-                print(
-                    f"[TCDBG] {time.perf_counter():.6f} media_load_failed cross "
-                    f"dt_ms={(time.perf_counter() - load_t) * 1000.0:.1f} key={playing_key}"
-                )
+                if _TCDBG_ENABLED:
+                    _tcdbg(
+                        f"{time.perf_counter():.6f} media_load_failed cross "
+                        f"dt_ms={(time.perf_counter() - load_t) * 1000.0:.1f} key={playing_key}"
+                    )
                 self.current_playing = None
                 self._refresh_sound_grid()
                 self._update_now_playing_label("")
                 return False
-            print(
-                f"[TCDBG] {time.perf_counter():.6f} media_load_ok cross "
-                f"dt_ms={(time.perf_counter() - load_t) * 1000.0:.1f} key={playing_key}"
-            )
+            if _TCDBG_ENABLED:
+                _tcdbg(
+                    f"{time.perf_counter():.6f} media_load_ok cross "
+                    f"dt_ms={(time.perf_counter() - load_t) * 1000.0:.1f} key={playing_key}"
+                )
             if new_player is self.player:
                 self._player_slot_volume_pct = slot_pct
             else:
@@ -200,12 +212,14 @@ class PlaybackMixin:
             target_volume = self._effective_slot_target_volume(slot_pct)
             seek_t = time.perf_counter()
             self._seek_player_to_slot_start_cue(new_player, slot)
-            print(
-                f"[TCDBG] {time.perf_counter():.6f} media_seek_done cross "
-                f"dt_ms={(time.perf_counter() - seek_t) * 1000.0:.1f} key={playing_key}"
-            )
+            if _TCDBG_ENABLED:
+                _tcdbg(
+                    f"{time.perf_counter():.6f} media_seek_done cross "
+                    f"dt_ms={(time.perf_counter() - seek_t) * 1000.0:.1f} key={playing_key}"
+                )
             self._set_player_volume(new_player, 0)
-            print(f"[TCDBG] {time.perf_counter():.6f} player_play cross key={playing_key}")
+            if _TCDBG_ENABLED:
+                _tcdbg(f"{time.perf_counter():.6f} player_play cross key={playing_key}")
             self._prepare_vocal_shadow_player(new_player, slot, start_playing=False)
             new_player.play()
             self._sync_shadow_transport_from_primary(new_player)
@@ -237,30 +251,34 @@ class PlaybackMixin:
                 self._refresh_sound_grid()
                 return True
             if not load_result:
-                print(
-                    f"[TCDBG] {time.perf_counter():.6f} media_load_failed primary "
-                    f"dt_ms={(time.perf_counter() - load_t) * 1000.0:.1f} key={playing_key}"
-                )
+                if _TCDBG_ENABLED:
+                    _tcdbg(
+                        f"{time.perf_counter():.6f} media_load_failed primary "
+                        f"dt_ms={(time.perf_counter() - load_t) * 1000.0:.1f} key={playing_key}"
+                    )
                 self.current_playing = None
                 self._refresh_sound_grid()
                 self._update_now_playing_label("")
                 return False
-            print(
-                f"[TCDBG] {time.perf_counter():.6f} media_load_ok primary "
-                f"dt_ms={(time.perf_counter() - load_t) * 1000.0:.1f} key={playing_key}"
-            )
+            if _TCDBG_ENABLED:
+                _tcdbg(
+                    f"{time.perf_counter():.6f} media_load_ok primary "
+                    f"dt_ms={(time.perf_counter() - load_t) * 1000.0:.1f} key={playing_key}"
+                )
             self._player_slot_volume_pct = slot_pct
             target_volume = self._effective_slot_target_volume(slot_pct)
             seek_t = time.perf_counter()
             self._seek_player_to_slot_start_cue(self.player, slot)
             self._prepare_vocal_shadow_player(self.player, slot, start_playing=False)
-            print(
-                f"[TCDBG] {time.perf_counter():.6f} media_seek_done primary "
-                f"dt_ms={(time.perf_counter() - seek_t) * 1000.0:.1f} key={playing_key}"
-            )
+            if _TCDBG_ENABLED:
+                _tcdbg(
+                    f"{time.perf_counter():.6f} media_seek_done primary "
+                    f"dt_ms={(time.perf_counter() - seek_t) * 1000.0:.1f} key={playing_key}"
+                )
             if fade_in_on:
                 self._set_player_volume(self.player, 0)
-                print(f"[TCDBG] {time.perf_counter():.6f} player_play fade_in key={playing_key}")
+                if _TCDBG_ENABLED:
+                    _tcdbg(f"{time.perf_counter():.6f} player_play fade_in key={playing_key}")
                 self.player.play()
                 self._sync_shadow_transport_from_primary(self.player)
                 started_playback = True
@@ -270,7 +288,8 @@ class PlaybackMixin:
                 self._start_fade(self.player, target_volume, self.fade_in_sec, stop_on_complete=False)
             else:
                 self._set_player_volume(self.player, target_volume)
-                print(f"[TCDBG] {time.perf_counter():.6f} player_play direct key={playing_key}")
+                if _TCDBG_ENABLED:
+                    _tcdbg(f"{time.perf_counter():.6f} player_play direct key={playing_key}")
                 self.player.play()
                 self._sync_shadow_transport_from_primary(self.player)
                 started_playback = True
@@ -824,10 +843,11 @@ class PlaybackMixin:
         self._main_waveform_poll_timer.stop()
 
     def _on_state_changed(self, _state: int) -> None:
-        print(
-            f"[TCDBG] {time.perf_counter():.6f} state_changed "
-            f"primary={self.player.state()} secondary={self.player_b.state()}"
-        )
+        if _TCDBG_ENABLED:
+            _tcdbg(
+                f"{time.perf_counter():.6f} state_changed "
+                f"primary={self.player.state()} secondary={self.player_b.state()}"
+            )
         self._update_pause_button_label()
         if self._ignore_state_changes > 0:
             return
@@ -916,21 +936,20 @@ class PlaybackMixin:
         self._refresh_current_page_ram_loaded_indicators()
         if (not enabled) or active_jobs <= 0:
             self._preload_icon_blink_on = False
-            self.preload_status_icon.setStyleSheet(
-                "QLabel{font-size:9pt;font-weight:bold;color:#4A4F55;background:#C8CDD4;border:1px solid #8C939D;border-radius:8px;}"
-            )
-            self.preload_status_icon.setToolTip("RAM preload idle")
+            self._set_preload_status_icon_style(_PRELOAD_ICON_IDLE_QSS, "RAM preload idle")
             return
         self._preload_icon_blink_on = not self._preload_icon_blink_on
-        if self._preload_icon_blink_on:
-            self.preload_status_icon.setStyleSheet(
-                "QLabel{font-size:9pt;font-weight:bold;color:#0B4A1F;background:#5FE088;border:1px solid #219653;border-radius:8px;}"
-            )
-        else:
-            self.preload_status_icon.setStyleSheet(
-                "QLabel{font-size:9pt;font-weight:bold;color:#4A4F55;background:#C8CDD4;border:1px solid #8C939D;border-radius:8px;}"
-            )
-        self.preload_status_icon.setToolTip(f"RAM preload active ({active_jobs})")
+        self._set_preload_status_icon_style(
+            _PRELOAD_ICON_ACTIVE_QSS if self._preload_icon_blink_on else _PRELOAD_ICON_IDLE_QSS,
+            f"RAM preload active ({active_jobs})",
+        )
+
+    def _set_preload_status_icon_style(self, qss: str, tooltip: str) -> None:
+        icon = self.preload_status_icon
+        if icon.styleSheet() != qss:
+            icon.setStyleSheet(qss)
+        if icon.toolTip() != tooltip:
+            icon.setToolTip(tooltip)
 
     def _tick_meter(self) -> None:
         self._tick_deferred_audio_start()
@@ -950,29 +969,26 @@ class PlaybackMixin:
             self._flash_slot_key = None
             self._flash_slot_until = 0.0
             self._refresh_sound_grid()
+        playing_state = ExternalMediaPlayer.PlayingState
         any_playing = (
-            self.player.state() == ExternalMediaPlayer.PlayingState
-            or self.player_b.state() == ExternalMediaPlayer.PlayingState
+            self.player.state() == playing_state
+            or self.player_b.state() == playing_state
+            or any(extra.state() == playing_state for extra in self._multi_players)
         )
-        for extra in self._multi_players:
-            if extra.state() == ExternalMediaPlayer.PlayingState:
-                any_playing = True
         target_left, target_right = get_engine_output_meter_levels()
         target_left = min(1.0, max(0.0, float(target_left)))
         target_right = min(1.0, max(0.0, float(target_right)))
         attack = 0.92
         release = 0.68 if any_playing else 0.45
-        if target_left >= self._vu_levels[0]:
-            self._vu_levels[0] += (target_left - self._vu_levels[0]) * attack
-        else:
-            self._vu_levels[0] += (target_left - self._vu_levels[0]) * release
-        if target_right >= self._vu_levels[1]:
-            self._vu_levels[1] += (target_right - self._vu_levels[1]) * attack
-        else:
-            self._vu_levels[1] += (target_right - self._vu_levels[1]) * release
+        levels = self._vu_levels
+        left, right = levels[0], levels[1]
+        left += (target_left - left) * (attack if target_left >= left else release)
+        right += (target_right - right) * (attack if target_right >= right else release)
+        levels[0] = left
+        levels[1] = right
         self._sync_preload_pause_state(any_playing)
-        self.left_meter.setLevel(self._vu_levels[0])
-        self.right_meter.setLevel(self._vu_levels[1])
+        self.left_meter.setLevel(left)
+        self.right_meter.setLevel(right)
         now = time.monotonic()
         if (now - self._last_meter_aux_refresh_t) >= 0.18:
             self._last_meter_aux_refresh_t = now
@@ -1490,12 +1506,9 @@ class PlaybackMixin:
                 + tr("Drag a sound button with the mouse, drag over Group/Page targets, then drop on a destination button.")
             )
             self.drag_mode_banner.setVisible(True)
-            if self.centralWidget() is not None:
-                self.centralWidget().setStyleSheet("background:#FFF9E8;")
         else:
             self.drag_mode_banner.setVisible(False)
-            if self.centralWidget() is not None:
-                self.centralWidget().setStyleSheet("")
+        self._apply_root_style_sheet(enabled)
 
     def _cue_slot(self, slot: SoundButtonData) -> None:
         for i, cue_slot in enumerate(self.cue_page):
@@ -1,42 +1,135 @@
 from __future__ import annotations
 
+from contextlib import contextmanager
+from functools import lru_cache
+
 from .shared import *
 from .constants import *
 from .helpers import *
 from .widgets import *
 
 
+_STAGE_DISPLAY_KEYS = (
+    "current_time",
+    "alert",
+    "total_time",
+    "elapsed",
+    "remaining",
+    "progress_bar",
+    "song_name",
+    "lyric",
+    "next_song",
+)
+_STAGE_DISPLAY_KEY_SET = frozenset(_STAGE_DISPLAY_KEYS)
+_TRUE_TOKENS = frozenset({"1", "true", "yes", "on"})
+_FALSE_TOKENS = frozenset({"0", "false", "no", "off"})
+_BACKUP_STAMP_FORMAT = "%Y%m%d_%H%M%S"
+_ROTARY_TARGETS = ("group", "page", "sound_button", "jog", "volume")
+_ROTARY_SENSITIVITY_TARGETS = ("group", "page", "sound_button")
+
+
+def _backup_stamp() -> str:
+    return time.strftime(_BACKUP_STAMP_FORMAT, time.localtime())
+
+
+def _write_json_file(file_path: str, payload: dict) -> None:
+    text = json.dumps(payload, indent=2, ensure_ascii=False)
+    with open(file_path, "w", encoding="utf-8") as fh:
+        fh.write(text)
+
+
+def _read_json_file(file_path: str) -> object:
+    with open(file_path, "rb") as fh:
+        return json.loads(fh.read())
+
+
+_PROJECT_ROOT_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", ".."))
+
+
+@lru_cache(maxsize=128)
+def _resolve_asset_file_path(parts: Tuple[str, ...]) -> str:
+    if getattr(sys, "frozen", False):
+        base_dir = os.path.dirname(sys.executable)
+        bundled = os.path.join(base_dir, "pyssp", "assets", *parts)
+        if os.path.exists(bundled):
+            return bundled
+        meipass_dir = getattr(sys, "_MEIPASS", "")
+        if meipass_dir:
+            candidate = os.path.join(meipass_dir, "pyssp", "assets", *parts)
+            if os.path.exists(candidate):
+                return candidate
+        return bundled
+    return os.path.join(_PROJECT_ROOT_PATH, "pyssp", "assets", *parts)
+
+
+@lru_cache(maxsize=1)
+def _resolve_help_index_path() -> str:
+    if getattr(sys, "frozen", False):
+        base_dir = os.path.dirname(sys.executable)
+        bundled = os.path.join(base_dir, "docs", "build", "html", "index.html")
+        if os.path.exists(bundled):
+            return bundled
+        meipass_dir = getattr(sys, "_MEIPASS", "")
+        if meipass_dir:
+            candidate = os.path.join(meipass_dir, "docs", "build", "html", "index.html")
+            if os.path.exists(candidate):
+                return candidate
+        return bundled
+    return os.path.join(_PROJECT_ROOT_PATH, "docs", "build", "html", "index.html")
+
+
+_cached_normalize_midi_binding = lru_cache(maxsize=512)(normalize_midi_binding)
+_HOTKEY_MODIFIER_ALIASES = {
+    "control": "Ctrl",
+    "ctrl": "Ctrl",
+    "shift": "Shift",
+    "alt": "Alt",
+    "meta": "Meta",
+    "win": "Meta",
+    "super": "Meta",
+}
+_MODIFIER_SEQUENCES = {
+    "Shift": QKeySequence(int(Qt.SHIFT)),
+    "Ctrl": QKeySequence(int(Qt.CTRL)),
+    "Alt": QKeySequence(int(Qt.ALT)),
+    "Meta": QKeySequence(int(Qt.META)),
+}
+_MODIFIER_KEY_CODES = {
+    "Shift": int(Qt.Key_Shift),
+    "Ctrl": int(Qt.Key_Control),
+    "Alt": int(Qt.Key_Alt),
+    "Meta": int(Qt.Key_Meta),
+}
+
+
+@lru_cache(maxsize=512)
+def _normalize_hotkey_token(raw: str) -> str:
+    if not raw:
+        return ""
+    alias = _HOTKEY_MODIFIER_ALIASES.get(raw.lower())
+    if alias is not None:
+        return alias
+    normalized = QKeySequence(raw).toString().strip()
+    return normalized or raw
+
+
+def _binding_pair(raw, default_pair: Tuple[str, str]) -> Tuple[str, str]:
+    if not isinstance(raw, (list, tuple)):
+        return (str(default_pair[0]), str(default_pair[1]))
+    v1 = str(raw[0]).strip() if raw else str(default_pair[0])
+    v2 = str(raw[1]).strip() if len(raw) >= 2 else str(default_pair[1])
+    return (v1, v2)
+
+
 class SettingsArchiveMixin:
     def _project_root_path(self) -> str:
-        return os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", ".."))
+        return _PROJECT_ROOT_PATH
 
     def _asset_file_path(self, *parts: str) -> str:
-        if getattr(sys, "frozen", False):
-            base_dir = os.path.dirname(sys.executable)
-            bundled = os.path.join(base_dir, "pyssp", "assets", *parts)
-            if os.path.exists(bundled):
-                return bundled
-            meipass_dir = getattr(sys, "_MEIPASS", "")
-            if meipass_dir:
-                candidate = os.path.join(meipass_dir, "pyssp", "assets", *parts)
-                if os.path.exists(candidate):
-                    return candidate
-            return bundled
-        return os.path.join(self._project_root_path(), "pyssp", "assets", *parts)
+        return _resolve_asset_file_path(parts)
 
     def _help_index_path(self) -> str:
-        if getattr(sys, "frozen", False):
-            base_dir = os.path.dirname(sys.executable)
-            bundled = os.path.join(base_dir, "docs", "build", "html", "index.html")
-            if os.path.exists(bundled):
-                return bundled
-            meipass_dir = getattr(sys, "_MEIPASS", "")
-            if meipass_dir:
-                candidate = os.path.join(meipass_dir, "docs", "build", "html", "index.html")
-                if os.path.exists(candidate):
-                    return candidate
-            return bundled
-        return os.path.join(self._project_root_path(), "docs", "build", "html", "index.html")
+        return _resolve_help_index_path()
 
     def _help_doc_path(self, filename: str) -> str:
         target = str(filename or "").strip() or "index.html"
@@ -47,15 +140,31 @@ class SettingsArchiveMixin:
     def _default_backup_dir(self) -> str:
         return self.settings.last_save_dir or self.settings.last_open_dir or os.path.expanduser("~")
 
+    @contextmanager
+    def _batch_restore(self):
+        self._restore_depth += 1
+        try:
+            yield
+        finally:
+            self._restore_depth -= 1
+            if self._restore_depth == 0 and self._restore_dirty:
+                self._restore_dirty = False
+                self._apply_hotkeys()
+                self._save_settings()
+
+    def _mark_restore_dirty(self) -> None:
+        with self._batch_restore():
+            self._restore_dirty = True
+
     @staticmethod
     def _coerce_bool(value, default: bool = False) -> bool:
-        if isinstance(value, bool):
-            return value
+        if isinstance(value, int):
+            return bool(value)
         if isinstance(value, str):
             token = value.strip().lower()
-            if token in {"1", "true", "yes", "on"}:
+            if token in _TRUE_TOKENS:
                 return True
-            if token in {"0", "false", "no", "off"}:
+            if token in _FALSE_TOKENS:
                 return False
         return bool(value) if value is not None else bool(default)
 
@@ -69,44 +178,21 @@ class SettingsArchiveMixin:
 
     @staticmethod
     def _normalize_stage_display_layout(values: List[str]) -> List[str]:
-        valid = [
-            "current_time",
-            "alert",
-            "total_time",
-            "elapsed",
-            "remaining",
-            "progress_bar",
-            "song_name",
-            "lyric",
-            "next_song",
-        ]
+        seen = set()
         output: List[str] = []
-        for raw in list(values or []):
+        for raw in values or ():
             key = str(raw or "").strip().lower()
-            if key in valid and key not in output:
+            if key in _STAGE_DISPLAY_KEY_SET and key not in seen:
+                seen.add(key)
                 output.append(key)
-        for key in valid:
-            if key not in output:
+        for key in _STAGE_DISPLAY_KEYS:
+            if key not in seen:
                 output.append(key)
         return output
 
     @staticmethod
     def _normalize_stage_display_visibility(values: Dict[str, bool]) -> Dict[str, bool]:
-        valid = [
-            "current_time",
-            "alert",
-            "total_time",
-            "elapsed",
-            "remaining",
-            "progress_bar",
-            "song_name",
-            "lyric",
-            "next_song",
-        ]
-        output: Dict[str, bool] = {}
-        for key in valid:
-            output[key] = bool(values.get(key, True))
-        return output
+        return {key: bool(values.get(key, True)) for key in _STAGE_DISPLAY_KEYS}
 
     def _backup_pyssp_settings(self) -> None:
         self._save_settings()
@@ -117,7 +203,7 @@ class SettingsArchiveMixin:
             except Exception as exc:
                 QMessageBox.critical(self, "Backup pySSP Settings", f"Could not create settings file:\n{exc}")
                 return
-        stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        stamp = _backup_stamp()
         initial_path = os.path.join(self._default_backup_dir(), f"pyssp_settings_backup_{stamp}.ini")
         file_path, _ = QFileDialog.getSaveFileName(
             self,
@@ -130,7 +216,7 @@ class SettingsArchiveMixin:
         if not file_path.lower().endswith(".ini"):
             file_path = f"{file_path}.ini"
         try:
-            shutil.copy2(str(source), file_path)
+            shutil.copyfile(source, file_path)
         except Exception as exc:
             QMessageBox.critical(self, "Backup pySSP Settings", f"Could not backup settings:\n{exc}")
             return
@@ -150,7 +236,7 @@ class SettingsArchiveMixin:
             return
         target = get_settings_path()
         try:
-            shutil.copy2(file_path, str(target))
+            shutil.copyfile(file_path, target)
         except Exception as exc:
             QMessageBox.critical(self, "Restore pySSP Settings", f"Could not restore settings:\n{exc}")
             return
@@ -186,7 +272,7 @@ class SettingsArchiveMixin:
             return
 
         start_dir = self.settings.last_save_dir or self.settings.last_open_dir or os.path.expanduser("~")
-        stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        stamp = _backup_stamp()
         initial_path = os.path.join(start_dir, f"pyssp_audio_library_{stamp}.pyssppak")
         package_path, _ = QFileDialog.getSaveFileName(
             self,
@@ -472,7 +558,7 @@ class SettingsArchiveMixin:
     def _restore_packed_pyssp_settings(self, source_path: str, open_set_path: str = "") -> None:
         target = get_settings_path()
         try:
-            shutil.copy2(source_path, str(target))
+            shutil.copyfile(source_path, target)
             restored_settings = load_settings()
             if open_set_path:
                 restored_settings.last_set_path = open_set_path
@@ -622,7 +708,7 @@ class SettingsArchiveMixin:
             "sound_button_hotkey_priority": str(self.sound_button_hotkey_priority),
             "sound_button_hotkey_go_to_playing": bool(self.sound_button_hotkey_go_to_playing),
         }
-        stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        stamp = _backup_stamp()
         initial_path = os.path.join(self._default_backup_dir(), f"keyboard_hotkeys_backup_{stamp}.json")
         file_path, _ = QFileDialog.getSaveFileName(
             self,
@@ -635,8 +721,7 @@ class SettingsArchiveMixin:
         if not file_path.lower().endswith(".json"):
             file_path = f"{file_path}.json"
         try:
-            with open(file_path, "w", encoding="utf-8") as fh:
-                json.dump(payload, fh, indent=2, ensure_ascii=False)
+            _write_json_file(file_path, payload)
         except Exception as exc:
             QMessageBox.critical(self, "Backup Keyboard Hotkey Bindings", f"Could not write backup file:\n{exc}")
             return
@@ -654,8 +739,7 @@ class SettingsArchiveMixin:
         if not file_path:
             return
         try:
-            with open(file_path, "r", encoding="utf-8") as fh:
-                payload = json.load(fh)
+            payload = _read_json_file(file_path)
         except Exception as exc:
             QMessageBox.critical(self, "Restore Keyboard Hotkey Bindings", f"Could not read backup file:\n{exc}")
             return
@@ -663,14 +747,13 @@ class SettingsArchiveMixin:
             QMessageBox.critical(self, "Restore Keyboard Hotkey Bindings", "Invalid backup format.")
             return
 
-        raw_hotkeys = payload.get("hotkeys", {})
-        next_hotkeys: Dict[str, tuple[str, str]] = {}
-        for key in HOTKEY_DEFAULTS.keys():
-            default_pair = HOTKEY_DEFAULTS.get(key, ("", ""))
-            raw_pair = raw_hotkeys.get(key, default_pair) if isinstance(raw_hotkeys, dict) else default_pair
-            v1 = str(raw_pair[0]).strip() if isinstance(raw_pair, (list, tuple)) and len(raw_pair) >= 1 else str(default_pair[0])
-            v2 = str(raw_pair[1]).strip() if isinstance(raw_pair, (list, tuple)) and len(raw_pair) >= 2 else str(default_pair[1])
-            next_hotkeys[key] = (v1, v2)
+        raw_hotkeys = payload.get("hotkeys")
+        if not isinstance(raw_hotkeys, dict):
+            raw_hotkeys = {}
+        next_hotkeys: Dict[str, tuple[str, str]] = {
+            key: _binding_pair(raw_hotkeys.get(key, default_pair), default_pair)
+            for key, default_pair in HOTKEY_DEFAULTS.items()
+        }
 
         raw_quick = payload.get("quick_action_keys", [])
         next_quick: List[str] = []
@@ -692,8 +775,7 @@ class SettingsArchiveMixin:
         self.sound_button_hotkey_go_to_playing = self._coerce_bool(
             payload.get("sound_button_hotkey_go_to_playing", self.sound_button_hotkey_go_to_playing)
         )
-        self._apply_hotkeys()
-        self._save_settings()
+        self._mark_restore_dirty()
         QMessageBox.information(self, "Restore Keyboard Hotkey Bindings", "Keyboard hotkey bindings restored.")
 
     def _backup_midi_bindings(self) -> None:
@@ -738,7 +820,7 @@ class SettingsArchiveMixin:
             "midi_rotary_volume_step": int(self.midi_rotary_volume_step),
             "midi_rotary_jog_step_ms": int(self.midi_rotary_jog_step_ms),
         }
-        stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        stamp = _backup_stamp()
         initial_path = os.path.join(self._default_backup_dir(), f"midi_bindings_backup_{stamp}.json")
         file_path, _ = QFileDialog.getSaveFileName(
             self,
@@ -751,8 +833,7 @@ class SettingsArchiveMixin:
         if not file_path.lower().endswith(".json"):
             file_path = f"{file_path}.json"
         try:
-            with open(file_path, "w", encoding="utf-8") as fh:
-                json.dump(payload, fh, indent=2, ensure_ascii=False)
+            _write_json_file(file_path, payload)
         except Exception as exc:
             QMessageBox.critical(self, "Backup MIDI Bindings", f"Could not write backup file:\n{exc}")
             return
@@ -770,8 +851,7 @@ class SettingsArchiveMixin:
         if not file_path:
             return
         try:
-            with open(file_path, "r", encoding="utf-8") as fh:
-                payload = json.load(fh)
+            payload = _read_json_file(file_path)
         except Exception as exc:
             QMessageBox.critical(self, "Restore MIDI Bindings", f"Could not read backup file:\n{exc}")
             return
@@ -779,18 +859,18 @@ class SettingsArchiveMixin:
             QMessageBox.critical(self, "Restore MIDI Bindings", "Invalid backup format.")
             return
 
-        raw_hotkeys = payload.get("midi_hotkeys", {})
+        raw_hotkeys = payload.get("midi_hotkeys")
+        if not isinstance(raw_hotkeys, dict):
+            raw_hotkeys = {}
         next_midi_hotkeys: Dict[str, tuple[str, str]] = {}
-        for key in MIDI_HOTKEY_DEFAULTS.keys():
-            raw_pair = raw_hotkeys.get(key, ("", "")) if isinstance(raw_hotkeys, dict) else ("", "")
-            v1 = str(raw_pair[0]).strip() if isinstance(raw_pair, (list, tuple)) and len(raw_pair) >= 1 else ""
-            v2 = str(raw_pair[1]).strip() if isinstance(raw_pair, (list, tuple)) and len(raw_pair) >= 2 else ""
-            next_midi_hotkeys[key] = (normalize_midi_binding(v1), normalize_midi_binding(v2))
+        for key in MIDI_HOTKEY_DEFAULTS:
+            v1, v2 = _binding_pair(raw_hotkeys.get(key), ("", ""))
+            next_midi_hotkeys[key] = (_cached_normalize_midi_binding(v1), _cached_normalize_midi_binding(v2))
 
         raw_midi_quick = payload.get("midi_quick_action_bindings", [])
         next_midi_quick: List[str] = []
         if isinstance(raw_midi_quick, list):
-            next_midi_quick = [normalize_midi_binding(str(v).strip()) for v in raw_midi_quick[:48]]
+            next_midi_quick = [_cached_normalize_midi_binding(str(v).strip()) for v in raw_midi_quick[:48]]
         if len(next_midi_quick) < 48:
             next_midi_quick.extend(["" for _ in range(48 - len(next_midi_quick))])
 
@@ -836,49 +916,21 @@ class SettingsArchiveMixin:
             payload.get("midi_sound_button_hotkey_go_to_playing", self.midi_sound_button_hotkey_go_to_playing)
         )
         self.midi_rotary_enabled = self._coerce_bool(payload.get("midi_rotary_enabled", self.midi_rotary_enabled))
-        self.midi_rotary_group_binding = normalize_midi_binding(str(payload.get("midi_rotary_group_binding", "")))
-        self.midi_rotary_page_binding = normalize_midi_binding(str(payload.get("midi_rotary_page_binding", "")))
-        self.midi_rotary_sound_button_binding = normalize_midi_binding(str(payload.get("midi_rotary_sound_button_binding", "")))
-        self.midi_rotary_jog_binding = normalize_midi_binding(str(payload.get("midi_rotary_jog_binding", "")))
-        self.midi_rotary_volume_binding = normalize_midi_binding(str(payload.get("midi_rotary_volume_binding", "")))
-        self.midi_rotary_group_invert = self._coerce_bool(payload.get("midi_rotary_group_invert", self.midi_rotary_group_invert))
-        self.midi_rotary_page_invert = self._coerce_bool(payload.get("midi_rotary_page_invert", self.midi_rotary_page_invert))
-        self.midi_rotary_sound_button_invert = self._coerce_bool(payload.get("midi_rotary_sound_button_invert", self.midi_rotary_sound_button_invert))
-        self.midi_rotary_jog_invert = self._coerce_bool(payload.get("midi_rotary_jog_invert", self.midi_rotary_jog_invert))
-        self.midi_rotary_volume_invert = self._coerce_bool(payload.get("midi_rotary_volume_invert", self.midi_rotary_volume_invert))
-        self.midi_rotary_group_sensitivity = self._coerce_int(
-            payload.get("midi_rotary_group_sensitivity", self.midi_rotary_group_sensitivity),
-            self.midi_rotary_group_sensitivity,
-            1,
-            20,
-        )
-        self.midi_rotary_page_sensitivity = self._coerce_int(
-            payload.get("midi_rotary_page_sensitivity", self.midi_rotary_page_sensitivity),
-            self.midi_rotary_page_sensitivity,
-            1,
-            20,
-        )
-        self.midi_rotary_sound_button_sensitivity = self._coerce_int(
-            payload.get("midi_rotary_sound_button_sensitivity", self.midi_rotary_sound_button_sensitivity),
-            self.midi_rotary_sound_button_sensitivity,
-            1,
-            20,
-        )
-        self.midi_rotary_group_relative_mode = self._normalize_midi_relative_mode(
-            str(payload.get("midi_rotary_group_relative_mode", self.midi_rotary_group_relative_mode))
-        )
-        self.midi_rotary_page_relative_mode = self._normalize_midi_relative_mode(
-            str(payload.get("midi_rotary_page_relative_mode", self.midi_rotary_page_relative_mode))
-        )
-        self.midi_rotary_sound_button_relative_mode = self._normalize_midi_relative_mode(
-            str(payload.get("midi_rotary_sound_button_relative_mode", self.midi_rotary_sound_button_relative_mode))
-        )
-        self.midi_rotary_jog_relative_mode = self._normalize_midi_relative_mode(
-            str(payload.get("midi_rotary_jog_relative_mode", self.midi_rotary_jog_relative_mode))
-        )
-        self.midi_rotary_volume_relative_mode = self._normalize_midi_relative_mode(
-            str(payload.get("midi_rotary_volume_relative_mode", self.midi_rotary_volume_relative_mode))
-        )
+        for target in _ROTARY_TARGETS:
+            prefix = f"midi_rotary_{target}"
+            setattr(
+                self,
+                f"{prefix}_binding",
+                _cached_normalize_midi_binding(str(payload.get(f"{prefix}_binding", ""))),
+            )
+            name = f"{prefix}_invert"
+            setattr(self, name, self._coerce_bool(payload.get(name, getattr(self, name))))
+            name = f"{prefix}_relative_mode"
+            setattr(self, name, self._normalize_midi_relative_mode(str(payload.get(name, getattr(self, name)))))
+        for target in _ROTARY_SENSITIVITY_TARGETS:
+            name = f"midi_rotary_{target}_sensitivity"
+            current = getattr(self, name)
+            setattr(self, name, self._coerce_int(payload.get(name, current), current, 1, 20))
         mode = str(payload.get("midi_rotary_volume_mode", self.midi_rotary_volume_mode)).strip().lower()
         self.midi_rotary_volume_mode = mode if mode in {"absolute", "relative"} else "relative"
         self.midi_rotary_volume_step = self._coerce_int(
@@ -893,13 +945,13 @@ class SettingsArchiveMixin:
             10,
             5000,
         )
-        self._apply_hotkeys()
         self._apply_launchpad_output_state()
-        self._save_settings()
+        self._mark_restore_dirty()
         QMessageBox.information(self, "Restore MIDI Bindings", "MIDI bindings restored.")
 
     def _normalized_hotkey_pair(self, action_key: str) -> tuple[str, str]:
-        raw1, raw2 = self.hotkeys.get(action_key, HOTKEY_DEFAULTS.get(action_key, ("", "")))
+        pair = self.hotkeys.get(action_key)
+        raw1, raw2 = pair if pair is not None else HOTKEY_DEFAULTS.get(action_key, ("", ""))
         seq1 = self._normalize_hotkey_text(raw1)
         seq2 = self._normalize_hotkey_text(raw2)
         if seq2 == seq1:
@@ -907,145 +959,108 @@ class SettingsArchiveMixin:
         return seq1, seq2
 
     def _normalize_hotkey_text(self, value: str) -> str:
-        raw = str(value or "").strip()
-        if not raw:
-            return ""
-        aliases = {
-            "control": "Ctrl",
-            "ctrl": "Ctrl",
-            "shift": "Shift",
-            "alt": "Alt",
-            "meta": "Meta",
-            "win": "Meta",
-            "super": "Meta",
-        }
-        lower = raw.lower()
-        if lower in aliases:
-            return aliases[lower]
-        normalized = QKeySequence(raw).toString().strip()
-        return normalized or raw
+        return _normalize_hotkey_token(str(value or "").strip())
 
     def _key_sequence_from_hotkey_text(self, value: str) -> Optional[QKeySequence]:
         text = self._normalize_hotkey_text(value)
         if not text:
             return None
-        if text == "Shift":
-            return QKeySequence(int(Qt.SHIFT))
-        if text == "Ctrl":
-            return QKeySequence(int(Qt.CTRL))
-        if text == "Alt":
-            return QKeySequence(int(Qt.ALT))
-        if text == "Meta":
-            return QKeySequence(int(Qt.META))
+        modifier_sequence = _MODIFIER_SEQUENCES.get(text)
+        if modifier_sequence is not None:
+            return modifier_sequence
         return QKeySequence(text)
 
     def _modifier_key_from_hotkey_text(self, value: str) -> Optional[int]:
-        text = self._normalize_hotkey_text(value)
-        if text == "Shift":
-            return int(Qt.Key_Shift)
-        if text == "Ctrl":
-            return int(Qt.Key_Control)
-        if text == "Alt":
-            return int(Qt.Key_Alt)
-        if text == "Meta":
-            return int(Qt.Key_Meta)
-        return None
+        return _MODIFIER_KEY_CODES.get(self._normalize_hotkey_text(value))
 
     def _apply_hotkeys(self) -> None:
+        self._invalidate_sound_binding_caches()
         for key in ["new_set", "open_set", "save_set", "save_set_as", "search", "options"]:
             action = self._menu_actions.get(key)
             if action is None:
                 continue
             h1, h2 = self._normalized_hotkey_pair(key)
-            sequences: List[QKeySequence] = []
-            for text in [h1, h2]:
-                seq = self._key_sequence_from_hotkey_text(text)
-                if seq is not None:
-                    sequences.append(seq)
-            action.setShortcuts(sequences)
-
-        for sc in self._runtime_hotkey_shortcuts:
-            try:
-                sc.activated.disconnect()
-            except Exception:
-                pass
-            sc.setParent(None)
-            sc.deleteLater()
-        self._runtime_hotkey_shortcuts = []
+            action.setShortcuts(
+                [seq for seq in (self._key_sequence_from_hotkey_text(h1), self._key_sequence_from_hotkey_text(h2)) if seq is not None]
+            )
+
         self._modifier_hotkey_handlers = {}
         self._modifier_hotkey_down.clear()
 
         runtime_handlers = self._runtime_action_handlers()
-        ordered_system_keys: List[str] = [k for k in SYSTEM_HOTKEY_ORDER_DEFAULT if k in runtime_handlers]
 
         sound_bindings = self._collect_sound_button_hotkey_bindings() if self.sound_button_hotkey_enabled else {}
+        sound_skip = sound_bindings if self.sound_button_hotkey_priority == "sound_button_first" else {}
         registered_keys: set[str] = set()
+        desired: Dict[Tuple[str, str, object], Callable[[], None]] = {}
 
-        for key in ordered_system_keys:
+        for key in self._ordered_system_keys:
             handler = runtime_handlers[key]
             source_name = "lock_toggle" if key == "lock_toggle" else "system"
             wrapped_handler = (lambda fn=handler, source=source_name: self._run_locked_input(source, fn))
             h1, h2 = self._normalized_hotkey_pair(key)
-            for seq_text in [h1, h2]:
-                key_token = self._normalize_hotkey_text(seq_text)
-                if self.sound_button_hotkey_enabled and self.sound_button_hotkey_priority == "sound_button_first":
-                    if key_token and key_token in sound_bindings:
-                        continue
-                modifier_key = self._modifier_key_from_hotkey_text(seq_text)
+            for key_token in [h1, h2]:
+                if key_token in sound_skip:
+                    continue
+                modifier_key = _MODIFIER_KEY_CODES.get(key_token)
                 if modifier_key is not None:
                     handlers = self._modifier_hotkey_handlers.setdefault(modifier_key, [])
                     if wrapped_handler not in handlers:
                         handlers.append(wrapped_handler)
-                        key_name = self._normalize_hotkey_text(seq_text)
-                        if key_name:
-                            registered_keys.add(key_name)
+                        registered_keys.add(key_token)
                     continue
-                seq = self._key_sequence_from_hotkey_text(seq_text)
-                if seq is None:
+                if not key_token:
                     continue
-                shortcut = QShortcut(seq, self)
-                shortcut.setContext(Qt.ApplicationShortcut)
-                shortcut.activated.connect(wrapped_handler)
-                self._runtime_hotkey_shortcuts.append(shortcut)
-                if key_token:
-                    registered_keys.add(key_token)
+                desired[(key_token, "system", key)] = wrapped_handler
+                registered_keys.add(key_token)
 
         if self.quick_action_enabled:
             for idx, raw in enumerate(self.quick_action_keys[:48]):
                 key_token = self._normalize_hotkey_text(raw)
-                if self.sound_button_hotkey_enabled and self.sound_button_hotkey_priority == "sound_button_first":
-                    if key_token and key_token in sound_bindings:
-                        continue
-                seq = self._key_sequence_from_hotkey_text(raw)
-                if seq is None:
+                if not key_token:
+                    continue
+                if key_token in sound_skip:
                     continue
-                shortcut = QShortcut(seq, self)
-                shortcut.setContext(Qt.ApplicationShortcut)
-                shortcut.activated.connect(
+                desired[(key_token, "quick_action", idx)] = (
                     lambda slot=idx: self._run_locked_input("quick_action", lambda: self._quick_action_trigger(slot))
                 )
-                self._runtime_hotkey_shortcuts.append(shortcut)
-                if key_token:
-                    registered_keys.add(key_token)
+                registered_keys.add(key_token)
 
         if self.sound_button_hotkey_enabled:
             for key_token, slot_key in sound_bindings.items():
                 if self.sound_button_hotkey_priority == "system_first" and key_token in registered_keys:
                     continue
-                seq = self._key_sequence_from_hotkey_text(key_token)
-                if seq is None:
-                    continue
-                shortcut = QShortcut(seq, self)
-                shortcut.setContext(Qt.ApplicationShortcut)
-                shortcut.activated.connect(
+                desired[(key_token, "sound_button", slot_key)] = (
                     lambda sk=slot_key: self._run_locked_input("sound_button", lambda: self._sound_button_hotkey_trigger(sk))
                 )
-                self._runtime_hotkey_shortcuts.append(shortcut)
+
+        shortcuts = self._runtime_hotkey_shortcuts
+        for shortcut_key in [k for k in shortcuts if k not in desired]:
+            sc = shortcuts.pop(shortcut_key)
+            try:
+                sc.activated.disconnect()
+            except Exception:
+                pass
+            sc.setParent(None)
+            sc.deleteLater()
+        for shortcut_key, handler in desired.items():
+            if shortcut_key in shortcuts:
+                continue
+            seq = self._key_sequence_from_hotkey_text(shortcut_key[0])
+            if seq is None:
+                continue
+            shortcut = QShortcut(seq, self)
+            shortcut.setContext(Qt.ApplicationShortcut)
+            shortcut.activated.connect(handler)
+            shortcuts[shortcut_key] = shortcut
         self._apply_midi_bindings()
         self._apply_launchpad_bindings()
         self._sync_lock_ui_state()
 
     def _runtime_action_handlers(self) -> Dict[str, Callable[[], None]]:
+        return self._runtime_action_handlers_cache
+
+    def _build_runtime_action_handlers(self) -> Dict[str, Callable[[], None]]:
         return {
             "play_selected_pause": self._hotkey_play_selected_pause,
             "play_selected": self._hotkey_play_selected,
@@ -1077,19 +1092,32 @@ class SettingsArchiveMixin:
         }
 
     def _normalized_midi_pair(self, action_key: str) -> tuple[str, str]:
-        raw1, raw2 = self.midi_hotkeys.get(action_key, MIDI_HOTKEY_DEFAULTS.get(action_key, ("", "")))
-        return normalize_midi_binding(raw1), normalize_midi_binding(raw2)
+        pair = self.midi_hotkeys.get(action_key)
+        raw1, raw2 = pair if pair is not None else MIDI_HOTKEY_DEFAULTS.get(action_key, ("", ""))
+        return _cached_normalize_midi_binding(raw1), _cached_normalize_midi_binding(raw2)
+
+    def _midi_input_device_names_by_id(self) -> Dict[str, str]:
+        now = time.monotonic()
+        names = self._midi_input_devices_cache
+        if names is None or now - self._midi_input_devices_cache_t > 1.0:
+            names = {str(device_id): str(device_name) for device_id, device_name in list_midi_input_devices()}
+            self._midi_input_devices_cache = names
+            self._midi_input_devices_cache_t = now
+        return names
 
     def _normalize_midi_input_selectors(self, selectors: List[str]) -> List[str]:
         wanted: List[str] = []
         seen: set[str] = set()
-        known_names_by_id = {str(device_id): str(device_name) for device_id, device_name in list_midi_input_devices()}
+        known_names_by_id: Optional[Dict[str, str]] = None
         for raw in selectors:
             token = str(raw or "").strip()
             if not token:
                 continue
-            if token.isdigit() and token in known_names_by_id:
-                token = midi_input_name_selector(known_names_by_id[token])
+            if token.isdigit():
+                if known_names_by_id is None:
+                    known_names_by_id = self._midi_input_device_names_by_id()
+                if token in known_names_by_id:
+                    token = midi_input_name_selector(known_names_by_id[token])
             if token in seen:
                 continue
             seen.add(token)
@@ -1097,44 +1125,56 @@ class SettingsArchiveMixin:
         return wanted
 
     def _apply_midi_bindings(self) -> None:
-        self._midi_action_handlers = {}
-        self._midi_last_trigger_t = {}
         self._sync_midi_polling_state()
         self._refresh_midi_connection_warning(force_refresh=False)
+        if not (
+            self.midi_quick_action_enabled
+            or self.midi_sound_button_hotkey_enabled
+            or any(first or second for first, second in self.midi_hotkeys.values())
+        ):
+            self._midi_action_handlers.clear()
+            self._midi_last_trigger_t.clear()
+            return
         runtime_handlers = self._runtime_action_handlers()
-        ordered_system_keys: List[str] = [k for k in SYSTEM_HOTKEY_ORDER_DEFAULT if k in runtime_handlers]
         sound_bindings = self._collect_sound_button_midi_bindings() if self.midi_sound_button_hotkey_enabled else {}
+        sound_skip = sound_bindings if self.midi_sound_button_hotkey_priority == "sound_button_first" else {}
         registered_tokens: set[str] = set()
+        desired: Dict[str, Callable[[], None]] = {}
 
-        for key in ordered_system_keys:
+        for key in self._ordered_system_keys:
             handler = runtime_handlers[key]
             source_name = "lock_toggle" if key == "lock_toggle" else "midi"
             m1, m2 = self._normalized_midi_pair(key)
             for token in [m1, m2]:
                 if not token:
                     continue
-                if self.midi_sound_button_hotkey_enabled and self.midi_sound_button_hotkey_priority == "sound_button_first":
-                    if token in sound_bindings:
-                        continue
-                self._midi_action_handlers[token] = (lambda fn=handler, source=source_name: self._run_locked_input(source, fn))
+                if token in sound_skip:
+                    continue
+                desired[token] = (lambda fn=handler, source=source_name: self._run_locked_input(source, fn))
                 registered_tokens.add(token)
 
         if self.midi_quick_action_enabled:
             for idx, raw in enumerate(self.midi_quick_action_bindings[:48]):
-                token = normalize_midi_binding(raw)
+                token = _cached_normalize_midi_binding(raw)
                 if not token:
                     continue
-                if self.midi_sound_button_hotkey_enabled and self.midi_sound_button_hotkey_priority == "sound_button_first":
-                    if token in sound_bindings:
-                        continue
-                self._midi_action_handlers[token] = (lambda slot=idx: self._quick_action_trigger(slot))
+                if token in sound_skip:
+                    continue
+                desired[token] = (lambda slot=idx: self._quick_action_trigger(slot))
                 registered_tokens.add(token)
 
         if self.midi_sound_button_hotkey_enabled:
             for token, slot_key in sound_bindings.items():
                 if self.midi_sound_button_hotkey_priority == "system_first" and token in registered_tokens:
                     continue
-                self._midi_action_handlers[token] = (lambda sk=slot_key: self._sound_button_midi_hotkey_trigger(sk))
+                desired[token] = (lambda sk=slot_key: self._sound_button_midi_hotkey_trigger(sk))
+
+        handlers = self._midi_action_handlers
+        handlers.clear()
+        handlers.update(desired)
+        last_trigger_t = self._midi_last_trigger_t
+        for token in [k for k in last_trigger_t if k not in desired]:
+            del last_trigger_t[token]
 
     def _apply_launchpad_bindings(self) -> None:
         self._launchpad_action_handlers = {}
@@ -1149,7 +1189,7 @@ class SettingsArchiveMixin:
         self._sync_midi_polling_state()
         if not selector:
             return
-        runtime_handlers = self._runtime_action_handlers()
+        runtime_handlers = dict(self._runtime_action_handlers())
         runtime_handlers["cue"] = lambda: self._toggle_cue_mode(not bool(self.cue_mode))
         runtime_handlers["vocal_removed"] = lambda: self._toggle_global_vocal_removed_mode(
             not bool(self.play_vocal_removed_tracks)
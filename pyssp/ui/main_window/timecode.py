@@ -1,15 +1,117 @@
 from __future__ import annotations
 
+from functools import lru_cache
+
 from .shared import *
 from .constants import *
 from .helpers import *
 from .widgets import *
 
 
+_TIMECODE_MODES = frozenset(
+    {TIMECODE_MODE_ZERO, TIMECODE_MODE_FOLLOW, TIMECODE_MODE_SYSTEM, TIMECODE_MODE_FOLLOW_FREEZE}
+)
+
+_TIMECODE_STATUS_MODE_TEXT = {
+    (TIMECODE_MODE_ZERO, False): "All Zero",
+    (TIMECODE_MODE_ZERO, True): "All Zero",
+    (TIMECODE_MODE_SYSTEM, False): "System Time",
+    (TIMECODE_MODE_SYSTEM, True): "System Time",
+    (TIMECODE_MODE_FOLLOW_FREEZE, False): "Freeze Timecode (relative to cue set point)",
+    (TIMECODE_MODE_FOLLOW_FREEZE, True): "Freeze Timecode (relative to actual audio file)",
+    (TIMECODE_MODE_FOLLOW, False): "Follow Media/Audio Player (relative to cue set point)",
+    (TIMECODE_MODE_FOLLOW, True): "Follow Media/Audio Player (relative to actual audio file)",
+}
+
+
+@lru_cache(maxsize=64)
+def _timecode_status_text(ltc_enabled: bool, mtc_enabled: bool, mode_text: str, language: str) -> str:
+    enabled = tr("Enabled", language)
+    disabled = tr("Disabled", language)
+    return (
+        f"{tr('LTC: ', language)}{enabled if ltc_enabled else disabled} | "
+        f"{tr('MTC: ', language)}{enabled if mtc_enabled else disabled} | "
+        f"{tr('Timecode: ', language)}{tr(mode_text, language)}"
+    )
+
+
+class _TimecodeFollowState:
+    __slots__ = (
+        "follow_anchor_ms",
+        "follow_anchor_t",
+        "follow_playing",
+        "follow_intent_pending",
+        "follow_frozen_ms",
+        "last_media_ms",
+        "last_media_t",
+    )
+
+    def __init__(self) -> None:
+        self.follow_anchor_ms = 0.0
+        self.follow_anchor_t = time.perf_counter()
+        self.follow_playing = False
+        self.follow_intent_pending = False
+        self.follow_frozen_ms = 0
+        self.last_media_ms = 0.0
+        self.last_media_t = 0.0
+
+
 class TimecodeMixin:
+    @property
+    def timecode_audio_output_device(self) -> str:
+        return self._timecode_audio_output_device
+
+    @timecode_audio_output_device.setter
+    def timecode_audio_output_device(self, value: str) -> None:
+        self._timecode_audio_output_device = value
+        self._timecode_ltc_enabled = str(value or "none").strip().lower() != "none"
+
+    @property
+    def timecode_fps(self) -> float:
+        return self._timecode_fps
+
+    @timecode_fps.setter
+    def timecode_fps(self, value: float) -> None:
+        self._timecode_fps = value
+        self._timecode_nominal_fps = nominal_fps(value)
+
+    @property
+    def timecode_midi_output_device(self) -> str:
+        return self._timecode_midi_output_device
+
+    @timecode_midi_output_device.setter
+    def timecode_midi_output_device(self, value: str) -> None:
+        self._timecode_midi_output_device = value
+        self._timecode_mtc_enabled = str(value or MIDI_OUTPUT_DEVICE_NONE).strip() != MIDI_OUTPUT_DEVICE_NONE
+
+    @property
+    def _mtc_sender(self) -> MtcMidiOutput:
+        sender = self._mtc_sender_instance
+        if sender is None:
+            sender = MtcMidiOutput(lambda: self.timecode_mtc_idle_behavior)
+            self._mtc_sender_instance = sender
+        return sender
+
+    @property
+    def _ltc_sender(self) -> LtcAudioOutput:
+        sender = self._ltc_sender_instance
+        if sender is None:
+            sender = LtcAudioOutput()
+            self._ltc_sender_instance = sender
+        return sender
+
+    def _timecode_senders(self) -> list:
+        return [sender for sender in (self._ltc_sender_instance, self._mtc_sender_instance) if sender is not None]
+
+    def _timecode_senders_resync(self) -> None:
+        for sender in (self._ltc_sender_instance, self._mtc_sender_instance):
+            if sender is not None:
+                sender.request_resync()
+
     def _build_timecode_dock(self) -> None:
         self.timecode_dock = QDockWidget("Timecode", self)
         self.timecode_panel = TimecodePanel(self.timecode_dock)
+        self._timecode_panel_frame_bucket = None
         self.timecode_dock.setWidget(self.timecode_panel)
         self.timecode_dock.setAllowedAreas(Qt.NoDockWidgetArea)
         self.timecode_dock.setFeatures(QDockWidget.DockWidgetClosable | QDockWidget.DockWidgetFloatable)
@@ -19,24 +121,18 @@ class TimecodeMixin:
         self.timecode_dock.visibilityChanged.connect(self._on_timecode_dock_visibility_changed)
         self.timecode_panel.mode_combo.currentIndexChanged.connect(self._on_timecode_mode_changed)
         mode_idx = self.timecode_panel.mode_combo.findData(self.timecode_mode)
-        self.timecode_panel.mode_combo.blockSignals(True)
-        self.timecode_panel.mode_combo.setCurrentIndex(mode_idx if mode_idx >= 0 else 0)
-        self.timecode_panel.mode_combo.blockSignals(False)
+        with QSignalBlocker(self.timecode_panel.mode_combo):
+            self.timecode_panel.mode_combo.setCurrentIndex(mode_idx if mode_idx >= 0 else 0)
         self._refresh_timecode_panel()
 
     def _on_timecode_mode_changed(self, _index: int) -> None:
         if self.timecode_panel is None:
             return
         mode = str(self.timecode_panel.mode_combo.currentData() or TIMECODE_MODE_ZERO)
-        if mode not in {
-            TIMECODE_MODE_ZERO,
-            TIMECODE_MODE_FOLLOW,
-            TIMECODE_MODE_SYSTEM,
-            TIMECODE_MODE_FOLLOW_FREEZE,
-        }:
+        if mode not in _TIMECODE_MODES:
             mode = TIMECODE_MODE_ZERO
         if mode == TIMECODE_MODE_FOLLOW_FREEZE and self.timecode_mode != TIMECODE_MODE_FOLLOW_FREEZE:
-            self._timecode_follow_frozen_ms = self._timecode_current_follow_ms()
+            self._tc.follow_frozen_ms = self._timecode_current_follow_ms()
         self.timecode_mode = mode
         self._refresh_timecode_panel()
         if not self._suspend_settings_save:
@@ -52,13 +148,15 @@ class TimecodeMixin:
 
     def _toggle_timecode_panel(self) -> None:
         if self.timecode_dock is None:
+            self.show_timecode_panel = True
+            self._build_timecode_dock()
+            if not self._suspend_settings_save:
+                self._save_settings()
             return
         self.timecode_dock.setVisible(not self.timecode_dock.isVisible())
 
     def _is_timecode_output_enabled(self) -> bool:
-        ltc_enabled = str(self.timecode_audio_output_device or "none").strip().lower() != "none"
-        mtc_enabled = str(self.timecode_midi_output_device or MIDI_OUTPUT_DEVICE_NONE).strip() != MIDI_OUTPUT_DEVICE_NONE
-        return ltc_enabled or mtc_enabled
+        return self._timecode_ltc_enabled or self._timecode_mtc_enabled
 
     def _update_timecode_multiplay_warning_banner(self) -> None:
         show_warning = self._is_multi_play_enabled() and self._is_timecode_output_enabled()
@@ -109,17 +207,19 @@ class TimecodeMixin:
             return
         self.info_notice_banner.setVisible(False)
 
-    def _timecode_current_follow_ms(self) -> int:
+    def _timecode_current_follow_ms(self, now: Optional[float] = None) -> int:
+        tc = self._tc
+        if now is None:
+            now = time.perf_counter()
         reference_player, reference_key = self._timecode_reference_context()
         if reference_player is None:
-            self._timecode_follow_anchor_ms = 0.0
-            self._timecode_follow_anchor_t = time.perf_counter()
-            self._timecode_follow_playing = False
-            self._timecode_follow_intent_pending = False
+            tc.follow_anchor_ms = 0.0
+            tc.follow_anchor_t = now
+            tc.follow_playing = False
+            tc.follow_intent_pending = False
             return 0
         is_playing = reference_player.state() == ExternalMediaPlayer.PlayingState
-        now = time.perf_counter()
-        predicted_ms = self._timecode_follow_anchor_ms + max(0.0, (now - self._timecode_follow_anchor_t) * 1000.0)
+        predicted_ms = tc.follow_anchor_ms + max(0.0, (now - tc.follow_anchor_t) * 1000.0)
         try:
             absolute_ms = max(0, int(reference_player.enginePositionMs()))
         except Exception:
@@ -129,22 +229,22 @@ class TimecodeMixin:
                 absolute_ms = 0
         media_ms = float(self._timecode_display_ms_from_absolute(absolute_ms, slot_key=reference_key))
         if not is_playing:
-            if self._timecode_follow_intent_pending and self._timecode_follow_playing:
-                self._timecode_follow_anchor_ms = predicted_ms
-                self._timecode_follow_anchor_t = now
+            if tc.follow_intent_pending and tc.follow_playing:
+                tc.follow_anchor_ms = predicted_ms
+                tc.follow_anchor_t = now
                 return int(max(0.0, predicted_ms))
-            self._timecode_follow_anchor_ms = media_ms
-            self._timecode_follow_anchor_t = now
-            self._timecode_follow_playing = False
+            tc.follow_anchor_ms = media_ms
+            tc.follow_anchor_t = now
+            tc.follow_playing = False
             return int(media_ms)
 
-        self._timecode_follow_anchor_ms = media_ms
-        self._timecode_follow_anchor_t = now
-        self._timecode_follow_playing = True
-        self._timecode_follow_intent_pending = False
-        self._timecode_last_media_ms = media_ms
-        self._timecode_last_media_t = now
-        return int(max(0.0, self._timecode_follow_anchor_ms))
+        tc.follow_anchor_ms = media_ms
+        tc.follow_anchor_t = now
+        tc.follow_playing = True
+        tc.follow_intent_pending = False
+        tc.last_media_ms = media_ms
+        tc.last_media_t = now
+        return int(max(0.0, media_ms))
 
     def _timecode_reference_context(self) -> Tuple[Optional[ExternalMediaPlayer], Optional[Tuple[str, int, int]]]:
         active_players = self._all_active_players()
@@ -173,7 +273,10 @@ class TimecodeMixin:
         absolute_ms: int,
         slot_key: Optional[Tuple[str, int, int]] = None,
     ) -> int:
-        absolute = max(0, int(absolute_ms))
+        if type(absolute_ms) is int:
+            absolute = absolute_ms if absolute_ms > 0 else 0
+        else:
+            absolute = max(0, int(absolute_ms))
         slot: Optional[SoundButtonData] = None
         effective_slot_key = slot_key if slot_key is not None else self.current_playing
         if effective_slot_key is not None:
@@ -182,13 +285,14 @@ class TimecodeMixin:
         if slot is not None:
             timeline_mode = self._effective_slot_timecode_timeline_mode(slot)
         if timeline_mode == "cue_region" and slot is not None:
-            cue_start = 0 if slot.cue_start_ms is None else max(0, int(slot.cue_start_ms))
-            absolute = max(0, absolute - cue_start)
+            cue_start = slot.cue_start_ms
+            if cue_start is not None and cue_start > 0:
+                absolute = absolute - int(cue_start) if absolute > cue_start else 0
         if slot is not None and self.soundbutton_timecode_offset_enabled:
             offset_ms = slot.timecode_offset_ms
-            if offset_ms is not None and int(offset_ms) > 0:
+            if offset_ms is not None and offset_ms > 0:
                 absolute += int(offset_ms)
-        return max(0, absolute)
+        return absolute
 
     def _effective_slot_timecode_timeline_mode(self, slot: SoundButtonData) -> str:
         mode = self.timecode_timeline_mode
@@ -199,22 +303,36 @@ class TimecodeMixin:
             return slot_mode
         return mode
 
-    def _timecode_output_ms(self) -> int:
-        if self.timecode_mode == TIMECODE_MODE_ZERO:
-            return 0
-        if self.timecode_mode == TIMECODE_MODE_SYSTEM:
-            now = datetime.now()
-            return (
-                ((now.hour * 3600 + now.minute * 60 + now.second) * 1000)
-                + int(now.microsecond / 1000)
-            )
-        if self.timecode_mode == TIMECODE_MODE_FOLLOW_FREEZE:
-            return max(0, int(self._timecode_follow_frozen_ms))
+    def _timecode_zero_output_ms(self, now: Optional[float] = None) -> int:
+        return 0
+
+    def _timecode_system_output_ms(self, now: Optional[float] = None) -> int:
+        wall = datetime.now()
+        return (
+            ((wall.hour * 3600 + wall.minute * 60 + wall.second) * 1000)
+            + int(wall.microsecond / 1000)
+        )
+
+    def _timecode_frozen_output_ms(self, now: Optional[float] = None) -> int:
+        return max(0, int(self._tc.follow_frozen_ms))
+
+    def _timecode_follow_output_ms(self, now: Optional[float] = None) -> int:
         # In follow mode, once playback is fully stopped/ended, reset timecode to zero
         # instead of re-deriving from residual player position without slot offset context.
         if not self._is_playback_in_progress():
             return 0
-        return self._timecode_current_follow_ms()
+        return self._timecode_current_follow_ms(now)
+
+    _TIMECODE_OUTPUT_HANDLERS = {
+        TIMECODE_MODE_ZERO: _timecode_zero_output_ms,
+        TIMECODE_MODE_SYSTEM: _timecode_system_output_ms,
+        TIMECODE_MODE_FOLLOW_FREEZE: _timecode_frozen_output_ms,
+        TIMECODE_MODE_FOLLOW: _timecode_follow_output_ms,
+    }
+
+    def _timecode_output_ms(self, now: Optional[float] = None) -> int:
+        handler = self._TIMECODE_OUTPUT_HANDLERS.get(self.timecode_mode, TimecodeMixin._timecode_follow_output_ms)
+        return handler(self, now)
 
     def _timecode_device_text(self) -> str:
         ltc_format = (
@@ -223,7 +341,12 @@ class TimecodeMixin:
         )
         midi_text = "MIDI: Disabled"
         if self.timecode_midi_output_device != MIDI_OUTPUT_DEVICE_NONE:
-            midi_map = {device_id: name for device_id, name in list_midi_output_devices()}
+            now = time.monotonic()
+            midi_map = self._midi_output_devices_cache
+            if midi_map is None or now - self._midi_output_devices_cache_t > 5.0:
+                midi_map = dict(list_midi_output_devices())
+                self._midi_output_devices_cache = midi_map
+                self._midi_output_devices_cache_t = now
             midi_name = midi_map.get(self.timecode_midi_output_device, "Unavailable")
             midi_text = f"MIDI: {midi_name}"
         if self.timecode_audio_output_device == "follow_playback":
@@ -234,7 +357,7 @@ class TimecodeMixin:
             return f"Output Device: System default ({ltc_format}) | {midi_text}"
         return f"Output Device: {self.timecode_audio_output_device} ({ltc_format}) | {midi_text}"
 
-    def _tick_timecode_mtc(self) -> None:
+    def _on_timecode_audio_device_changed(self) -> None:
         ltc_device: Optional[str]
         if self.timecode_audio_output_device == "none":
             ltc_device = None
@@ -245,24 +368,48 @@ class TimecodeMixin:
             ltc_device = ""
         else:
             ltc_device = str(self.timecode_audio_output_device).strip()
-        self._ltc_sender.set_output(
+        self._ltc_device_resolved = ltc_device
+
+    def _tick_timecode_mtc(self) -> None:
+        ltc_device = self._ltc_device_resolved
+        midi_device = self.timecode_midi_output_device
+        mtc_enabled = self._timecode_mtc_enabled
+        ltc_sender = self._ltc_sender_instance
+        if ltc_sender is None and ltc_device is not None:
+            ltc_sender = self._ltc_sender
+        mtc_sender = self._mtc_sender_instance
+        if mtc_sender is None and mtc_enabled:
+            mtc_sender = self._mtc_sender
+        if ltc_sender is None and mtc_sender is None:
+            return
+        fps = max(1.0, float(self.timecode_fps))
+        config = (
             ltc_device,
             int(self.timecode_sample_rate),
             int(self.timecode_bit_depth),
             float(self.timecode_fps),
+            midi_device,
+            ltc_sender is not None,
+            mtc_sender is not None,
         )
-        self._mtc_sender.set_device(self.timecode_midi_output_device)
-        output_ms = self._timecode_output_ms()
-        current_frame = int((max(0, output_ms) / 1000.0) * max(1.0, float(self.timecode_fps)))
-        self._ltc_sender.update(
-            current_frame=current_frame,
-            fps=max(1.0, float(self.timecode_fps)),
-        )
-        self._mtc_sender.update(
-            current_frame=current_frame,
-            source_fps=max(1.0, float(self.timecode_fps)),
-            mtc_fps=max(1.0, float(self.timecode_mtc_fps)),
-        )
+        if config != self._timecode_output_config:
+            self._timecode_output_config = config
+            if ltc_sender is not None:
+                ltc_sender.set_output(ltc_device, config[1], config[2], config[3])
+            if mtc_sender is not None:
+                mtc_sender.set_device(midi_device)
+        if ltc_device is None and not mtc_enabled:
+            return
+        output_ms = self._timecode_output_ms(time.perf_counter())
+        current_frame = int((max(0, output_ms) / 1000.0) * fps)
+        if ltc_sender is not None and ltc_device is not None:
+            ltc_sender.update(current_frame=current_frame, fps=fps)
+        if mtc_sender is not None and mtc_enabled:
+            mtc_sender.update(
+                current_frame=current_frame,
+                source_fps=fps,
+                mtc_fps=max(1.0, float(self.timecode_mtc_fps)),
+            )
 
     def _timecode_on_playback_start(self, slot: Optional[SoundButtonData] = None) -> None:
         now = time.perf_counter()
@@ -273,90 +420,91 @@ class TimecodeMixin:
             duration_guess = max(0, int(slot.duration_ms))
             start_abs = self._cue_start_for_playback(slot, duration_guess)
         start_display = float(self._timecode_display_ms_from_absolute(start_abs))
-        self._timecode_follow_anchor_ms = start_display
-        self._timecode_follow_anchor_t = now
-        self._timecode_follow_playing = True
-        self._timecode_follow_intent_pending = True
-        self._timecode_last_media_ms = start_display
-        self._timecode_last_media_t = now
-        print(
-            f"[TCDBG] {now:.6f} timecode_start anchor_ms={start_display:.1f} "
-            f"slot={(slot.title if slot else '<none>')}"
-        )
-        self._ltc_sender.request_resync()
-        self._mtc_sender.request_resync()
+        self._tc.follow_anchor_ms = start_display
+        self._tc.follow_anchor_t = now
+        self._tc.follow_playing = True
+        self._tc.follow_intent_pending = True
+        self._tc.last_media_ms = start_display
+        self._tc.last_media_t = now
+        if _TCDBG_ENABLED:
+            _tcdbg(
+                f"{now:.6f} timecode_start anchor_ms={start_display:.1f} "
+                f"slot={(slot.title if slot else '<none>')}"
+            )
+        self._timecode_senders_resync()
 
     def _timecode_on_playback_stop(self) -> None:
         now = time.perf_counter()
         if now < self._timecode_event_guard_until:
             return
-        self._timecode_follow_anchor_ms = 0.0
-        self._timecode_follow_anchor_t = now
-        self._timecode_follow_playing = False
-        self._timecode_follow_intent_pending = False
-        self._timecode_last_media_ms = 0.0
-        self._timecode_last_media_t = now
-        print(f"[TCDBG] {now:.6f} timecode_stop")
-        self._ltc_sender.request_resync()
-        self._mtc_sender.request_resync()
+        self._tc.follow_anchor_ms = 0.0
+        self._tc.follow_anchor_t = now
+        self._tc.follow_playing = False
+        self._tc.follow_intent_pending = False
+        self._tc.last_media_ms = 0.0
+        self._tc.last_media_t = now
+        if _TCDBG_ENABLED:
+            _tcdbg(f"{now:.6f} timecode_stop")
+        self._timecode_senders_resync()
 
     def _timecode_on_playback_pause(self) -> None:
-        if time.perf_counter() < self._timecode_event_guard_until:
+        now = time.perf_counter()
+        if now < self._timecode_event_guard_until:
             return
-        paused_ms = float(self._timecode_current_follow_ms())
-        self._timecode_follow_anchor_ms = paused_ms
-        self._timecode_follow_anchor_t = time.perf_counter()
-        self._timecode_follow_playing = False
-        self._timecode_follow_intent_pending = False
-        self._ltc_sender.request_resync()
-        self._mtc_sender.request_resync()
+        paused_ms = float(self._timecode_current_follow_ms(now))
+        self._tc.follow_anchor_ms = paused_ms
+        self._tc.follow_anchor_t = now
+        self._tc.follow_playing = False
+        self._tc.follow_intent_pending = False
+        self._timecode_senders_resync()
 
     def _timecode_on_playback_resume(self) -> None:
-        if time.perf_counter() < self._timecode_event_guard_until:
+        now = time.perf_counter()
+        if now < self._timecode_event_guard_until:
             return
-        resume_ms = float(self._timecode_current_follow_ms())
-        self._timecode_follow_anchor_ms = resume_ms
-        self._timecode_follow_anchor_t = time.perf_counter()
-        self._timecode_follow_playing = True
-        self._timecode_follow_intent_pending = False
-        self._ltc_sender.request_resync()
-        self._mtc_sender.request_resync()
+        resume_ms = float(self._timecode_current_follow_ms(now))
+        self._tc.follow_anchor_ms = resume_ms
+        self._tc.follow_anchor_t = now
+        self._tc.follow_playing = True
+        self._tc.follow_intent_pending = False
+        self._timecode_senders_resync()
 
     def _refresh_timecode_panel(self) -> None:
+        if self._timecode_panel_refresh_pending:
+            return
+        self._timecode_panel_refresh_pending = True
+        QTimer.singleShot(0, self._run_pending_timecode_panel_refresh)
+
+    def _run_pending_timecode_panel_refresh(self) -> None:
+        self._timecode_panel_refresh_pending = False
+        self._refresh_timecode_panel_now()
+
+    def _refresh_timecode_panel_now(self) -> None:
         self._update_timecode_status_label()
         if self.timecode_panel is None:
             return
         mode_idx = self.timecode_panel.mode_combo.findData(self.timecode_mode)
         if mode_idx >= 0 and mode_idx != self.timecode_panel.mode_combo.currentIndex():
-            self.timecode_panel.mode_combo.blockSignals(True)
-            self.timecode_panel.mode_combo.setCurrentIndex(mode_idx)
-            self.timecode_panel.mode_combo.blockSignals(False)
+            with QSignalBlocker(self.timecode_panel.mode_combo):
+                self.timecode_panel.mode_combo.setCurrentIndex(mode_idx)
         output_ms = self._timecode_output_ms()
-        self.timecode_panel.timecode_label.setText(
-            ms_to_timecode_string(output_ms, nominal_fps(self.timecode_fps))
-        )
-        self.timecode_panel.device_label.setText(self._timecode_device_text())
+        fps = self._timecode_nominal_fps
+        frame_bucket = (fps, int((max(0, output_ms) / 1000.0) * fps))
+        if frame_bucket != self._timecode_panel_frame_bucket:
+            self._timecode_panel_frame_bucket = frame_bucket
+            self.timecode_panel.timecode_label.setText(ms_to_timecode_string(output_ms, fps))
+        device_text = self._timecode_device_text()
+        if device_text != self.timecode_panel.device_label.text():
+            self.timecode_panel.device_label.setText(device_text)
 
     def _update_timecode_status_label(self) -> None:
-        ltc_enabled = str(self.timecode_audio_output_device or "none").strip().lower() != "none"
-        mtc_enabled = str(self.timecode_midi_output_device or MIDI_OUTPUT_DEVICE_NONE).strip() != MIDI_OUTPUT_DEVICE_NONE
-        if self.timecode_mode == TIMECODE_MODE_ZERO:
-            mode_text = "All Zero"
-        elif self.timecode_mode == TIMECODE_MODE_SYSTEM:
-            mode_text = "System Time"
-        elif self.timecode_mode == TIMECODE_MODE_FOLLOW_FREEZE:
-            if self.timecode_timeline_mode == "audio_file":
-                mode_text = "Freeze Timecode (relative to actual audio file)"
-            else:
-                mode_text = "Freeze Timecode (relative to cue set point)"
-        else:
-            if self.timecode_timeline_mode == "audio_file":
-                mode_text = "Follow Media/Audio Player (relative to actual audio file)"
-            else:
-                mode_text = "Follow Media/Audio Player (relative to cue set point)"
-        self.timecode_status_label.setText(
-            f"{tr('LTC: ')}{tr('Enabled') if ltc_enabled else tr('Disabled')} | "
-            f"{tr('MTC: ')}{tr('Enabled') if mtc_enabled else tr('Disabled')} | "
-            f"{tr('Timecode: ')}{tr(mode_text)}"
+        ltc_enabled = self._timecode_ltc_enabled
+        mtc_enabled = self._timecode_mtc_enabled
+        audio_file = self.timecode_timeline_mode == "audio_file"
+        mode_text = _TIMECODE_STATUS_MODE_TEXT.get(
+            (self.timecode_mode, audio_file), _TIMECODE_STATUS_MODE_TEXT[(TIMECODE_MODE_FOLLOW, audio_file)]
         )
+        text = _timecode_status_text(ltc_enabled, mtc_enabled, mode_text, self.ui_language)
+        if self.timecode_status_label.text() != text:
+            self.timecode_status_label.setText(text)
 
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from functools import lru_cache
+
 from .shared import *
 from .constants import *
 from .helpers import *
@@ -16,6 +18,30 @@ from pyssp.launchpad import (
     normalize_launchpad_layout,
 )
 
+_CSV_BASIC_COLUMNS = ("location", "slot", "title", "file_path")
+_CSV_VERIFY_COLUMNS = _CSV_BASIC_COLUMNS + ("cause",)
+_CSV_HOTKEY_COLUMNS = ("location", "slot", "sound_hotkey", "title", "file_path")
+_CSV_MIDI_COLUMNS = ("location", "slot", "sound_midi_hotkey", "title", "file_path")
+_EXPORT_HEADER_BASIC = ("Page", "Button Number", "Sound Button Name", "File Path")
+_EXPORT_HEADER_VERIFY = _EXPORT_HEADER_BASIC + ("Cause",)
+_EXPORT_HEADER_HOTKEY = ("Page", "Button Number", "Sound Hotkey", "Sound Button Name", "File Path")
+_EXPORT_HEADER_MIDI = ("Page", "Button Number", "Sound MIDI Mapping", "Sound Button Name", "File Path")
+_CSV_NEWLINE_TRANS = str.maketrans({"\r": " ", "\n": " "})
+_CSV_WRITE_BUFFER_BYTES = 1 << 20
+
+
+def _csv_text(value) -> str:
+    return str(value).translate(_CSV_NEWLINE_TRANS)
+
+
+@lru_cache(maxsize=4096)
+def _path_identity_key(file_path: str) -> str:
+    return os.path.normcase(os.path.abspath(file_path))
+
+
+def _csv_row(match: dict, columns: Tuple[str, ...]) -> List[str]:
+    return [str(int(match["slot"]) + 1) if col == "slot" else _csv_text(match.get(col, "")) for col in columns]
+
 
 class ToolsLibraryMixin:
     _LAUNCHPAD_CHEATSHEET_ACTION_LABELS = {
@@ -277,40 +303,39 @@ class ToolsLibraryMixin:
             return f"{group}{page_index + 1} ({page_name})"
         return f"{group}{page_index + 1}"
 
-    def _iter_all_sound_button_entries(self, include_cue: bool = True) -> List[dict]:
-        entries: List[dict] = []
+    def _iter_all_sound_button_entries(self, include_cue: bool = True) -> Iterator[dict]:
+        data = self.data
+        page_display_name = self._page_display_name
+        splitext = os.path.splitext
+        basename = os.path.basename
         for group in GROUPS:
             for page_index in range(PAGE_COUNT):
-                for slot_index, slot in enumerate(self.data[group][page_index]):
+                location = None
+                for slot_index, slot in enumerate(data[group][page_index]):
                     if not slot.assigned or slot.marker:
                         continue
-                    title = slot.title.strip() or os.path.splitext(os.path.basename(slot.file_path))[0]
-                    entries.append(
-                        {
-                            "group": group,
-                            "page": page_index,
-                            "slot": slot_index,
-                            "title": title,
-                            "file_path": slot.file_path,
-                            "location": self._page_display_name(group, page_index),
-                        }
-                    )
+                    if location is None:
+                        location = page_display_name(group, page_index)
+                    yield {
+                        "group": group,
+                        "page": page_index,
+                        "slot": slot_index,
+                        "title": slot.title.strip() or splitext(basename(slot.file_path))[0],
+                        "file_path": slot.file_path,
+                        "location": location,
+                    }
         if include_cue:
             for slot_index, slot in enumerate(self.cue_page):
                 if not slot.assigned or slot.marker:
                     continue
-                title = slot.title.strip() or os.path.splitext(os.path.basename(slot.file_path))[0]
-                entries.append(
-                    {
-                        "group": "Q",
-                        "page": 0,
-                        "slot": slot_index,
-                        "title": title,
-                        "file_path": slot.file_path,
-                        "location": "Cue Page",
-                    }
-                )
-        return entries
+                yield {
+                    "group": "Q",
+                    "page": 0,
+                    "slot": slot_index,
+                    "title": slot.title.strip() or splitext(basename(slot.file_path))[0],
+                    "file_path": slot.file_path,
+                    "location": "Cue Page",
+                }
 
     def _iter_all_sound_button_slot_refs(self, include_cue: bool = True) -> List[dict]:
         refs: List[dict] = []
@@ -460,6 +485,19 @@ class ToolsLibraryMixin:
         )
 
     def _tool_export_matches(self, key: str, export_format: str, base_name: str) -> None:
+        if key == "verify_sound_buttons":
+            self._tool_export_generic(key, export_format, base_name, _EXPORT_HEADER_VERIFY, _CSV_VERIFY_COLUMNS)
+        else:
+            self._tool_export_generic(key, export_format, base_name, _EXPORT_HEADER_BASIC, _CSV_BASIC_COLUMNS)
+
+    def _tool_export_generic(
+        self,
+        key: str,
+        export_format: str,
+        base_name: str,
+        header: Tuple[str, ...],
+        columns: Tuple[str, ...],
+    ) -> None:
         matches = self._tool_window_matches.get(key, [])
         if not matches:
             QMessageBox.information(self, "Export", "No rows to export.")
@@ -474,11 +512,8 @@ class ToolsLibraryMixin:
             return
         if not file_path.lower().endswith(ext):
             file_path = f"{file_path}{ext}"
-        header = "Page,Button Number,Sound Button Name,File Path"
-        if key == "verify_sound_buttons":
-            header = "Page,Button Number,Sound Button Name,File Path,Cause"
         try:
-            self._write_csv_rows(file_path, header, matches)
+            self._write_csv_rows(file_path, header, matches, columns)
         except Exception as exc:
             QMessageBox.critical(self, "Export Failed", f"Could not export file:\n{exc}")
             return
@@ -507,114 +542,23 @@ class ToolsLibraryMixin:
             lines = ["(no items)"]
         self._print_lines(title, lines)
 
-    def _write_csv_rows(self, file_path: str, header: str, matches: List[dict]) -> None:
-        def _csv_cell(value: str) -> str:
-            cell = (value or "").replace("\r", " ").replace("\n", " ")
-            cell = cell.replace('"', '""')
-            return f'"{cell}"'
-
-        include_cause = "Cause" in header
-        lines = [header]
-        for match in matches:
-            row = [
-                _csv_cell(str(match["location"])),
-                _csv_cell(str(int(match["slot"]) + 1)),
-                _csv_cell(str(match["title"])),
-                _csv_cell(str(match["file_path"])),
-            ]
-            if include_cause:
-                row.append(_csv_cell(str(match.get("cause", ""))))
-            lines.append(",".join(row))
-        with open(file_path, "w", encoding="utf-8-sig", newline="") as fh:
-            fh.write("\r\n".join(lines))
+    def _write_csv_rows(
+        self,
+        file_path: str,
+        header: Tuple[str, ...],
+        matches: Iterable[dict],
+        columns: Tuple[str, ...] = _CSV_BASIC_COLUMNS,
+    ) -> None:
+        with open(file_path, "w", encoding="utf-8-sig", newline="", buffering=_CSV_WRITE_BUFFER_BYTES) as fh:
+            fh.write(",".join(header) + "\r\n")
+            writer = csv.writer(fh, quoting=csv.QUOTE_ALL, lineterminator="\r\n")
+            writer.writerows(_csv_row(match, columns) for match in matches)
 
     def _tool_export_sound_hotkey_matches(self, key: str, export_format: str, base_name: str) -> None:
-        matches = self._tool_window_matches.get(key, [])
-        if not matches:
-            QMessageBox.information(self, "Export", "No rows to export.")
-            return
-        export_format = "excel" if export_format == "excel" else "csv"
-        ext = ".xls" if export_format == "excel" else ".csv"
-        start_dir = self.settings.last_save_dir or self.settings.last_open_dir or self._sports_sounds_pro_folder()
-        initial_path = os.path.join(start_dir, f"{base_name}{ext}")
-        file_filter = "Excel (*.xls)" if export_format == "excel" else "CSV (*.csv)"
-        file_path, _ = QFileDialog.getSaveFileName(self, "Export", initial_path, f"{file_filter};;All Files (*.*)")
-        if not file_path:
-            return
-        if not file_path.lower().endswith(ext):
-            file_path = f"{file_path}{ext}"
-
-        def _csv_cell(value: str) -> str:
-            cell = (value or "").replace("\r", " ").replace("\n", " ")
-            cell = cell.replace('"', '""')
-            return f'"{cell}"'
-
-        lines = ["Page,Button Number,Sound Hotkey,Sound Button Name,File Path"]
-        for match in matches:
-            lines.append(
-                ",".join(
-                    [
-                        _csv_cell(str(match["location"])),
-                        _csv_cell(str(int(match["slot"]) + 1)),
-                        _csv_cell(str(match["sound_hotkey"])),
-                        _csv_cell(str(match["title"])),
-                        _csv_cell(str(match["file_path"])),
-                    ]
-                )
-            )
-        try:
-            with open(file_path, "w", encoding="utf-8-sig", newline="") as fh:
-                fh.write("\r\n".join(lines))
-        except Exception as exc:
-            QMessageBox.critical(self, "Export Failed", f"Could not export file:\n{exc}")
-            return
-        self.settings.last_save_dir = os.path.dirname(file_path)
-        self._save_settings()
-        QMessageBox.information(self, "Export Complete", f"Exported:\n{file_path}")
+        self._tool_export_generic(key, export_format, base_name, _EXPORT_HEADER_HOTKEY, _CSV_HOTKEY_COLUMNS)
 
     def _tool_export_sound_midi_matches(self, key: str, export_format: str, base_name: str) -> None:
-        matches = self._tool_window_matches.get(key, [])
-        if not matches:
-            QMessageBox.information(self, "Export", "No rows to export.")
-            return
-        export_format = "excel" if export_format == "excel" else "csv"
-        ext = ".xls" if export_format == "excel" else ".csv"
-        start_dir = self.settings.last_save_dir or self.settings.last_open_dir or self._sports_sounds_pro_folder()
-        initial_path = os.path.join(start_dir, f"{base_name}{ext}")
-        file_filter = "Excel (*.xls)" if export_format == "excel" else "CSV (*.csv)"
-        file_path, _ = QFileDialog.getSaveFileName(self, "Export", initial_path, f"{file_filter};;All Files (*.*)")
-        if not file_path:
-            return
-        if not file_path.lower().endswith(ext):
-            file_path = f"{file_path}{ext}"
-
-        def _csv_cell(value: str) -> str:
-            cell = (value or "").replace("\r", " ").replace("\n", " ")
-            cell = cell.replace('"', '""')
-            return f'"{cell}"'
-
-        lines = ["Page,Button Number,Sound MIDI Mapping,Sound Button Name,File Path"]
-        for match in matches:
-            lines.append(
-                ",".join(
-                    [
-                        _csv_cell(str(match["location"])),
-                        _csv_cell(str(int(match["slot"]) + 1)),
-                        _csv_cell(str(match["sound_midi_hotkey"])),
-                        _csv_cell(str(match["title"])),
-                        _csv_cell(str(match["file_path"])),
-                    ]
-                )
-            )
-        try:
-            with open(file_path, "w", encoding="utf-8-sig", newline="") as fh:
-                fh.write("\r\n".join(lines))
-        except Exception as exc:
-            QMessageBox.critical(self, "Export Failed", f"Could not export file:\n{exc}")
-            return
-        self.settings.last_save_dir = os.path.dirname(file_path)
-        self._save_settings()
-        QMessageBox.information(self, "Export Complete", f"Exported:\n{file_path}")
+        self._tool_export_generic(key, export_format, base_name, _EXPORT_HEADER_MIDI, _CSV_MIDI_COLUMNS)
 
     def _run_duplicate_check(self) -> None:
         entries = self._iter_all_sound_button_entries(include_cue=True)
@@ -623,8 +567,7 @@ class ToolsLibraryMixin:
             file_path = str(entry["file_path"]).strip()
             if not file_path:
                 continue
-            key = os.path.normcase(os.path.abspath(file_path))
-            by_path.setdefault(key, []).append(entry)
+            by_path.setdefault(_path_identity_key(file_path), []).append(entry)
 
         duplicate_groups = [group for group in by_path.values() if len(group) > 1]
         duplicate_groups.sort(key=lambda group: str(group[0]["file_path"]).casefold())
@@ -662,6 +605,19 @@ class ToolsLibraryMixin:
         matches: List[dict] = []
         diagnostics_cache: Dict[str, Optional[str]] = {}
         entries: List[Tuple[str, int, int, SoundButtonData, str]] = []
+        dir_listings: Dict[str, frozenset] = {}
+
+        def path_exists(path: str) -> bool:
+            directory, name = os.path.split(path)
+            listing = dir_listings.get(directory)
+            if listing is None:
+                try:
+                    with os.scandir(directory or ".") as it:
+                        listing = frozenset(entry.name for entry in it if not entry.is_symlink())
+                except OSError:
+                    listing = frozenset()
+                dir_listings[directory] = listing
+            return name in listing or os.path.exists(path)
 
         def slot_cause(slot: SoundButtonData) -> Optional[str]:
             path = str(slot.file_path or "").strip()
@@ -670,7 +626,7 @@ class ToolsLibraryMixin:
             cached = diagnostics_cache.get(path)
             if cached is not None or path in diagnostics_cache:
                 return cached
-            cause = self._diagnose_sound_button_issue(path)
+            cause = self._diagnose_sound_button_issue(path, path_exists)
             diagnostics_cache[path] = cause
             return cause
 
@@ -706,10 +662,10 @@ class ToolsLibraryMixin:
                 causes.append(audio_cause)
             vocal_removed_path = str(slot.vocal_removed_file or "").strip()
             if vocal_removed_path:
-                vocal_removed_cause = self._diagnose_sound_button_issue(vocal_removed_path)
+                vocal_removed_cause = self._diagnose_sound_button_issue(vocal_removed_path, path_exists)
                 if vocal_removed_cause:
                     causes.append(f"Vocal removed track: {vocal_removed_cause}")
-            lyric_cause = self._diagnose_slot_lyric_issue(slot)
+            lyric_cause = self._diagnose_slot_lyric_issue(slot, path_exists)
             if lyric_cause:
                 causes.append(lyric_cause)
             if causes:
@@ -1201,14 +1157,18 @@ class ToolsLibraryMixin:
             self._refresh_playing_slot_after_audio_path_change(slot_key)
         self._show_save_notice_banner(f"Removed linked vocal removed tracks from {changed} sound button(s).")
 
-    def _diagnose_sound_button_issue(self, file_path: str) -> Optional[str]:
+    def _diagnose_sound_button_issue(
+        self,
+        file_path: str,
+        path_exists: Callable[[str], bool] = os.path.exists,
+    ) -> Optional[str]:
         path = str(file_path or "").strip()
         if not path:
             return "No file path assigned."
         reason = self._path_safety_reason(path)
         if reason:
             return f"Invalid file path: {reason}"
-        if not os.path.exists(path):
+        if not path_exists(path):
             base_name = os.path.basename(path)
             if ("?" in base_name) or ("\uFFFD" in base_name):
                 return "Missing file. Filename appears encoding-corrupted ('?' or replacement character)."
@@ -1538,7 +1498,7 @@ class ToolsLibraryMixin:
         window.activateWindow()
 
     def _refresh_list_sound_buttons_window(self, selected_order: str) -> None:
-        matches: List[dict] = self._iter_all_sound_button_entries(include_cue=True)
+        matches: List[dict] = list(self._iter_all_sound_button_entries(include_cue=True))
         if selected_order == "Sound Button sequence":
             matches.sort(
                 key=lambda entry: (
@@ -1565,9 +1525,8 @@ class ToolsLibraryMixin:
             token = self._parse_sound_hotkey(slot.sound_hotkey)
             if not token:
                 continue
-            item = dict(entry)
-            item["sound_hotkey"] = token
-            matches.append(item)
+            entry["sound_hotkey"] = token
+            matches.append(entry)
         if selected_order == "Hotkey sequence":
             matches.sort(
                 key=lambda entry: (
@@ -1597,9 +1556,8 @@ class ToolsLibraryMixin:
             token = normalize_midi_binding(slot.sound_midi_hotkey)
             if not token:
                 continue
-            item = dict(entry)
-            item["sound_midi_hotkey"] = token
-            matches.append(item)
+            entry["sound_midi_hotkey"] = token
+            matches.append(entry)
         if selected_order == "MIDI mapping sequence":
             matches.sort(
                 key=lambda entry: (
@@ -1641,7 +1599,7 @@ class ToolsLibraryMixin:
         export_path = os.path.join(export_dir, f"SSPExportToExcel{extension}")
         matches = self._iter_all_sound_button_entries(include_cue=True)
         try:
-            self._write_csv_rows(export_path, "Page,Button Number,Sound Button Name,File Path", matches)
+            self._write_csv_rows(export_path, _EXPORT_HEADER_BASIC, matches)
         except Exception as exc:
             QMessageBox.critical(self, "Export Failed", f"Could not export file:\n{exc}")
             return
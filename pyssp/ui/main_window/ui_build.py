@@ -6,6 +6,17 @@ from .helpers import *
 from .widgets import *
 
 
+_BANNER_QSS = (
+    "QLabel#bannerWarn{background:#FFF0A6; color:#3A2A00; border:1px solid #CFAE2A; padding:6px; font-weight:bold;}"
+    "QLabel#bannerError{background:#FDE7E9; color:#7A0010; border:1px solid #B00020; padding:6px; font-weight:bold;}"
+    "QLabel#bannerInfo{background:#EFE3FA; color:#3F205E; border:1px solid #7B3FB3; padding:6px; font-weight:bold;}"
+    "QLabel#bannerOk{background:#E4F7E7; color:#165A20; border:1px solid #2E9B47; padding:6px; font-weight:bold;}"
+)
+# The drag-mode tint must share the root sheet with the banner rules, or it would replace them.
+_DRAG_MODE_QSS = "*{background:#FFF9E8;}" + _BANNER_QSS
+_ASSET_TEXT_CACHE: Dict[str, Tuple[float, str]] = {}
+
+
 class UiBuildMixin:
     def _build_ui(self) -> None:
         self._build_menu_bar()
@@ -16,62 +27,21 @@ class UiBuildMixin:
         root_layout.setContentsMargins(8, 8, 8, 8)
         root_layout.setSpacing(8)
 
-        self.drag_mode_banner.setVisible(False)
-        self.drag_mode_banner.setWordWrap(True)
-        self.drag_mode_banner.setStyleSheet(
-            "QLabel{background:#FFF0A6; color:#3A2A00; border:1px solid #CFAE2A; "
-            "padding:6px; font-weight:bold;}"
-        )
-        root_layout.addWidget(self.drag_mode_banner)
-        self.timecode_multiplay_banner.setVisible(False)
-        self.timecode_multiplay_banner.setWordWrap(True)
-        self.timecode_multiplay_banner.setStyleSheet(
-            "QLabel{background:#FDE7E9; color:#7A0010; border:1px solid #B00020; "
-            "padding:6px; font-weight:bold;}"
-        )
-        root_layout.addWidget(self.timecode_multiplay_banner)
-        self.web_remote_warning_banner.setVisible(False)
-        self.web_remote_warning_banner.setWordWrap(True)
-        self.web_remote_warning_banner.setStyleSheet(
-            "QLabel{background:#FDE7E9; color:#7A0010; border:1px solid #B00020; "
-            "padding:6px; font-weight:bold;}"
-        )
-        root_layout.addWidget(self.web_remote_warning_banner)
-        self.midi_connection_warning_banner.setVisible(False)
-        self.midi_connection_warning_banner.setWordWrap(True)
-        self.midi_connection_warning_banner.setStyleSheet(
-            "QLabel{background:#FFF0A6; color:#3A2A00; border:1px solid #CFAE2A; "
-            "padding:6px; font-weight:bold;}"
-        )
-        root_layout.addWidget(self.midi_connection_warning_banner)
-        self.vocal_removed_warning_banner.setVisible(False)
-        self.vocal_removed_warning_banner.setWordWrap(True)
-        self.vocal_removed_warning_banner.setStyleSheet(
-            "QLabel{background:#FFF0A6; color:#3A2A00; border:1px solid #CFAE2A; "
-            "padding:6px; font-weight:bold;}"
-        )
-        root_layout.addWidget(self.vocal_removed_warning_banner)
-        self.playback_warning_banner.setVisible(False)
-        self.playback_warning_banner.setWordWrap(True)
-        self.playback_warning_banner.setStyleSheet(
-            "QLabel{background:#EFE3FA; color:#3F205E; border:1px solid #7B3FB3; "
-            "padding:6px; font-weight:bold;}"
-        )
-        root_layout.addWidget(self.playback_warning_banner)
-        self.save_notice_banner.setVisible(False)
-        self.save_notice_banner.setWordWrap(True)
-        self.save_notice_banner.setStyleSheet(
-            "QLabel{background:#E4F7E7; color:#165A20; border:1px solid #2E9B47; "
-            "padding:6px; font-weight:bold;}"
-        )
-        root_layout.addWidget(self.save_notice_banner)
-        self.info_notice_banner.setVisible(False)
-        self.info_notice_banner.setWordWrap(True)
-        self.info_notice_banner.setStyleSheet(
-            "QLabel{background:#FFF0A6; color:#3A2A00; border:1px solid #CFAE2A; "
-            "padding:6px; font-weight:bold;}"
-        )
-        root_layout.addWidget(self.info_notice_banner)
+        self._apply_root_style_sheet(False)
+        for banner, name in (
+            (self.drag_mode_banner, "bannerWarn"),
+            (self.timecode_multiplay_banner, "bannerError"),
+            (self.web_remote_warning_banner, "bannerError"),
+            (self.midi_connection_warning_banner, "bannerWarn"),
+            (self.vocal_removed_warning_banner, "bannerWarn"),
+            (self.playback_warning_banner, "bannerInfo"),
+            (self.save_notice_banner, "bannerOk"),
+            (self.info_notice_banner, "bannerWarn"),
+        ):
+            banner.setObjectName(name)
+            banner.setVisible(False)
+            banner.setWordWrap(True)
+            root_layout.addWidget(banner)
 
         body_layout = QHBoxLayout()
         body_layout.setContentsMargins(0, 0, 0, 0)
@@ -94,7 +64,13 @@ class UiBuildMixin:
         self.button_legend_label.setVisible(bool(self.show_colour_legend))
         root_layout.addWidget(self.button_legend_label)
 
-        self._build_timecode_dock()
+        if self.show_timecode_panel:
+            self._build_timecode_dock()
+
+    def _apply_root_style_sheet(self, drag_mode: bool) -> None:
+        root = self.centralWidget()
+        if root is not None:
+            root.setStyleSheet(_DRAG_MODE_QSS if drag_mode else _BANNER_QSS)
 
     def _apply_language(self) -> None:
         set_current_language(self.ui_language)
@@ -164,71 +140,29 @@ class UiBuildMixin:
 
     def _build_menu_bar(self) -> None:
         file_menu = self.menuBar().addMenu("File")
-        new_set_action = QAction("New Set", self)
-        new_set_action.triggered.connect(self._new_set)
-        file_menu.addAction(new_set_action)
-        self._menu_actions["new_set"] = new_set_action
-
-        open_set_action = QAction("Open Set", self)
-        open_set_action.triggered.connect(self._open_set_dialog)
-        file_menu.addAction(open_set_action)
-        self._menu_actions["open_set"] = open_set_action
-
-        save_set_action = QAction("Save Set", self)
-        save_set_action.triggered.connect(self._save_set)
-        file_menu.addAction(save_set_action)
-        self._menu_actions["save_set"] = save_set_action
-
-        save_set_at_action = QAction("Save Set At", self)
-        save_set_at_action.triggered.connect(self._save_set_at)
-        file_menu.addAction(save_set_at_action)
-        self._menu_actions["save_set_as"] = save_set_at_action
-
-        file_menu.addSeparator()
-
-        pack_audio_library_action = QAction(tr("Pack Audio Library"), self)
-        pack_audio_library_action.triggered.connect(self._pack_audio_library)
-        file_menu.addAction(pack_audio_library_action)
-
-        unpack_audio_library_action = QAction(tr("Unpack Audio Library"), self)
-        unpack_audio_library_action.triggered.connect(self._unpack_audio_library)
-        file_menu.addAction(unpack_audio_library_action)
-
-        file_menu.addSeparator()
-
-        backup_settings_action = QAction("Backup pySSP Settings", self)
-        backup_settings_action.triggered.connect(self._backup_pyssp_settings)
-        file_menu.addAction(backup_settings_action)
-
-        restore_settings_action = QAction("Restore pySSP Settings", self)
-        restore_settings_action.triggered.connect(self._restore_pyssp_settings)
-        file_menu.addAction(restore_settings_action)
-
-        file_menu.addSeparator()
-
-        backup_keyboard_hotkeys_action = QAction("Backup Keyboard Hotkey Bindings", self)
-        backup_keyboard_hotkeys_action.triggered.connect(self._backup_keyboard_hotkey_bindings)
-        file_menu.addAction(backup_keyboard_hotkeys_action)
-
-        restore_keyboard_hotkeys_action = QAction("Restore Keyboard Hotkey Bindings", self)
-        restore_keyboard_hotkeys_action.triggered.connect(self._restore_keyboard_hotkey_bindings)
-        file_menu.addAction(restore_keyboard_hotkeys_action)
-
-        file_menu.addSeparator()
-
-        backup_midi_bindings_action = QAction("Backup MIDI Bindings", self)
-        backup_midi_bindings_action.triggered.connect(self._backup_midi_bindings)
-        file_menu.addAction(backup_midi_bindings_action)
-
-        restore_midi_bindings_action = QAction("Restore MIDI Bindings", self)
-        restore_midi_bindings_action.triggered.connect(self._restore_midi_bindings)
-        file_menu.addAction(restore_midi_bindings_action)
-
-        file_menu.addSeparator()
-
-        exit_action = QAction("Exit", self)
-        exit_action.triggered.connect(self.close)
-        file_menu.addAction(exit_action)
+        self._add_menu_actions(
+            file_menu,
+            (
+                ("New Set", self._new_set, "new_set"),
+                ("Open Set", self._open_set_dialog, "open_set"),
+                ("Save Set", self._save_set, "save_set"),
+                ("Save Set At", self._save_set_at, "save_set_as"),
+                None,
+                (tr("Pack Audio Library"), self._pack_audio_library, None),
+                (tr("Unpack Audio Library"), self._unpack_audio_library, None),
+                None,
+                ("Backup pySSP Settings", self._backup_pyssp_settings, None),
+                ("Restore pySSP Settings", self._restore_pyssp_settings, None),
+                None,
+                ("Backup Keyboard Hotkey Bindings", self._backup_keyboard_hotkey_bindings, None),
+                ("Restore Keyboard Hotkey Bindings", self._restore_keyboard_hotkey_bindings, None),
+                None,
+                ("Backup MIDI Bindings", self._backup_midi_bindings, None),
+                ("Restore MIDI Bindings", self._restore_midi_bindings, None),
+                None,
+                ("Exit", self.close, None),
+            ),
+        )
 
         setup_menu = self.menuBar().addMenu("Setup")
         options_action = QAction("Options", self)
@@ -245,40 +179,35 @@ class UiBuildMixin:
             platform_name=sys.platform,
         )
         self._menu_actions["options"] = options_action
-        open_web_remote_action = QAction("Open Web Remote", self)
-        open_web_remote_action.triggered.connect(self._open_web_remote)
-        setup_menu.addAction(open_web_remote_action)
+        self._add_menu_actions(setup_menu, (("Open Web Remote", self._open_web_remote, None),))
 
         display_menu = self.menuBar().addMenu("Display")
-        show_display_action = QAction("Show Stage Display", self)
-        show_display_action.triggered.connect(self._show_stage_display)
-        display_menu.addAction(show_display_action)
-        send_alert_action = QAction("Send Alert", self)
-        send_alert_action.triggered.connect(self._open_stage_alert_panel)
-        display_menu.addAction(send_alert_action)
-        lyric_display_action = QAction("Open Lyric Display", self)
-        lyric_display_action.triggered.connect(self._open_lyric_display)
-        display_menu.addAction(lyric_display_action)
+        self._add_menu_actions(
+            display_menu,
+            (
+                ("Show Stage Display", self._show_stage_display, None),
+                ("Send Alert", self._open_stage_alert_panel, None),
+                ("Open Lyric Display", self._open_lyric_display, None),
+            ),
+        )
         web_lyric_display_menu = display_menu.addMenu("Web Lyric Display")
-        web_lyric_caption_action = QAction("Caption", self)
-        web_lyric_caption_action.triggered.connect(lambda: self._open_web_lyric_display("caption"))
-        web_lyric_display_menu.addAction(web_lyric_caption_action)
-        web_lyric_overhead_action = QAction("Overhead", self)
-        web_lyric_overhead_action.triggered.connect(lambda: self._open_web_lyric_display("overhead"))
-        web_lyric_display_menu.addAction(web_lyric_overhead_action)
-        web_lyric_banner_action = QAction("Banner", self)
-        web_lyric_banner_action.triggered.connect(lambda: self._open_web_lyric_display("banner"))
-        web_lyric_display_menu.addAction(web_lyric_banner_action)
-        web_lyric_vmix_action = QAction("vMix Overlay", self)
-        web_lyric_vmix_action.triggered.connect(lambda: self._open_web_lyric_display("vmixoverlay"))
-        web_lyric_display_menu.addAction(web_lyric_vmix_action)
+        self._add_menu_actions(
+            web_lyric_display_menu,
+            (
+                ("Caption", lambda: self._open_web_lyric_display("caption"), None),
+                ("Overhead", lambda: self._open_web_lyric_display("overhead"), None),
+                ("Banner", lambda: self._open_web_lyric_display("banner"), None),
+                ("vMix Overlay", lambda: self._open_web_lyric_display("vmixoverlay"), None),
+            ),
+        )
         self._lyric_blank_toggle_action = QAction("Blank Lyric", self)
         self._lyric_blank_toggle_action.setCheckable(True)
         self._lyric_blank_toggle_action.triggered.connect(lambda checked=False: self._set_lyric_force_blank(bool(checked)))
         display_menu.addAction(self._lyric_blank_toggle_action)
-        stage_display_setting_action = QAction("Stage Display Setting", self)
-        stage_display_setting_action.triggered.connect(lambda: self._open_options_dialog(initial_page="Stage Display"))
-        display_menu.addAction(stage_display_setting_action)
+        self._add_menu_actions(
+            display_menu,
+            (("Stage Display Setting", lambda: self._open_options_dialog(initial_page="Stage Display"), None),),
+        )
         self._sync_lyric_display_controls()
 
         search_action = QAction("Search", self)
@@ -287,10 +216,9 @@ class UiBuildMixin:
         self._menu_actions["search"] = search_action
 
         timecode_menu = self.menuBar().addMenu("Timecode")
-        timecode_settings_action = QAction("Timecode Settings", self)
-        timecode_settings_action.triggered.connect(self._open_timecode_settings)
-        timecode_menu.addAction(timecode_settings_action)
-        self._menu_actions["timecode_settings"] = timecode_settings_action
+        self._add_menu_actions(
+            timecode_menu, (("Timecode Settings", self._open_timecode_settings, "timecode_settings"),)
+        )
         timecode_panel_action = QAction("Timecode Panel", self)
         timecode_panel_action.setCheckable(True)
         timecode_panel_action.setChecked(bool(self.show_timecode_panel))
@@ -305,88 +233,35 @@ class UiBuildMixin:
         show_colour_legend_action.triggered.connect(self._toggle_colour_legend)
         tools_menu.addAction(show_colour_legend_action)
         self._menu_actions["show_colour_legend"] = show_colour_legend_action
-
-        tools_menu.addSeparator()
-
-        duplicate_check_action = QAction("Duplicate Check", self)
-        duplicate_check_action.triggered.connect(self._run_duplicate_check)
-        tools_menu.addAction(duplicate_check_action)
-
-        verify_sound_buttons_action = QAction("Verify Sound Buttons", self)
-        verify_sound_buttons_action.triggered.connect(self._run_verify_sound_buttons)
-        tools_menu.addAction(verify_sound_buttons_action)
-
-        scan_sound_button_lyrics_action = QAction("Scan Sound Buttons Lyrics", self)
-        scan_sound_button_lyrics_action.triggered.connect(self._scan_sound_button_lyrics)
-        tools_menu.addAction(scan_sound_button_lyrics_action)
-
-        lyric_navigator_action = QAction("Lyric Navigator", self)
-        lyric_navigator_action.triggered.connect(self._open_lyric_navigator)
-        tools_menu.addAction(lyric_navigator_action)
-
-        remove_linked_lyrics_action = QAction("Remove All Linked Lyric File", self)
-        remove_linked_lyrics_action.triggered.connect(self._remove_all_linked_lyric_files)
-        tools_menu.addAction(remove_linked_lyrics_action)
-
-        bulk_generate_vocal_removed_action = QAction("Bulk Generate Vocal Removed Track", self)
-        bulk_generate_vocal_removed_action.triggered.connect(self._bulk_generate_vocal_removed_tracks)
-        tools_menu.addAction(bulk_generate_vocal_removed_action)
-
-        link_unlinked_vocal_removed_action = QAction("Link Unlinked Vocal Removed Track", self)
-        link_unlinked_vocal_removed_action.triggered.connect(self._link_unlinked_vocal_removed_tracks)
-        tools_menu.addAction(link_unlinked_vocal_removed_action)
-
-        remove_linked_vocal_removed_action = QAction("Unlink All Vocal Removed Track", self)
-        remove_linked_vocal_removed_action.triggered.connect(self._remove_all_linked_vocal_removed_files)
-        tools_menu.addAction(remove_linked_vocal_removed_action)
-
-        disable_playlist_all_pages_action = QAction("Disable Play List on All Pages", self)
-        disable_playlist_all_pages_action.triggered.connect(self._disable_playlist_on_all_pages)
-        tools_menu.addAction(disable_playlist_all_pages_action)
-        reset_all_pages_action = QAction("Reset All Pages", self)
-        reset_all_pages_action.triggered.connect(self._reset_all_pages_state)
-        tools_menu.addAction(reset_all_pages_action)
-
-        tools_menu.addSeparator()
-
-        clear_waveform_cache_action = QAction("Clear Waveform Cache", self)
-        clear_waveform_cache_action.triggered.connect(self._clear_waveform_cache_now)
-        tools_menu.addAction(clear_waveform_cache_action)
-
-        open_settings_folder_action = QAction("Open Settings Folder", self)
-        open_settings_folder_action.triggered.connect(self._open_settings_folder)
-        tools_menu.addAction(open_settings_folder_action)
-
-        set_file_path_action = QAction("Display .set File and Path", self)
-        set_file_path_action.triggered.connect(self._show_set_file_and_path)
-        tools_menu.addAction(set_file_path_action)
-
-        tools_menu.addSeparator()
-
-        export_excel_action = QAction("Export Page and Sound Buttons to Excel", self)
-        export_excel_action.triggered.connect(self._export_page_and_sound_buttons_to_excel)
-        tools_menu.addAction(export_excel_action)
-
-        list_sound_buttons_action = QAction("List Sound Buttons", self)
-        list_sound_buttons_action.triggered.connect(self._list_sound_buttons)
-        tools_menu.addAction(list_sound_buttons_action)
-
-        list_sound_button_hotkey_action = QAction("List Sound Button Hot Key", self)
-        list_sound_button_hotkey_action.triggered.connect(self._list_sound_button_hotkeys)
-        tools_menu.addAction(list_sound_button_hotkey_action)
-
-        list_sound_device_midi_mapping_action = QAction("List Sound Device MIDI Mapping", self)
-        list_sound_device_midi_mapping_action.triggered.connect(self._list_sound_device_midi_mappings)
-        tools_menu.addAction(list_sound_device_midi_mapping_action)
-
-        launchpad_cheatsheet_action = QAction("Launchpad Cheat Sheet", self)
-        launchpad_cheatsheet_action.triggered.connect(self._show_launchpad_cheatsheet)
-        tools_menu.addAction(launchpad_cheatsheet_action)
+        self._add_menu_actions(
+            tools_menu,
+            (
+                None,
+                ("Duplicate Check", self._run_duplicate_check, None),
+                ("Verify Sound Buttons", self._run_verify_sound_buttons, None),
+                ("Scan Sound Buttons Lyrics", self._scan_sound_button_lyrics, None),
+                ("Lyric Navigator", self._open_lyric_navigator, None),
+                ("Remove All Linked Lyric File", self._remove_all_linked_lyric_files, None),
+                ("Bulk Generate Vocal Removed Track", self._bulk_generate_vocal_removed_tracks, None),
+                ("Link Unlinked Vocal Removed Track", self._link_unlinked_vocal_removed_tracks, None),
+                ("Unlink All Vocal Removed Track", self._remove_all_linked_vocal_removed_files, None),
+                ("Disable Play List on All Pages", self._disable_playlist_on_all_pages, None),
+                ("Reset All Pages", self._reset_all_pages_state, None),
+                None,
+                ("Clear Waveform Cache", self._clear_waveform_cache_now, None),
+                ("Open Settings Folder", self._open_settings_folder, None),
+                ("Display .set File and Path", self._show_set_file_and_path, None),
+                None,
+                ("Export Page and Sound Buttons to Excel", self._export_page_and_sound_buttons_to_excel, None),
+                ("List Sound Buttons", self._list_sound_buttons, None),
+                ("List Sound Button Hot Key", self._list_sound_button_hotkeys, None),
+                ("List Sound Device MIDI Mapping", self._list_sound_device_midi_mappings, None),
+                ("Launchpad Cheat Sheet", self._show_launchpad_cheatsheet, None),
+            ),
+        )
 
         log_menu = self.menuBar().addMenu("Logs")
-        view_log_action = QAction("View Log", self)
-        view_log_action.triggered.connect(self._view_log_file)
-        log_menu.addAction(view_log_action)
+        self._add_menu_actions(log_menu, (("View Log", self._view_log_file, None),))
 
         help_menu = self.menuBar().addMenu("Help")
         about_action = QAction("About", self)
@@ -402,45 +277,42 @@ class UiBuildMixin:
             application_about_action,
             platform_name=sys.platform,
         )
-        system_info_action = QAction("System Information", self)
-        system_info_action.triggered.connect(self._open_system_information_window)
-        help_menu.addAction(system_info_action)
-        audio_engine_insight_action = QAction("Audio Engine Insight", self)
-        audio_engine_insight_action.triggered.connect(self._open_audio_engine_insight_window)
-        help_menu.addAction(audio_engine_insight_action)
-
-        help_action = QAction("Help", self)
-        help_action.triggered.connect(self._open_help_window)
-        help_menu.addAction(help_action)
-
-        getting_started_action = QAction("Getting Started", self)
-        getting_started_action.triggered.connect(lambda _=False: self._open_getting_started_window(startup=False))
-        help_menu.addAction(getting_started_action)
-
-        latest_version_action = QAction("Get the Latest Version", self)
-        latest_version_action.triggered.connect(self._open_latest_version_page)
-        help_menu.addAction(latest_version_action)
-        website_action = QAction("Website", self)
-        website_action.triggered.connect(self._open_website_page)
-        help_menu.addAction(website_action)
-
-        tips_action = QAction("Tips", self)
-        tips_action.triggered.connect(lambda _=False: self._open_tips_window(startup=False))
-        help_menu.addAction(tips_action)
-
-        register_action = QAction("Register", self)
-        register_action.triggered.connect(self._show_register_message)
-        help_menu.addAction(register_action)
-
+        self._add_menu_actions(
+            help_menu,
+            (
+                ("System Information", self._open_system_information_window, None),
+                ("Audio Engine Insight", self._open_audio_engine_insight_window, None),
+                ("Help", self._open_help_window, None),
+                ("Getting Started", lambda _=False: self._open_getting_started_window(startup=False), None),
+                ("Get the Latest Version", self._open_latest_version_page, None),
+                ("Website", self._open_website_page, None),
+                ("Tips", lambda _=False: self._open_tips_window(startup=False), None),
+                ("Register", self._show_register_message, None),
+            ),
+        )
         if not getattr(sys, "frozen", False):
-            debug_crash_action = QAction("Crash for Debug", self)
-            debug_crash_action.triggered.connect(self._trigger_debug_crash)
-            help_menu.addAction(debug_crash_action)
+            self._add_menu_actions(help_menu, (("Crash for Debug", self._trigger_debug_crash, None),))
         if sys.platform != "darwin":
             self.lock_screen_button = self._create_lock_screen_button(self.menuBar(), auto_raise=True)
             self.menuBar().setCornerWidget(self.lock_screen_button, Qt.TopRightCorner)
         self._apply_hotkeys()
 
+    def _add_menu_actions(
+        self,
+        menu: QMenu,
+        items: Tuple[Optional[Tuple[str, Callable[..., object], Optional[str]]], ...],
+    ) -> None:
+        for item in items:
+            if item is None:
+                menu.addSeparator()
+                continue
+            label, slot, key = item
+            action = QAction(label, self)
+            action.triggered.connect(slot)
+            menu.addAction(action)
+            if key:
+                self._menu_actions[key] = action
+
     def _create_lock_screen_button(self, parent: QWidget, *, auto_raise: bool) -> QToolButton:
         button = QToolButton(parent)
         button.setCheckable(True)
@@ -466,16 +338,23 @@ class UiBuildMixin:
 
     def _load_asset_text_file(self, *parts: str) -> str:
         file_path = self._asset_file_path(*parts)
-        if not os.path.exists(file_path):
+        try:
+            mtime = os.stat(file_path).st_mtime
+        except OSError:
             return f"{os.path.join(*parts)} not found at:\n{file_path}"
+        cached = _ASSET_TEXT_CACHE.get(file_path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
         try:
             with open(file_path, "r", encoding="utf-8") as fh:
-                return fh.read()
+                text = fh.read()
         except UnicodeDecodeError:
             with open(file_path, "r", encoding="latin1", errors="replace") as fh:
-                return fh.read()
+                text = fh.read()
         except Exception as exc:
             return f"Could not read {os.path.join(*parts)}:\n{exc}"
+        _ASSET_TEXT_CACHE[file_path] = (mtime, text)
+        return text
 
     def _open_about_window(self) -> None:
         if self._about_window is None:
@@ -1295,6 +1174,7 @@ class UiBuildMixin:
         self._sync_control_button_instances()
 
     def _set_dirty(self, dirty: bool = True) -> None:
+        self._invalidate_sound_binding_caches()
         if self._dirty == dirty:
             return
         self._dirty = dirty
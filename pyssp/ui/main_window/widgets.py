@@ -1,8 +1,12 @@
 from __future__ import annotations
 
+from collections import OrderedDict
+from functools import lru_cache
+
 from .shared import *
 from .constants import *
 from .helpers import *
+from pyssp.ui.stage_display import _bold_font
 
 __all__ = [
     "SoundButtonData",
@@ -21,7 +25,49 @@ __all__ = [
     "LockScreenOverlay",
 ]
 
-@dataclass
+_FIT_FLAGS = int(Qt.AlignCenter | Qt.TextWordWrap)
+
+_STAGE_STATUS_OVERLAYS: Dict[str, str] = {
+    "playing": "QPushButton{background:#1E5E2D;border-color:#4FBF6A;}",
+    "paused": "QPushButton{background:#5A4A12;border-color:#E0C14A;}",
+    "not_playing": "QPushButton{background:#3C1B1B;border-color:#B56161;}",
+}
+
+_TIMECODE_LABEL_FONT: Optional[QFont] = None
+_STAGE_TITLE_FONT: Optional[QFont] = None
+
+
+def _timecode_label_font() -> QFont:
+    global _TIMECODE_LABEL_FONT
+    if _TIMECODE_LABEL_FONT is None:
+        font = QFont(QApplication.font())
+        font.setPointSize(max(font.pointSize() + 6, 14))
+        font.setBold(True)
+        _TIMECODE_LABEL_FONT = font
+    return _TIMECODE_LABEL_FONT
+
+
+def _stage_title_font() -> QFont:
+    global _STAGE_TITLE_FONT
+    if _STAGE_TITLE_FONT is None:
+        font = QFont()
+        font.setPointSize(20)
+        font.setBold(True)
+        _STAGE_TITLE_FONT = font
+    return _STAGE_TITLE_FONT
+
+
+@lru_cache(maxsize=64)
+def _stage_status_qss(point_size: int, radius: int) -> str:
+    return (
+        "QPushButton{"
+        f"font-size:{point_size}pt; font-weight:bold; color:#F5F5F5; border:1px solid #6A6A6A; border-radius:{radius}px; padding:4px 12px; background:#0E0E0E;"
+        "}"
+        "QPushButton:disabled{color:#F5F5F5;}"
+    )
+
+
+@dataclass(slots=True)
 class SoundButtonData:
     file_path: str = ""
     vocal_removed_file: str = ""
@@ -82,6 +128,8 @@ class SoundButton(QPushButton):
         self._ram_loaded = False
         self._top_indicator_color: Optional[str] = None
         self._bottom_indicator_colors: List[str] = []
+        self._top_indicator_qcolor: Optional[QColor] = None
+        self._bottom_indicator_qcolors: List[QColor] = []
         self.setSizePolicy(QSizePolicy.Ignored, QSizePolicy.Ignored)
         self.setMinimumSize(0, 0)
         self.setStyleSheet("font-size: 10pt; font-weight: bold;")
@@ -158,7 +206,8 @@ class SoundButton(QPushButton):
         if loaded_flag == self._ram_loaded:
             return
         self._ram_loaded = loaded_flag
-        self.update()
+        if self.isVisible():
+            self.update()
 
     def set_indicator_colors(self, top_color: Optional[str], bottom_colors: List[str]) -> None:
         normalized_top = str(top_color).strip() if top_color else None
@@ -167,6 +216,8 @@ class SoundButton(QPushButton):
             return
         self._top_indicator_color = normalized_top
         self._bottom_indicator_colors = normalized_bottom
+        self._top_indicator_qcolor = QColor(normalized_top) if normalized_top else None
+        self._bottom_indicator_qcolors = [QColor(color) for color in normalized_bottom]
         self.update()
 
     def paintEvent(self, event) -> None:
@@ -178,22 +229,22 @@ class SoundButton(QPushButton):
         side_margin = 1
         top_height = max(3, min(8, int(round(self.height() * 0.11))))
         bottom_height = max(4, min(10, int(round(self.height() * 0.12))))
-        if self._top_indicator_color:
-            stripe_painter.setBrush(QColor(self._top_indicator_color))
+        if self._top_indicator_qcolor is not None:
+            stripe_painter.setBrush(self._top_indicator_qcolor)
             stripe_painter.drawRect(
                 side_margin,
                 top_margin,
                 max(1, self.width() - (side_margin * 2)),
                 top_height,
             )
-        if self._bottom_indicator_colors:
+        if self._bottom_indicator_qcolors:
             stripe_area_width = max(1, self.width() - (side_margin * 2))
             stripe_y = max(top_margin, self.height() - bottom_height - top_margin)
-            count = len(self._bottom_indicator_colors)
-            for idx, color in enumerate(self._bottom_indicator_colors):
+            count = len(self._bottom_indicator_qcolors)
+            for idx, color in enumerate(self._bottom_indicator_qcolors):
                 start_x = side_margin + int(round((stripe_area_width * idx) / count))
                 end_x = side_margin + int(round((stripe_area_width * (idx + 1)) / count))
-                stripe_painter.setBrush(QColor(color))
+                stripe_painter.setBrush(color)
                 stripe_painter.drawRect(start_x, stripe_y, max(1, end_x - start_x), bottom_height)
         stripe_painter.end()
         if not self._ram_loaded:
@@ -201,7 +252,7 @@ class SoundButton(QPushButton):
         p = QPainter(self)
         p.setRenderHint(QPainter.Antialiasing, True)
         p.setPen(Qt.NoPen)
-        p.setBrush(QColor("#2ED573"))
+        p.setBrush(COLOR_OBJECTS["ram_loaded"])
         d = 8
         x = max(2, self.width() - d - 3)
         y = max(2, self.height() - d - 3)
@@ -312,6 +363,7 @@ class ToolListWindow(QDialog):
         self._print_handler: Optional[Callable[[], None]] = None
         self._refresh_handler: Optional[Callable[[str], None]] = None
         self._double_click_action = "play" if double_click_action == "play" else "goto"
+        self._matches: List[Optional[dict]] = []
 
         root = QVBoxLayout(self)
         root.setContentsMargins(10, 10, 10, 10)
@@ -393,11 +445,10 @@ class ToolListWindow(QDialog):
 
     def set_items(self, lines: List[str], matches: Optional[List[Optional[dict]]] = None, status: str = "") -> None:
         self.results_list.clear()
-        for i, line in enumerate(lines):
-            item = QListWidgetItem(line)
-            if matches and i < len(matches):
-                item.setData(Qt.UserRole, matches[i])
-            self.results_list.addItem(item)
+        self.results_list.addItems([str(line) for line in lines])
+        stored = [match if isinstance(match, dict) else None for match in list(matches or [])[: len(lines)]]
+        stored.extend([None] * (len(lines) - len(stored)))
+        self._matches = stored
         self.status_label.setText(status)
 
     def set_note(self, text: str) -> None:
@@ -443,13 +494,10 @@ class ToolListWindow(QDialog):
         self.go_to_selected()
 
     def _selected_match(self) -> Optional[dict]:
-        item = self.results_list.currentItem()
-        if item is None:
-            return None
-        match = item.data(Qt.UserRole)
-        if not isinstance(match, dict):
-            return None
-        return match
+        row = self.results_list.currentRow()
+        if 0 <= row < len(self._matches):
+            return self._matches[row]
+        return None
 
 
 class AboutWindowDialog(QDialog):
@@ -504,6 +552,8 @@ class AboutWindowDialog(QDialog):
         self.tabs = QTabWidget(self)
         root.addWidget(self.tabs, 1)
 
+        self._content: Optional[Tuple[str, str, str]] = None
+
         self.about_viewer = self._build_tab_textbox()
         self.credits_viewer = self._build_tab_textbox()
         self.license_viewer = self._build_tab_textbox(no_wrap=True)
@@ -522,6 +572,7 @@ class AboutWindowDialog(QDialog):
     def _build_tab_textbox(self, no_wrap: bool = False) -> QPlainTextEdit:
         textbox = QPlainTextEdit(self)
         textbox.setReadOnly(True)
+        textbox.setUndoRedoEnabled(False)
         textbox.setLineWrapMode(QPlainTextEdit.NoWrap if no_wrap else QPlainTextEdit.WidgetWidth)
         return textbox
 
@@ -542,6 +593,10 @@ class AboutWindowDialog(QDialog):
         self._refresh_cover_pixmap()
 
     def set_content(self, about_text: str, credits_text: str, license_text: str) -> None:
+        content = (about_text, credits_text, license_text)
+        if content == self._content:
+            return
+        self._content = content
         self.about_viewer.setPlainText(about_text)
         self.credits_viewer.setPlainText(credits_text)
         self.license_viewer.setPlainText(license_text)
@@ -595,10 +650,7 @@ class TimecodePanel(QWidget):
         current_layout.setContentsMargins(0, 0, 0, 0)
         current_layout.addWidget(QLabel("Current Output"))
         self.timecode_label = QLabel("00:00:00:00", current_group)
-        font = self.timecode_label.font()
-        font.setPointSize(max(font.pointSize() + 6, 14))
-        font.setBold(True)
-        self.timecode_label.setFont(font)
+        self.timecode_label.setFont(_timecode_label_font())
         self.timecode_label.setAlignment(Qt.AlignCenter)
         current_layout.addWidget(self.timecode_label)
         self.device_label = QLabel("", current_group)
@@ -731,6 +783,15 @@ class StageDisplayWindow(QWidget):
         self.resize(980, 600)
         self.setAttribute(Qt.WA_DeleteOnClose, True)
         self.setStyleSheet("background:#000000; color:#FFFFFF;")
+        self._responsive_applied = False
+        self._last_responsive_key: Optional[Tuple[int, ...]] = None
+        self._date_font = QFont(_stage_title_font())
+        self._title_font = QFont(_stage_title_font())
+        self._time_font = QFont(_bold_font(44))
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(60)
+        self._resize_timer.timeout.connect(self._apply_responsive_sizes)
         self._order = list(self.DISPLAY_LABELS.keys())
         self._visibility = {key: True for key in self.DISPLAY_LABELS.keys()}
 
@@ -739,8 +800,10 @@ class StageDisplayWindow(QWidget):
         root.setSpacing(14)
         self._outer_layout = root
         self._datetime_label = QLabel("", self)
+        self._datetime_text = ""
         self._datetime_label.setAlignment(Qt.AlignLeft | Qt.AlignTop)
-        self._datetime_label.setStyleSheet("font-size:20pt; font-weight:bold; color:#E6E6E6;")
+        self._datetime_label.setFont(self._date_font)
+        self._datetime_label.setStyleSheet("color:#E6E6E6;")
         root.addWidget(self._datetime_label, 0, Qt.AlignLeft | Qt.AlignTop)
 
         center = QWidget(self)
@@ -755,9 +818,12 @@ class StageDisplayWindow(QWidget):
         self._time_value_labels: List[QLabel] = []
         self._song_value_labels: List[QLabel] = []
         self._song_raw_values: Dict[str, str] = {"song_name": "-", "next_song": "-"}
+        self._last_fit_sig: Optional[tuple] = None
         self._song_base_pt = 48
+        self._fit_cache: "OrderedDict[Tuple[str, int, int, int, str], int]" = OrderedDict()
         self._song_text_boxes: Dict[str, QFrame] = {}
         self._status_state = "not_playing"
+        self._status_shown = False
 
         times_row = QWidget(center)
         times_layout = QHBoxLayout(times_row)
@@ -771,10 +837,12 @@ class StageDisplayWindow(QWidget):
             panel_layout.setSpacing(4)
             title_label = QLabel(self.DISPLAY_LABELS[key], panel)
             title_label.setAlignment(Qt.AlignCenter)
-            title_label.setStyleSheet("font-size:20pt; font-weight:bold; color:#D0D0D0;")
+            title_label.setFont(self._title_font)
+            title_label.setStyleSheet("color:#D0D0D0;")
             value = QLabel("-", panel)
             value.setAlignment(Qt.AlignCenter)
-            value.setStyleSheet("font-size:44pt; font-weight:bold; color:#FFFFFF;")
+            value.setFont(self._time_font)
+            value.setStyleSheet("color:#FFFFFF;")
             panel_layout.addWidget(title_label)
             panel_layout.addWidget(value)
             self._rows[key] = panel
@@ -791,7 +859,8 @@ class StageDisplayWindow(QWidget):
         progress_layout.setSpacing(8)
         progress_title = QLabel(self.DISPLAY_LABELS["progress_bar"], progress_row)
         progress_title.setAlignment(Qt.AlignCenter)
-        progress_title.setStyleSheet("font-size:20pt; font-weight:bold; color:#D0D0D0;")
+        progress_title.setFont(self._title_font)
+        progress_title.setStyleSheet("color:#D0D0D0;")
         progress = QLabel("0%", progress_row)
         progress.setAlignment(Qt.AlignCenter)
         progress.setMinimumWidth(760)
@@ -813,7 +882,8 @@ class StageDisplayWindow(QWidget):
             title_text = tr("Now Playing") if key == "song_name" else tr("Next Playing")
             title_label = QLabel(title_text, row)
             title_label.setAlignment(Qt.AlignCenter)
-            title_label.setStyleSheet("font-size:20pt; font-weight:bold; color:#D0D0D0;")
+            title_label.setFont(self._title_font)
+            title_label.setStyleSheet("color:#D0D0D0;")
             text_box = QFrame(row)
             text_box.setFrameShape(QFrame.NoFrame)
             box_layout = QVBoxLayout(text_box)
@@ -823,7 +893,8 @@ class StageDisplayWindow(QWidget):
             value.setAlignment(Qt.AlignCenter)
             value.setWordWrap(False)
             value.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
-            value.setStyleSheet("font-size:48pt; font-weight:bold; color:#FFFFFF;")
+            value.setFont(_bold_font(48))
+            value.setStyleSheet("color:#FFFFFF;")
             box_layout.addWidget(value)
             row_layout.addWidget(title_label)
             row_layout.addWidget(text_box, 1)
@@ -841,11 +912,11 @@ class StageDisplayWindow(QWidget):
         footer_layout.addStretch(1)
         self._status_value = QPushButton(tr("Not Playing"), footer)
         self._status_value.setEnabled(False)
-        self._status_base_style = (
-            "QPushButton{font-size:16pt; font-weight:bold; color:#F5F5F5; border:1px solid #6A6A6A; border-radius:8px; padding:4px 12px; background:#0E0E0E;}"
-            "QPushButton:disabled{color:#F5F5F5;}"
-        )
-        self._status_value.setStyleSheet(self._status_base_style)
+        self._status_base_style = _stage_status_qss(16, 8)
+        self._status_stylesheets: Dict[str, str] = {}
+        self._applied_status_stylesheet = ""
+        self._rebuild_status_stylesheets()
+        self._apply_status_stylesheet()
         footer_layout.addWidget(self._status_value, 0, Qt.AlignRight)
         root.addWidget(footer, 0)
         self._footer_layout = footer_layout
@@ -854,9 +925,16 @@ class StageDisplayWindow(QWidget):
         self._datetime_timer.timeout.connect(self._update_datetime)
         self._datetime_timer.start(1000)
         self._update_datetime()
+        self._layout_pending = False
+        self.setUpdatesEnabled(False)
+        QTimer.singleShot(0, self._do_initial_layout)
+
+    def _do_initial_layout(self) -> None:
         self._apply_layout()
         self._apply_responsive_sizes()
         self.retranslate_ui()
+        self.setUpdatesEnabled(True)
+        self.update()
 
     def configure_layout(self, order: List[str], visibility: Dict[str, bool]) -> None:
         valid = [key for key in order if key in self._rows]
@@ -865,6 +943,13 @@ class StageDisplayWindow(QWidget):
                 valid.append(key)
         self._order = valid
         self._visibility = {key: bool(visibility.get(key, True)) for key in self.DISPLAY_LABELS.keys()}
+        if self._layout_pending:
+            return
+        self._layout_pending = True
+        QTimer.singleShot(0, self._flush_layout)
+
+    def _flush_layout(self) -> None:
+        self._layout_pending = False
         self._apply_layout()
 
     def update_values(
@@ -929,24 +1014,30 @@ class StageDisplayWindow(QWidget):
         self._times_row.setVisible(times_visible)
 
     def _update_datetime(self) -> None:
-        self._datetime_label.setText(datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+        text = time.strftime("%Y-%m-%d %H:%M:%S")
+        if text == self._datetime_text:
+            return
+        self._datetime_text = text
+        self._datetime_label.setText(text)
 
     def resizeEvent(self, event) -> None:
         super().resizeEvent(event)
-        self._apply_responsive_sizes()
+        if not self._responsive_applied:
+            self._apply_responsive_sizes()
+            return
+        self._resize_timer.start()
 
     def _apply_responsive_sizes(self) -> None:
+        self._responsive_applied = True
         w = max(640, self.width())
         h = max(360, self.height())
         scale = max(0.65, min(3.2, min(w / 1280.0, h / 720.0)))
 
         margin = int(18 * scale)
-        self._outer_layout.setContentsMargins(margin, margin, margin, margin)
-        self._outer_layout.setSpacing(max(10, int(14 * scale)))
-        self._center_layout.setSpacing(max(10, int(18 * scale)))
-        self._times_layout.setSpacing(max(12, int(28 * scale)))
-        self._footer_layout.setSpacing(max(6, int(10 * scale)))
-
+        outer_spacing = max(10, int(14 * scale))
+        center_spacing = max(10, int(18 * scale))
+        times_spacing = max(12, int(28 * scale))
+        footer_spacing = max(6, int(10 * scale))
         date_pt = max(12, int(20 * scale))
         title_pt = max(12, int(20 * scale))
         time_pt = max(16, int(44 * scale))
@@ -954,63 +1045,93 @@ class StageDisplayWindow(QWidget):
         progress_pt = max(12, int(20 * scale))
         progress_height = max(24, int(46 * scale))
         progress_width = max(280, int(w * 0.72))
-        radius = max(4, int(6 * scale))
+        radius = max(6, int(8 * scale))
         status_pt = max(10, int(16 * scale))
         song_box_width = max(320, int(w * 0.90))
         song_box_height = max(80, int(h * 0.15))
 
-        self._datetime_label.setStyleSheet(
-            f"font-size:{date_pt}pt; font-weight:bold; color:#E6E6E6;"
+        key = (
+            margin,
+            outer_spacing,
+            center_spacing,
+            times_spacing,
+            footer_spacing,
+            date_pt,
+            title_pt,
+            time_pt,
+            song_pt,
+            progress_pt,
+            progress_height,
+            progress_width,
+            radius,
+            status_pt,
+            song_box_width,
+            song_box_height,
         )
+        if key == self._last_responsive_key:
+            return
+        self._last_responsive_key = key
+
+        self._outer_layout.setContentsMargins(margin, margin, margin, margin)
+        self._outer_layout.setSpacing(outer_spacing)
+        self._center_layout.setSpacing(center_spacing)
+        self._times_layout.setSpacing(times_spacing)
+        self._footer_layout.setSpacing(footer_spacing)
+        self._date_font.setPointSize(date_pt)
+        self._datetime_label.setFont(self._date_font)
+        self._title_font.setPointSize(title_pt)
         for label in self._title_labels.values():
-            label.setStyleSheet(
-                f"font-size:{title_pt}pt; font-weight:bold; color:#D0D0D0;"
-            )
+            label.setFont(self._title_font)
+        self._time_font.setPointSize(time_pt)
         for label in self._time_value_labels:
-            label.setStyleSheet(
-                f"font-size:{time_pt}pt; font-weight:bold; color:#FFFFFF;"
-            )
-        for label in self._song_value_labels:
-            label.setStyleSheet(
-                f"font-size:{song_pt}pt; font-weight:bold; color:#FFFFFF;"
-            )
+            label.setFont(self._time_font)
         self._song_base_pt = song_pt
+        song_box_size = QSize(song_box_width, song_box_height)
         for key in ["song_name", "next_song"]:
             box = self._song_text_boxes.get(key)
-            if box is not None:
-                box.setFixedSize(song_box_width, song_box_height)
-        self._progress_bar.setMinimumHeight(progress_height)
-        self._progress_bar.setMinimumWidth(progress_width)
-        self._status_value.setStyleSheet(
-            "QPushButton{"
-            f"font-size:{status_pt}pt; font-weight:bold; color:#F5F5F5; border:1px solid #6A6A6A; border-radius:{max(6, int(8 * scale))}px; padding:4px 12px; background:#0E0E0E;"
-            "}"
-            "QPushButton:disabled{color:#F5F5F5;}"
-        )
-        self._status_base_style = self._status_value.styleSheet()
+            if box is not None and (box.minimumSize() != song_box_size or box.maximumSize() != song_box_size):
+                box.setFixedSize(song_box_size)
+        if self._progress_bar.minimumHeight() != progress_height:
+            self._progress_bar.setMinimumHeight(progress_height)
+        if self._progress_bar.minimumWidth() != progress_width:
+            self._progress_bar.setMinimumWidth(progress_width)
+        status_base_style = _stage_status_qss(status_pt, radius)
+        if status_base_style != self._status_base_style:
+            self._status_base_style = status_base_style
+            self._rebuild_status_stylesheets()
+            self._apply_status_stylesheet()
         self._apply_song_text_fit()
 
+    def _rebuild_status_stylesheets(self) -> None:
+        self._status_stylesheets = {
+            state: self._status_base_style + overlay for state, overlay in _STAGE_STATUS_OVERLAYS.items()
+        }
+
+    def _apply_status_stylesheet(self) -> None:
+        state = self._status_state if self._status_state in self._status_stylesheets else "not_playing"
+        stylesheet = self._status_stylesheets[state]
+        if stylesheet == self._applied_status_stylesheet:
+            return
+        self._applied_status_stylesheet = stylesheet
+        self._status_value.setStyleSheet(stylesheet)
+
     def set_playback_status(self, state: str) -> None:
         token = str(state or "").strip().lower()
+        if token == self._status_state and self._status_shown:
+            return
         self._status_state = token
+        self._show_playback_status()
+
+    def _show_playback_status(self) -> None:
+        token = self._status_state
+        self._status_shown = True
         if token == "playing":
             self._status_value.setText(f"> {tr('Playing')}")
-            self._status_value.setStyleSheet(
-                self._status_base_style
-                + "QPushButton{background:#1E5E2D;border-color:#4FBF6A;}"
-            )
         elif token == "paused":
             self._status_value.setText(f"|| {tr('Paused')}")
-            self._status_value.setStyleSheet(
-                self._status_base_style
-                + "QPushButton{background:#5A4A12;border-color:#E0C14A;}"
-            )
         else:
             self._status_value.setText(f"[] {tr('Not Playing')}")
-            self._status_value.setStyleSheet(
-                self._status_base_style
-                + "QPushButton{background:#3C1B1B;border-color:#B56161;}"
-            )
+        self._apply_status_stylesheet()
 
     def retranslate_ui(self) -> None:
         self.setWindowTitle(tr("Stage Display"))
@@ -1023,9 +1144,17 @@ class StageDisplayWindow(QWidget):
                 continue
             source = self.DISPLAY_LABELS.get(key, key)
             label.setText(tr(source))
-        self.set_playback_status(self._status_state)
+        self._show_playback_status()
 
     def _apply_song_text_fit(self) -> None:
+        fit_sig = (
+            self._song_base_pt,
+            tuple(self._song_raw_values.values()),
+            tuple((box.width(), box.height()) for box in self._song_text_boxes.values()),
+        )
+        if fit_sig == self._last_fit_sig:
+            return
+        self._last_fit_sig = fit_sig
         for key in ["song_name", "next_song"]:
             label = self._value_labels.get(key)
             if not isinstance(label, QLabel):
@@ -1039,27 +1168,43 @@ class StageDisplayWindow(QWidget):
             target_height = max(40, text_box.height() - 8)
             min_pt = 8
             base_font = QFont(label.font())
-            base_font.setPointSize(max(min_pt, int(self._song_base_pt)))
-            label.setFont(base_font)
-            fit_pt = base_font.pointSize()
-            while fit_pt > min_pt:
-                metrics = label.fontMetrics()
-                rect = metrics.boundingRect(
-                    0,
-                    0,
-                    target_width,
-                    target_height,
-                    int(Qt.AlignCenter | Qt.TextWordWrap),
-                    raw,
-                )
-                if rect.width() <= target_width and rect.height() <= target_height:
-                    break
-                fit_pt -= 1
-                next_font = QFont(base_font)
-                next_font.setPointSize(fit_pt)
-                label.setFont(next_font)
+            base_pt = max(min_pt, int(self._song_base_pt))
+            cache_key = (raw, target_width, target_height, base_pt, base_font.family())
+            fit_pt = self._fit_cache.get(cache_key)
+            if fit_pt is None:
+                low = min_pt
+                high = base_pt
+                while low < high:
+                    mid = (low + high + 1) // 2
+                    if self._song_text_fits(base_font, mid, raw, target_width, target_height):
+                        low = mid
+                    else:
+                        high = mid - 1
+                fit_pt = low
+                self._fit_cache[cache_key] = fit_pt
+                if len(self._fit_cache) > 128:
+                    self._fit_cache.popitem(last=False)
+            else:
+                self._fit_cache.move_to_end(cache_key)
+            fit_font = QFont(base_font)
+            fit_font.setPointSize(fit_pt)
+            label.setFont(fit_font)
             label.setWordWrap(True)
 
+    @staticmethod
+    def _song_text_fits(base_font: QFont, point_size: int, text: str, target_width: int, target_height: int) -> bool:
+        font = QFont(base_font)
+        font.setPointSize(point_size)
+        rect = QFontMetrics(font).boundingRect(
+            0,
+            0,
+            target_width,
+            target_height,
+            _FIT_FLAGS,
+            text,
+        )
+        return rect.width() <= target_width and rect.height() <= target_height
+
 
 class NoAudioPlayer(QObject):
     StoppedState = 0
@@ -1091,25 +1236,29 @@ class NoAudioPlayer(QObject):
         _ = dsp_config
 
     def play(self) -> None:
-        self._state = self.PlayingState
-        self.stateChanged.emit(self._state)
+        self._set_state(self.PlayingState)
 
     def pause(self) -> None:
-        self._state = self.PausedState
-        self.stateChanged.emit(self._state)
+        self._set_state(self.PausedState)
 
     def stop(self) -> None:
-        self._state = self.StoppedState
-        self._position_ms = 0
-        self.stateChanged.emit(self._state)
-        self.positionChanged.emit(0)
+        self._set_state(self.StoppedState)
+        self.setPosition(0)
+
+    def _set_state(self, new_state: int) -> None:
+        if new_state != self._state:
+            self._state = new_state
+            self.stateChanged.emit(new_state)
 
     def state(self) -> int:
         return self._state
 
     def setPosition(self, position_ms: int) -> None:
-        self._position_ms = max(0, int(position_ms))
-        self.positionChanged.emit(self._position_ms)
+        position_ms = max(0, int(position_ms))
+        if position_ms == self._position_ms:
+            return
+        self._position_ms = position_ms
+        self.positionChanged.emit(position_ms)
 
     def position(self) -> int:
         return self._position_ms
@@ -1132,6 +1281,18 @@ class NoAudioPlayer(QObject):
 
 
 class TransportProgressDisplay(QLabel):
+    _COL_PLAYABLE_BG = QColor("#1A222A")
+    _COL_UNPLAYABLE_BG = QColor("#11161B")
+    _COL_PLAYED_BG = QColor("#1B3724")
+    _COL_PLAYED_WAVE = QColor("#2ECC40")
+    _COL_PLAYABLE_WAVE = QColor("#B9D7EA")
+    _COL_UNPLAYABLE_WAVE = QColor("#5E7586")
+    _COL_BORDER = QColor("#3C4E58")
+    _COL_PLAYHEAD = QColor("#FFD54F")
+    _COL_TEXT_BG = QColor(0, 0, 0, 150)
+    _COL_TEXT_OUTLINE = QColor(0, 0, 0, 220)
+    _COL_TEXT = QColor("#FFFFFF")
+
     def __init__(self, text: str = "", parent: Optional[QWidget] = None) -> None:
         super().__init__(text, parent)
         self._display_mode = "progress_bar"
@@ -1139,7 +1300,11 @@ class TransportProgressDisplay(QLabel):
         self._cue_in_ratio = 0.0
         self._cue_out_ratio = 1.0
         self._audio_file_mode = False
-        self._waveform: List[float] = []
+        self._waveform_np = np.zeros(0, dtype=np.float32)
+        self._text_rect_cache: Optional[Tuple[int, int, QRect]] = None
+        self._waveform_pixmap_cache: Optional[Tuple[tuple, QPixmap, QPixmap]] = None
+        self._wave_idx_cache: Optional[Tuple[tuple, np.ndarray]] = None
+        self._last_play_x: Optional[Tuple[int, int]] = None
 
     def set_display_mode(self, mode: str) -> None:
         token = str(mode or "").strip().lower()
@@ -1148,20 +1313,28 @@ class TransportProgressDisplay(QLabel):
         if token == self._display_mode:
             return
         self._display_mode = token
+        self._last_play_x = None
         self.update()
 
     def display_mode(self) -> str:
         return self._display_mode
 
     def set_waveform(self, peaks: List[float]) -> None:
-        cleaned: List[float] = []
-        for value in list(peaks or []):
-            try:
-                amp = float(value)
-            except Exception:
-                amp = 0.0
-            cleaned.append(max(0.0, min(1.0, amp)))
-        self._waveform = cleaned
+        try:
+            arr = np.array(peaks if peaks is not None else [], dtype=np.float32).reshape(-1)
+        except (TypeError, ValueError):
+            cleaned: List[float] = []
+            for value in list(peaks or []):
+                try:
+                    cleaned.append(float(value))
+                except Exception:
+                    cleaned.append(0.0)
+            arr = np.asarray(cleaned, dtype=np.float32)
+        np.nan_to_num(arr, copy=False, nan=0.0)
+        np.clip(arr, 0.0, 1.0, out=arr)
+        self._waveform_np = arr
+        self._waveform_pixmap_cache = None
+        self._last_play_x = None
         if self._display_mode == "waveform":
             self.update()
 
@@ -1177,84 +1350,68 @@ class TransportProgressDisplay(QLabel):
         out_ratio = max(0.0, min(1.0, float(cue_out_ratio)))
         if out_ratio < in_ratio:
             out_ratio = in_ratio
+        layout_changed = (
+            in_ratio != self._cue_in_ratio
+            or out_ratio != self._cue_out_ratio
+            or bool(audio_file_mode) != self._audio_file_mode
+        )
         self._cue_in_ratio = in_ratio
         self._cue_out_ratio = out_ratio
         self._audio_file_mode = bool(audio_file_mode)
-        if self._display_mode == "waveform":
+        if self._display_mode != "waveform":
+            return
+        w = max(1, self.width())
+        play_x = int(round(self._progress_ratio * (w - 1)))
+        last = self._last_play_x
+        self._last_play_x = (w, play_x)
+        if layout_changed or last is None or last[0] != w:
             self.update()
+            return
+        if play_x != last[1]:
+            left = min(play_x, last[1]) - 2
+            self.update(QRect(left, 0, abs(play_x - last[1]) + 5, self.height()))
 
     def paintEvent(self, event) -> None:
         if self._display_mode != "waveform":
             super().paintEvent(event)
             return
 
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing, False)
         w = max(1, self.width())
         h = max(1, self.height())
-        center = h // 2
-        max_half = max(1, (h // 2) - 3)
-
-        playable_bg = QColor("#1A222A")
-        unplayable_bg = QColor("#11161B")
-        played_bg = QColor("#1B3724")
-        played_wave = QColor("#2ECC40")
-        playable_wave = QColor("#B9D7EA")
-        unplayable_wave = QColor("#5E7586")
-        border = QColor("#3C4E58")
 
         in_x = int(round(self._cue_in_ratio * (w - 1)))
         out_x = int(round(self._cue_out_ratio * (w - 1)))
         play_x = int(round(self._progress_ratio * (w - 1)))
         if out_x < in_x:
             out_x = in_x
-
-        painter.fillRect(0, 0, w, h, unplayable_bg if self._audio_file_mode else playable_bg)
-        if self._audio_file_mode:
-            painter.fillRect(in_x, 0, max(1, out_x - in_x + 1), h, playable_bg)
-
         if self._audio_file_mode:
             played_left = max(in_x, 0)
             played_right = min(out_x, play_x)
         else:
             played_left = 0
             played_right = max(0, play_x)
-        if played_right >= played_left:
-            painter.fillRect(played_left, 0, max(1, played_right - played_left + 1), h, played_bg)
+        base_pixmap, played_pixmap = self._waveform_pixmaps(w, h, in_x, out_x)
 
-        wave = self._waveform
-        wave_count = len(wave)
-        sample_start_ratio = 0.0
-        sample_end_ratio = 1.0
-        if (not self._audio_file_mode) and (self._cue_out_ratio > self._cue_in_ratio):
-            sample_start_ratio = self._cue_in_ratio
-            sample_end_ratio = self._cue_out_ratio
-        for x in range(w):
-            if wave_count > 0:
-                x_ratio = x / float(max(1, w - 1))
-                sample_ratio = sample_start_ratio + ((sample_end_ratio - sample_start_ratio) * x_ratio)
-                idx = int(round(sample_ratio * float(max(0, wave_count - 1))))
-                idx = max(0, min(wave_count - 1, idx))
-                amp = wave[idx]
-            else:
-                amp = 0.0
-            half = max(1, int(round(amp * max_half)))
-            if self._audio_file_mode and (x < in_x or x > out_x):
-                wave_color = unplayable_wave
-            elif x <= play_x:
-                wave_color = played_wave
-            else:
-                wave_color = playable_wave
-            painter.setPen(wave_color)
-            painter.drawLine(x, center - half, x, center + half)
-
-        painter.setPen(QColor("#FFD54F"))
+        clip_rect = event.rect()
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing, False)
+        painter.setClipRegion(event.region())
+        painter.drawPixmap(0, 0, base_pixmap)
+        if played_right >= played_left:
+            played_rect = QRect(played_left, 0, played_right - played_left + 1, h)
+            if played_rect.intersects(clip_rect):
+                painter.save()
+                painter.setClipRect(played_rect, Qt.IntersectClip)
+                painter.drawPixmap(0, 0, played_pixmap)
+                painter.restore()
+
+        painter.setPen(self._COL_PLAYHEAD)
         painter.drawLine(play_x, 0, play_x, h - 1)
-        painter.setPen(border)
+        painter.setPen(self._COL_BORDER)
         painter.drawRect(0, 0, w - 1, h - 1)
         text = self.text()
-        if text:
-            text_rect = self.rect().adjusted(6, 2, -6, -2)
+        text_rect = self._text_rect(w, h)
+        if text and text_rect.adjusted(-1, -1, 1, 1).intersects(clip_rect):
             metrics = painter.fontMetrics()
             width = min(text_rect.width(), metrics.horizontalAdvance(text) + 14)
             height = min(text_rect.height(), metrics.height() + 8)
@@ -1264,15 +1421,100 @@ class TransportProgressDisplay(QLabel):
                 max(1, width),
                 max(1, height),
             )
-            painter.fillRect(bubble, QColor(0, 0, 0, 150))
+            painter.fillRect(bubble, self._COL_TEXT_BG)
 
-            painter.setPen(QColor(0, 0, 0, 220))
+            painter.setPen(self._COL_TEXT_OUTLINE)
             for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
                 painter.drawText(text_rect.translated(dx, dy), int(self.alignment()), text)
-            painter.setPen(QColor("#FFFFFF"))
+            painter.setPen(self._COL_TEXT)
             painter.drawText(text_rect, int(self.alignment()), text)
         painter.end()
 
+    def _waveform_pixmaps(self, w: int, h: int, in_x: int, out_x: int) -> Tuple[QPixmap, QPixmap]:
+        key = (
+            w,
+            h,
+            in_x,
+            out_x,
+            self._audio_file_mode,
+            self._cue_in_ratio,
+            self._cue_out_ratio,
+            round(self.devicePixelRatioF(), 3),
+        )
+        if self._waveform_pixmap_cache is not None and self._waveform_pixmap_cache[0] == key:
+            return self._waveform_pixmap_cache[1], self._waveform_pixmap_cache[2]
+        center = h // 2
+        max_half = max(1, (h // 2) - 3)
+
+        wave = self._waveform_np
+        wave_count = len(wave)
+        sample_start_ratio = 0.0
+        sample_end_ratio = 1.0
+        if (not self._audio_file_mode) and (self._cue_out_ratio > self._cue_in_ratio):
+            sample_start_ratio = self._cue_in_ratio
+            sample_end_ratio = self._cue_out_ratio
+        if wave_count > 0:
+            idx = self._wave_indices(w, wave_count, sample_start_ratio, sample_end_ratio)
+            amps = wave[idx].astype(np.float64)
+        else:
+            amps = np.zeros(w, dtype=np.float64)
+        halves = np.maximum(1, np.rint(amps * max_half).astype(np.int64))
+        lines = [QLine(x, center - half, x, center + half) for x, half in enumerate(halves.tolist())]
+        if self._audio_file_mode:
+            unplayable_lines = lines[:in_x] + lines[out_x + 1 :]
+            playable_lines = lines[in_x : out_x + 1]
+        else:
+            unplayable_lines = []
+            playable_lines = lines
+
+        ratio = self.devicePixelRatioF()
+        base_pixmap = QPixmap(int(w * ratio), int(h * ratio))
+        base_pixmap.setDevicePixelRatio(ratio)
+        painter = QPainter(base_pixmap)
+        painter.setRenderHint(QPainter.Antialiasing, False)
+        painter.fillRect(0, 0, w, h, self._COL_UNPLAYABLE_BG if self._audio_file_mode else self._COL_PLAYABLE_BG)
+        if self._audio_file_mode:
+            painter.fillRect(in_x, 0, max(1, out_x - in_x + 1), h, self._COL_PLAYABLE_BG)
+        if unplayable_lines:
+            painter.setPen(self._COL_UNPLAYABLE_WAVE)
+            painter.drawLines(unplayable_lines)
+        if playable_lines:
+            painter.setPen(self._COL_PLAYABLE_WAVE)
+            painter.drawLines(playable_lines)
+        painter.end()
+
+        played_pixmap = QPixmap(int(w * ratio), int(h * ratio))
+        played_pixmap.setDevicePixelRatio(ratio)
+        painter = QPainter(played_pixmap)
+        painter.setRenderHint(QPainter.Antialiasing, False)
+        painter.fillRect(0, 0, w, h, self._COL_PLAYED_BG)
+        painter.setPen(self._COL_PLAYED_WAVE)
+        painter.drawLines(lines)
+        painter.end()
+
+        self._waveform_pixmap_cache = (key, base_pixmap, played_pixmap)
+        return base_pixmap, played_pixmap
+
+    def _wave_indices(self, w: int, wave_count: int, start_ratio: float, end_ratio: float) -> np.ndarray:
+        key = (w, wave_count, start_ratio, end_ratio)
+        cached = self._wave_idx_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        x_ratio = np.arange(w) / float(max(1, w - 1))
+        sample_ratio = start_ratio + ((end_ratio - start_ratio) * x_ratio)
+        idx = np.rint(sample_ratio * float(max(0, wave_count - 1))).astype(np.int64)
+        np.clip(idx, 0, wave_count - 1, out=idx)
+        self._wave_idx_cache = (key, idx)
+        return idx
+
+    def _text_rect(self, w: int, h: int) -> QRect:
+        cached = self._text_rect_cache
+        if cached is not None and cached[0] == w and cached[1] == h:
+            return cached[2]
+        text_rect = self.rect().adjusted(6, 2, -6, -2)
+        self._text_rect_cache = (w, h, text_rect)
+        return text_rect
+
 
 class MainThreadExecutor(QObject):
     _execute = pyqtSignal(object, object)
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from collections.abc import Iterator, Mapping
+
 from .shared import *
 from .constants import *
 from .helpers import *
@@ -10,12 +12,67 @@ from .lyrics_stage import LyricsStageMixin
 from .pages_slots import PagesSlotsMixin
 from .playback import PlaybackMixin
 from .remote_api import RemoteApiMixin
-from .settings_archive import SettingsArchiveMixin
-from .timecode import TimecodeMixin
+from .settings_archive import _ROTARY_SENSITIVITY_TARGETS, _ROTARY_TARGETS, SettingsArchiveMixin
+from .timecode import _TIMECODE_MODES, TimecodeMixin, _TimecodeFollowState
 from .tools_library import ToolsLibraryMixin
 from .ui_build import UiBuildMixin
 
 
+_LOCK_UNLOCK_METHODS = frozenset({"click_3_random_points", "click_one_button", "slide_to_unlock"})
+_LOCK_RESTART_STATES = frozenset({"unlock_on_restart", "lock_on_restart"})
+_VOCAL_REMOVED_TOGGLE_FADE_MODES = frozenset({"follow_cross_fade", "follow_cross_fade_custom", "never", "always"})
+_TALK_VOLUME_MODES = frozenset({"percent_of_master", "lower_only", "set_exact"})
+_SET_FILE_ENCODINGS = frozenset({"utf8", "gbk"})
+_PLAY_MODES = frozenset({"unplayed_only", "any_available"})
+_PLAYLIST_LOOP_MODES = frozenset({"loop_list", "loop_single"})
+_CANDIDATE_ERROR_ACTIONS = frozenset({"stop_playback", "keep_playing"})
+_MTC_IDLE_BEHAVIORS = frozenset({MTC_IDLE_KEEP_STREAM, MTC_IDLE_ALLOW_DARK})
+_TIMECODE_SAMPLE_RATES = frozenset({44100, 48000, 96000})
+_TIMECODE_BIT_DEPTHS = frozenset({8, 16, 32})
+_TIMELINE_MODES = frozenset({"cue_region", "audio_file"})
+_PROGRESS_DISPLAY_MODES = frozenset({"progress_bar", "waveform"})
+_JOG_OUTSIDE_CUE_ACTIONS = frozenset({"stop_immediately", "ignore_cue", "next_cue_or_stop", "stop_cue_or_end"})
+_STAGE_DISPLAY_TEXT_SOURCES = frozenset({"caption", "filename", "note"})
+_NOW_PLAYING_DISPLAY_MODES = frozenset({"filename", "filepath", "caption", "note", "caption_note"})
+_LYRIC_DISPLAY_MODES = frozenset({"always", "when_available", "never"})
+_LYRIC_FILE_FORMATS = frozenset({"srt", "lrc"})
+_HOTKEY_PRIORITIES = frozenset({"system_first", "sound_button_first"})
+_ROTARY_VOLUME_MODES = frozenset({"absolute", "relative"})
+
+
+_VALIDATED_SETTINGS = (
+    ("talk_volume_mode", _TALK_VOLUME_MODES, "percent_of_master"),
+    ("playlist_play_mode", _PLAY_MODES, "unplayed_only"),
+    ("rapid_fire_play_mode", _PLAY_MODES, "unplayed_only"),
+    ("next_play_mode", _PLAY_MODES, "unplayed_only"),
+    ("playlist_loop_mode", _PLAYLIST_LOOP_MODES, "loop_list"),
+    ("candidate_error_action", _CANDIDATE_ERROR_ACTIONS, "stop_playback"),
+    ("main_transport_timeline_mode", _TIMELINE_MODES, "cue_region"),
+    ("main_jog_outside_cue_action", _JOG_OUTSIDE_CUE_ACTIONS, "stop_immediately"),
+    ("sound_button_hotkey_priority", _HOTKEY_PRIORITIES, "system_first"),
+    ("midi_sound_button_hotkey_priority", _HOTKEY_PRIORITIES, "system_first"),
+)
+_NORMALIZED_SETTINGS = (
+    ("lock_unlock_method", _LOCK_UNLOCK_METHODS, "click_3_random_points"),
+    ("lock_restart_state", _LOCK_RESTART_STATES, "unlock_on_restart"),
+    ("vocal_removed_toggle_fade_mode", _VOCAL_REMOVED_TOGGLE_FADE_MODES, "follow_cross_fade"),
+    ("main_progress_display_mode", _PROGRESS_DISPLAY_MODES, "progress_bar"),
+    ("stage_display_text_source", _STAGE_DISPLAY_TEXT_SOURCES, "caption"),
+    ("now_playing_display_mode", _NOW_PLAYING_DISPLAY_MODES, "caption"),
+    ("main_ui_lyric_display_mode", _LYRIC_DISPLAY_MODES, "always"),
+    ("new_lyric_file_format", _LYRIC_FILE_FORMATS, "srt"),
+    ("midi_rotary_volume_mode", _ROTARY_VOLUME_MODES, "relative"),
+)
+
+
+def _clamp_int(value, low: int, high: int, default: int) -> int:
+    try:
+        value = int(value)
+    except (TypeError, ValueError):
+        return default
+    return low if value < low else high if value > high else value
+
+
 def _stop_qthread_safely(thread: Optional[QThread], timeout_ms: int = 1500) -> None:
     if thread is None:
         return
@@ -41,6 +98,30 @@ def _shutdown_executor_safely(executor) -> None:
         pass
 
 
+_HOTKEY_FIELDS: Dict[str, Dict[str, tuple[str, str]]] = {
+    prefix: {key: (f"{prefix}_{key}_1", f"{prefix}_{key}_2") for key in HOTKEY_DEFAULTS}
+    for prefix in ("hotkey", "midi_hotkey")
+}
+
+
+class _HotkeyView(Mapping):
+    __slots__ = ("_settings", "_fields")
+
+    def __init__(self, settings, prefix: str) -> None:
+        self._settings = settings
+        self._fields = _HOTKEY_FIELDS[prefix]
+
+    def __getitem__(self, key: str) -> tuple[str, str]:
+        first, second = self._fields[key]
+        return (getattr(self._settings, first), getattr(self._settings, second))
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._fields)
+
+    def __len__(self) -> int:
+        return len(self._fields)
+
+
 class MainWindow(
     UiBuildMixin,
     TimecodeMixin,
@@ -64,7 +145,8 @@ class MainWindow(
         self.setWindowTitle(self.app_title_base)
         self.resize(1360, 900)
         self.settings: AppSettings = load_settings()
-        self.ui_language = normalize_language(getattr(self.settings, "ui_language", "en"))
+        s = self.settings
+        self.ui_language = normalize_language(getattr(s, "ui_language", "en"))
         set_current_language(self.ui_language)
 
         self.current_group = "A"
@@ -97,84 +179,69 @@ class MainWindow(
         self._last_fade_flash_toggle = 0.0
         self._last_meter_aux_refresh_t = 0.0
         self._stop_fade_armed = False
-        self.active_group_color = self.settings.active_group_color
-        self.inactive_group_color = self.settings.inactive_group_color
-        self.title_char_limit = self.settings.title_char_limit
-        self.show_file_notifications = self.settings.show_file_notifications
-        self.lock_allow_quit = bool(getattr(self.settings, "lock_allow_quit", False))
-        self.lock_allow_system_hotkeys = bool(getattr(self.settings, "lock_allow_system_hotkeys", False))
-        self.lock_allow_quick_action_hotkeys = bool(getattr(self.settings, "lock_allow_quick_action_hotkeys", False))
-        self.lock_allow_sound_button_hotkeys = bool(getattr(self.settings, "lock_allow_sound_button_hotkeys", False))
-        self.lock_allow_midi_control = bool(getattr(self.settings, "lock_allow_midi_control", False))
-        self.lock_auto_allow_quit = bool(getattr(self.settings, "lock_auto_allow_quit", True))
-        self.lock_auto_allow_midi_control = bool(getattr(self.settings, "lock_auto_allow_midi_control", True))
-        self.lock_unlock_method = str(getattr(self.settings, "lock_unlock_method", "click_3_random_points")).strip().lower()
-        if self.lock_unlock_method not in {"click_3_random_points", "click_one_button", "slide_to_unlock"}:
-            self.lock_unlock_method = "click_3_random_points"
-        self.lock_require_password = bool(getattr(self.settings, "lock_require_password", False))
-        self.lock_password = str(getattr(self.settings, "lock_password", ""))
-        self.lock_restart_state = str(getattr(self.settings, "lock_restart_state", "unlock_on_restart")).strip().lower()
-        if self.lock_restart_state not in {"unlock_on_restart", "lock_on_restart"}:
-            self.lock_restart_state = "unlock_on_restart"
-        self.fade_in_sec = self.settings.fade_in_sec
-        self.cross_fade_sec = self.settings.cross_fade_sec
-        self.fade_out_sec = self.settings.fade_out_sec
-        self.fade_on_quick_action_hotkey = bool(self.settings.fade_on_quick_action_hotkey)
-        self.fade_on_sound_button_hotkey = bool(self.settings.fade_on_sound_button_hotkey)
-        self.fade_on_pause = bool(self.settings.fade_on_pause)
-        self.fade_on_resume = bool(self.settings.fade_on_resume)
-        self.fade_on_stop = bool(self.settings.fade_on_stop)
-        self.fade_out_when_done_playing = bool(self.settings.fade_out_when_done_playing)
-        self.fade_out_end_lead_sec = max(0.0, float(self.settings.fade_out_end_lead_sec))
-        self.vocal_removed_toggle_fade_mode = str(
-            getattr(self.settings, "vocal_removed_toggle_fade_mode", "follow_cross_fade")
-        ).strip().lower()
-        if self.vocal_removed_toggle_fade_mode not in {
-            "follow_cross_fade",
-            "follow_cross_fade_custom",
-            "never",
-            "always",
-        }:
-            self.vocal_removed_toggle_fade_mode = "follow_cross_fade"
+        self.active_group_color = s.active_group_color
+        self.inactive_group_color = s.inactive_group_color
+        self.title_char_limit = s.title_char_limit
+        self.show_file_notifications = s.show_file_notifications
+        self.lock_allow_quit = bool(getattr(s, "lock_allow_quit", False))
+        self.lock_allow_system_hotkeys = bool(getattr(s, "lock_allow_system_hotkeys", False))
+        self.lock_allow_quick_action_hotkeys = bool(getattr(s, "lock_allow_quick_action_hotkeys", False))
+        self.lock_allow_sound_button_hotkeys = bool(getattr(s, "lock_allow_sound_button_hotkeys", False))
+        self.lock_allow_midi_control = bool(getattr(s, "lock_allow_midi_control", False))
+        self.lock_auto_allow_quit = bool(getattr(s, "lock_auto_allow_quit", True))
+        self.lock_auto_allow_midi_control = bool(getattr(s, "lock_auto_allow_midi_control", True))
+        for attr, valid, default in _VALIDATED_SETTINGS:
+            value = getattr(s, attr, default)
+            setattr(self, attr, value if value in valid else default)
+        for attr, valid, default in _NORMALIZED_SETTINGS:
+            value = str(getattr(s, attr, default)).strip().lower()
+            setattr(self, attr, value if value in valid else default)
+        self.lock_require_password = bool(getattr(s, "lock_require_password", False))
+        self.lock_password = str(getattr(s, "lock_password", ""))
+        self.fade_in_sec = s.fade_in_sec
+        self.cross_fade_sec = s.cross_fade_sec
+        self.fade_out_sec = s.fade_out_sec
+        self.fade_on_quick_action_hotkey = bool(s.fade_on_quick_action_hotkey)
+        self.fade_on_sound_button_hotkey = bool(s.fade_on_sound_button_hotkey)
+        self.fade_on_pause = bool(s.fade_on_pause)
+        self.fade_on_resume = bool(s.fade_on_resume)
+        self.fade_on_stop = bool(s.fade_on_stop)
+        self.fade_out_when_done_playing = bool(s.fade_out_when_done_playing)
+        self.fade_out_end_lead_sec = max(0.0, float(s.fade_out_end_lead_sec))
         self.vocal_removed_toggle_custom_sec = max(
             0.0,
-            min(20.0, float(getattr(self.settings, "vocal_removed_toggle_custom_sec", 1.0))),
+            min(20.0, float(getattr(s, "vocal_removed_toggle_custom_sec", 1.0))),
         )
         self.vocal_removed_toggle_always_sec = max(
             0.0,
-            min(20.0, float(getattr(self.settings, "vocal_removed_toggle_always_sec", 1.0))),
-        )
-        self.talk_volume_level = self.settings.talk_volume_level
-        self.talk_fade_sec = self.settings.talk_fade_sec
-        self.talk_volume_mode = (
-            self.settings.talk_volume_mode
-            if self.settings.talk_volume_mode in {"percent_of_master", "lower_only", "set_exact"}
-            else "percent_of_master"
-        )
-        self.talk_blink_button = self.settings.talk_blink_button
-        self.log_file_enabled = self.settings.log_file_enabled
-        self.reset_all_on_startup = self.settings.reset_all_on_startup
-        self.click_playing_action = self.settings.click_playing_action
-        self.search_double_click_action = self.settings.search_double_click_action
-        self.set_file_encoding = self.settings.set_file_encoding or "utf8"
-        if self.set_file_encoding not in {"utf8", "gbk"}:
+            min(20.0, float(getattr(s, "vocal_removed_toggle_always_sec", 1.0))),
+        )
+        self.talk_volume_level = s.talk_volume_level
+        self.talk_fade_sec = s.talk_fade_sec
+        self.talk_blink_button = s.talk_blink_button
+        self.log_file_enabled = s.log_file_enabled
+        self.reset_all_on_startup = s.reset_all_on_startup
+        self.click_playing_action = s.click_playing_action
+        self.search_double_click_action = s.search_double_click_action
+        self.set_file_encoding = s.set_file_encoding or "utf8"
+        if self.set_file_encoding not in _SET_FILE_ENCODINGS:
             self.set_file_encoding = "utf8"
-        self.tips_open_on_startup = bool(getattr(self.settings, "tips_open_on_startup", True))
-        self.audio_output_device = self.settings.audio_output_device
+        self.tips_open_on_startup = bool(getattr(s, "tips_open_on_startup", True))
+        self.audio_output_device = s.audio_output_device
         _preload_total_mb, _preload_reserved_mb, _preload_cap_mb = get_preload_memory_limits_mb()
-        self.preload_audio_enabled = bool(getattr(self.settings, "preload_audio_enabled", False))
-        self.preload_current_page_audio = bool(getattr(self.settings, "preload_current_page_audio", True))
+        self.preload_audio_enabled = bool(getattr(s, "preload_audio_enabled", False))
+        self.preload_current_page_audio = bool(getattr(s, "preload_current_page_audio", True))
         self.preload_audio_memory_limit_mb = max(
             64,
-            min(int(_preload_cap_mb), int(getattr(self.settings, "preload_audio_memory_limit_mb", 512))),
+            min(int(_preload_cap_mb), int(getattr(s, "preload_audio_memory_limit_mb", 512))),
         )
         self.preload_memory_pressure_enabled = bool(
-            getattr(self.settings, "preload_memory_pressure_enabled", True)
+            getattr(s, "preload_memory_pressure_enabled", True)
         )
-        self.preload_pause_on_playback = bool(getattr(self.settings, "preload_pause_on_playback", True))
-        self.preload_use_ffmpeg = bool(getattr(self.settings, "preload_use_ffmpeg", True))
-        self.waveform_cache_limit_mb = max(128, min(16384, int(getattr(self.settings, "waveform_cache_limit_mb", 1024))))
-        self.waveform_cache_clear_on_launch = bool(getattr(self.settings, "waveform_cache_clear_on_launch", True))
+        self.preload_pause_on_playback = bool(getattr(s, "preload_pause_on_playback", True))
+        self.preload_use_ffmpeg = bool(getattr(s, "preload_use_ffmpeg", True))
+        self.waveform_cache_limit_mb = max(128, min(16384, int(getattr(s, "waveform_cache_limit_mb", 1024))))
+        self.waveform_cache_clear_on_launch = bool(getattr(s, "waveform_cache_clear_on_launch", True))
         self._preload_runtime_paused = False
         configure_audio_preload_cache_policy(
             self.preload_audio_enabled,
@@ -183,329 +250,155 @@ class MainWindow(
             self.preload_use_ffmpeg,
         )
         configure_waveform_disk_cache(self.waveform_cache_limit_mb)
-        self.max_multi_play_songs = self.settings.max_multi_play_songs
-        self.multi_play_limit_action = self.settings.multi_play_limit_action
-        self.playlist_play_mode = (
-            self.settings.playlist_play_mode
-            if self.settings.playlist_play_mode in {"unplayed_only", "any_available"}
-            else "unplayed_only"
-        )
-        self.rapid_fire_play_mode = (
-            self.settings.rapid_fire_play_mode
-            if self.settings.rapid_fire_play_mode in {"unplayed_only", "any_available"}
-            else "unplayed_only"
-        )
-        self.next_play_mode = (
-            self.settings.next_play_mode
-            if self.settings.next_play_mode in {"unplayed_only", "any_available"}
-            else "unplayed_only"
-        )
-        self.playlist_loop_mode = (
-            self.settings.playlist_loop_mode
-            if self.settings.playlist_loop_mode in {"loop_list", "loop_single"}
-            else "loop_list"
-        )
-        self.candidate_error_action = (
-            self.settings.candidate_error_action
-            if self.settings.candidate_error_action in {"stop_playback", "keep_playing"}
-            else "stop_playback"
-        )
-        self.web_remote_enabled = self.settings.web_remote_enabled
+        self.max_multi_play_songs = s.max_multi_play_songs
+        self.multi_play_limit_action = s.multi_play_limit_action
+        self.web_remote_enabled = s.web_remote_enabled
         self.web_remote_host = "0.0.0.0"
-        self.web_remote_port = max(1, min(65534, int(self.settings.web_remote_port or 5050)))
+        self.web_remote_port = max(1, min(65534, int(s.web_remote_port or 5050)))
         self.web_remote_ws_port = int(self.web_remote_port) + 1
         self._local_ip_cache = "127.0.0.1"
         self._local_ip_cache_at = 0.0
-        self.timecode_audio_output_device = self.settings.timecode_audio_output_device or "none"
-        self.timecode_midi_output_device = self.settings.timecode_midi_output_device or MIDI_OUTPUT_DEVICE_NONE
-        self.timecode_mode = self.settings.timecode_mode or TIMECODE_MODE_FOLLOW
-        if self.timecode_mode not in {
-            TIMECODE_MODE_ZERO,
-            TIMECODE_MODE_FOLLOW,
-            TIMECODE_MODE_SYSTEM,
-            TIMECODE_MODE_FOLLOW_FREEZE,
-        }:
+        self.timecode_audio_output_device = s.timecode_audio_output_device or "none"
+        self.timecode_midi_output_device = s.timecode_midi_output_device or MIDI_OUTPUT_DEVICE_NONE
+        self.timecode_mode = s.timecode_mode or TIMECODE_MODE_FOLLOW
+        if self.timecode_mode not in _TIMECODE_MODES:
             self.timecode_mode = TIMECODE_MODE_FOLLOW
-        self.timecode_fps = max(1.0, float(self.settings.timecode_fps or 30.0))
-        self.timecode_mtc_fps = max(1.0, float(self.settings.timecode_mtc_fps or 30.0))
-        self.timecode_mtc_idle_behavior = self.settings.timecode_mtc_idle_behavior or MTC_IDLE_KEEP_STREAM
-        if self.timecode_mtc_idle_behavior not in {MTC_IDLE_KEEP_STREAM, MTC_IDLE_ALLOW_DARK}:
+        self.timecode_fps = max(1.0, float(s.timecode_fps or 30.0))
+        self.timecode_mtc_fps = max(1.0, float(s.timecode_mtc_fps or 30.0))
+        self.timecode_mtc_idle_behavior = s.timecode_mtc_idle_behavior or MTC_IDLE_KEEP_STREAM
+        if self.timecode_mtc_idle_behavior not in _MTC_IDLE_BEHAVIORS:
             self.timecode_mtc_idle_behavior = MTC_IDLE_KEEP_STREAM
-        self.timecode_sample_rate = int(self.settings.timecode_sample_rate or 48000)
-        if self.timecode_sample_rate not in {44100, 48000, 96000}:
+        self.timecode_sample_rate = int(s.timecode_sample_rate or 48000)
+        if self.timecode_sample_rate not in _TIMECODE_SAMPLE_RATES:
             self.timecode_sample_rate = 48000
-        self.timecode_bit_depth = int(self.settings.timecode_bit_depth or 16)
-        if self.timecode_bit_depth not in {8, 16, 32}:
+        self.timecode_bit_depth = int(s.timecode_bit_depth or 16)
+        if self.timecode_bit_depth not in _TIMECODE_BIT_DEPTHS:
             self.timecode_bit_depth = 16
-        self.show_timecode_panel = bool(self.settings.show_timecode_panel)
-        self.show_colour_legend = bool(getattr(self.settings, "show_colour_legend", True))
+        self.show_timecode_panel = bool(s.show_timecode_panel)
+        self.show_colour_legend = bool(getattr(s, "show_colour_legend", True))
         self.timecode_timeline_mode = (
-            self.settings.timecode_timeline_mode
-            if self.settings.timecode_timeline_mode in {"cue_region", "audio_file"}
-            else self.settings.main_transport_timeline_mode
+            s.timecode_timeline_mode
+            if s.timecode_timeline_mode in _TIMELINE_MODES
+            else s.main_transport_timeline_mode
         )
-        if self.timecode_timeline_mode not in {"cue_region", "audio_file"}:
+        if self.timecode_timeline_mode not in _TIMELINE_MODES:
             self.timecode_timeline_mode = "cue_region"
         self.soundbutton_timecode_offset_enabled = bool(
-            getattr(self.settings, "soundbutton_timecode_offset_enabled", True)
+            getattr(s, "soundbutton_timecode_offset_enabled", True)
         )
         self.respect_soundbutton_timecode_timeline_setting = bool(
-            getattr(self.settings, "respect_soundbutton_timecode_timeline_setting", True)
-        )
-        self.main_transport_timeline_mode = (
-            self.settings.main_transport_timeline_mode
-            if self.settings.main_transport_timeline_mode in {"cue_region", "audio_file"}
-            else "cue_region"
-        )
-        self.main_progress_display_mode = str(getattr(self.settings, "main_progress_display_mode", "progress_bar")).strip().lower()
-        if self.main_progress_display_mode not in {"progress_bar", "waveform"}:
-            self.main_progress_display_mode = "progress_bar"
-        self.main_progress_show_text = bool(getattr(self.settings, "main_progress_show_text", True))
-        self._timecode_follow_frozen_ms = 0
-        if self.timecode_mode == TIMECODE_MODE_FOLLOW_FREEZE:
-            self._timecode_follow_frozen_ms = 0
-        self.main_jog_outside_cue_action = (
-            self.settings.main_jog_outside_cue_action
-            if self.settings.main_jog_outside_cue_action
-            in {"stop_immediately", "ignore_cue", "next_cue_or_stop", "stop_cue_or_end"}
-            else "stop_immediately"
+            getattr(s, "respect_soundbutton_timecode_timeline_setting", True)
         )
+        self.main_progress_show_text = bool(getattr(s, "main_progress_show_text", True))
+        self._tc = _TimecodeFollowState()
         self.stage_display_layout = self._normalize_stage_display_layout(
-            list(getattr(self.settings, "stage_display_layout", []))
+            list(getattr(s, "stage_display_layout", []))
         )
         self.stage_display_visibility = self._normalize_stage_display_visibility(
             {
-                "current_time": bool(getattr(self.settings, "stage_display_show_current_time", True)),
-                "alert": bool(getattr(self.settings, "stage_display_show_alert", False)),
-                "total_time": bool(getattr(self.settings, "stage_display_show_total_time", True)),
-                "elapsed": bool(getattr(self.settings, "stage_display_show_elapsed", True)),
-                "remaining": bool(getattr(self.settings, "stage_display_show_remaining", True)),
-                "progress_bar": bool(getattr(self.settings, "stage_display_show_progress_bar", True)),
-                "song_name": bool(getattr(self.settings, "stage_display_show_song_name", True)),
-                "lyric": bool(getattr(self.settings, "stage_display_show_lyric", True)),
-                "next_song": bool(getattr(self.settings, "stage_display_show_next_song", True)),
+                "current_time": bool(getattr(s, "stage_display_show_current_time", True)),
+                "alert": bool(getattr(s, "stage_display_show_alert", False)),
+                "total_time": bool(getattr(s, "stage_display_show_total_time", True)),
+                "elapsed": bool(getattr(s, "stage_display_show_elapsed", True)),
+                "remaining": bool(getattr(s, "stage_display_show_remaining", True)),
+                "progress_bar": bool(getattr(s, "stage_display_show_progress_bar", True)),
+                "song_name": bool(getattr(s, "stage_display_show_song_name", True)),
+                "lyric": bool(getattr(s, "stage_display_show_lyric", True)),
+                "next_song": bool(getattr(s, "stage_display_show_next_song", True)),
             }
         )
         self.stage_display_gadgets = normalize_stage_display_gadgets(
-            getattr(self.settings, "stage_display_gadgets", {}),
+            getattr(s, "stage_display_gadgets", {}),
             legacy_layout=self.stage_display_layout,
             legacy_visibility=self.stage_display_visibility,
         )
         self.stage_display_layout, self.stage_display_visibility = gadgets_to_legacy_layout_visibility(
             self.stage_display_gadgets
         )
-        source = str(getattr(self.settings, "stage_display_text_source", "caption")).strip().lower()
-        self.stage_display_text_source = source if source in {"caption", "filename", "note"} else "caption"
-        now_playing_mode = str(getattr(self.settings, "now_playing_display_mode", "caption")).strip().lower()
-        self.now_playing_display_mode = (
-            now_playing_mode
-            if now_playing_mode in {"filename", "filepath", "caption", "note", "caption_note"}
-            else "caption"
-        )
-        lyric_mode = str(getattr(self.settings, "main_ui_lyric_display_mode", "always")).strip().lower()
-        self.main_ui_lyric_display_mode = (
-            lyric_mode if lyric_mode in {"always", "when_available", "never"} else "always"
-        )
         self.search_lyric_on_add_sound_button = bool(
-            getattr(self.settings, "search_lyric_on_add_sound_button", True)
+            getattr(s, "search_lyric_on_add_sound_button", True)
         )
-        new_lyric_fmt = str(getattr(self.settings, "new_lyric_file_format", "srt")).strip().lower()
-        self.new_lyric_file_format = new_lyric_fmt if new_lyric_fmt in {"srt", "lrc"} else "srt"
         self.supported_audio_format_extensions = normalize_supported_audio_extensions(
-            list(getattr(self.settings, "supported_audio_format_extensions", []))
+            list(getattr(s, "supported_audio_format_extensions", []))
         )
-        self.verify_sound_file_on_add = bool(getattr(self.settings, "verify_sound_file_on_add", True))
+        self.verify_sound_file_on_add = bool(getattr(s, "verify_sound_file_on_add", True))
         self.allow_other_unsupported_audio_files = bool(
-            getattr(self.settings, "allow_other_unsupported_audio_files", False)
+            getattr(s, "allow_other_unsupported_audio_files", False)
         )
-        self.disable_path_safety = bool(getattr(self.settings, "disable_path_safety", False))
-        self.window_layout = normalize_window_layout(getattr(self.settings, "window_layout", None))
+        self.disable_path_safety = bool(getattr(s, "disable_path_safety", False))
+        self.window_layout = normalize_window_layout(getattr(s, "window_layout", None))
         self.state_colors = {
-            "empty": self.settings.color_empty,
-            "assigned": self.settings.color_unplayed,
-            "highlighted": self.settings.color_highlight,
-            "playing": self.settings.color_playing,
-            "played": self.settings.color_played,
-            "missing": self.settings.color_error,
-            "locked": self.settings.color_lock,
-            "marker": self.settings.color_place_marker,
-            "copied": self.settings.color_copied_to_cue,
-            "cue_indicator": self.settings.color_cue_indicator,
-            "volume_indicator": self.settings.color_volume_indicator,
-            "vocal_removed_indicator": getattr(self.settings, "color_vocal_removed_indicator", "#8E7CFF"),
-            "midi_indicator": getattr(self.settings, "color_midi_indicator", "#FF9E4A"),
-            "lyric_indicator": getattr(self.settings, "color_lyric_indicator", "#57C3A4"),
+            "empty": s.color_empty,
+            "assigned": s.color_unplayed,
+            "highlighted": s.color_highlight,
+            "playing": s.color_playing,
+            "played": s.color_played,
+            "missing": s.color_error,
+            "locked": s.color_lock,
+            "marker": s.color_place_marker,
+            "copied": s.color_copied_to_cue,
+            "cue_indicator": s.color_cue_indicator,
+            "volume_indicator": s.color_volume_indicator,
+            "vocal_removed_indicator": getattr(s, "color_vocal_removed_indicator", "#8E7CFF"),
+            "midi_indicator": getattr(s, "color_midi_indicator", "#FF9E4A"),
+            "lyric_indicator": getattr(s, "color_lyric_indicator", "#57C3A4"),
         }
         # Migrate legacy default marker color so marker text remains readable.
-        if str(self.settings.color_place_marker).strip().upper() == "#111111":
-            self.settings.color_place_marker = COLORS["marker"]
+        if str(s.color_place_marker).strip().upper() == "#111111":
+            s.color_place_marker = COLORS["marker"]
             self.state_colors["marker"] = COLORS["marker"]
             try:
-                save_settings(self.settings)
+                save_settings(s)
             except OSError:
                 pass
-        self.sound_button_text_color = self.settings.sound_button_text_color
-        self.hotkeys: Dict[str, tuple[str, str]] = {
-            "new_set": (self.settings.hotkey_new_set_1, self.settings.hotkey_new_set_2),
-            "open_set": (self.settings.hotkey_open_set_1, self.settings.hotkey_open_set_2),
-            "save_set": (self.settings.hotkey_save_set_1, self.settings.hotkey_save_set_2),
-            "save_set_as": (self.settings.hotkey_save_set_as_1, self.settings.hotkey_save_set_as_2),
-            "search": (self.settings.hotkey_search_1, self.settings.hotkey_search_2),
-            "options": (self.settings.hotkey_options_1, self.settings.hotkey_options_2),
-            "play_selected_pause": (
-                self.settings.hotkey_play_selected_pause_1,
-                self.settings.hotkey_play_selected_pause_2,
-            ),
-            "play_selected": (self.settings.hotkey_play_selected_1, self.settings.hotkey_play_selected_2),
-            "pause_toggle": (self.settings.hotkey_pause_toggle_1, self.settings.hotkey_pause_toggle_2),
-            "stop_playback": (self.settings.hotkey_stop_playback_1, self.settings.hotkey_stop_playback_2),
-            "talk": (self.settings.hotkey_talk_1, self.settings.hotkey_talk_2),
-            "next_group": (self.settings.hotkey_next_group_1, self.settings.hotkey_next_group_2),
-            "prev_group": (self.settings.hotkey_prev_group_1, self.settings.hotkey_prev_group_2),
-            "next_page": (self.settings.hotkey_next_page_1, self.settings.hotkey_next_page_2),
-            "prev_page": (self.settings.hotkey_prev_page_1, self.settings.hotkey_prev_page_2),
-            "next_sound_button": (self.settings.hotkey_next_sound_button_1, self.settings.hotkey_next_sound_button_2),
-            "prev_sound_button": (self.settings.hotkey_prev_sound_button_1, self.settings.hotkey_prev_sound_button_2),
-            "multi_play": (self.settings.hotkey_multi_play_1, self.settings.hotkey_multi_play_2),
-            "go_to_playing": (self.settings.hotkey_go_to_playing_1, self.settings.hotkey_go_to_playing_2),
-            "loop": (self.settings.hotkey_loop_1, self.settings.hotkey_loop_2),
-            "next": (self.settings.hotkey_next_1, self.settings.hotkey_next_2),
-            "rapid_fire": (self.settings.hotkey_rapid_fire_1, self.settings.hotkey_rapid_fire_2),
-            "shuffle": (self.settings.hotkey_shuffle_1, self.settings.hotkey_shuffle_2),
-            "reset_page": (self.settings.hotkey_reset_page_1, self.settings.hotkey_reset_page_2),
-            "play_list": (self.settings.hotkey_play_list_1, self.settings.hotkey_play_list_2),
-            "fade_in": (self.settings.hotkey_fade_in_1, self.settings.hotkey_fade_in_2),
-            "cross_fade": (self.settings.hotkey_cross_fade_1, self.settings.hotkey_cross_fade_2),
-            "fade_out": (self.settings.hotkey_fade_out_1, self.settings.hotkey_fade_out_2),
-            "mute": (self.settings.hotkey_mute_1, self.settings.hotkey_mute_2),
-            "volume_up": (self.settings.hotkey_volume_up_1, self.settings.hotkey_volume_up_2),
-            "volume_down": (self.settings.hotkey_volume_down_1, self.settings.hotkey_volume_down_2),
-            "lock_toggle": (self.settings.hotkey_lock_toggle_1, self.settings.hotkey_lock_toggle_2),
-            "open_hide_lyric_navigator": (
-                self.settings.hotkey_open_hide_lyric_navigator_1,
-                self.settings.hotkey_open_hide_lyric_navigator_2,
-            ),
-        }
-        self.quick_action_enabled = bool(self.settings.quick_action_enabled)
-        self.quick_action_keys = list(self.settings.quick_action_keys[:48])
+        self.sound_button_text_color = s.sound_button_text_color
+        self.hotkeys: Mapping[str, tuple[str, str]] = _HotkeyView(s, "hotkey")
+        self.quick_action_enabled = bool(s.quick_action_enabled)
+        self.quick_action_keys = list(s.quick_action_keys[:48])
         if len(self.quick_action_keys) < 48:
             self.quick_action_keys.extend(["" for _ in range(48 - len(self.quick_action_keys))])
-        self.sound_button_hotkey_enabled = bool(self.settings.sound_button_hotkey_enabled)
-        self.sound_button_hotkey_priority = (
-            self.settings.sound_button_hotkey_priority
-            if self.settings.sound_button_hotkey_priority in {"system_first", "sound_button_first"}
-            else "system_first"
-        )
-        self.sound_button_hotkey_go_to_playing = bool(self.settings.sound_button_hotkey_go_to_playing)
-        self.midi_input_device_ids: List[str] = [str(v).strip() for v in self.settings.midi_input_device_ids if str(v).strip()]
+        self.sound_button_hotkey_enabled = bool(s.sound_button_hotkey_enabled)
+        self.sound_button_hotkey_go_to_playing = bool(s.sound_button_hotkey_go_to_playing)
+        self._midi_input_devices_cache: Optional[Dict[str, str]] = None
+        self._midi_input_devices_cache_t = 0.0
+        self.midi_input_device_ids: List[str] = [str(v).strip() for v in s.midi_input_device_ids if str(v).strip()]
         self.midi_input_device_ids = self._normalize_midi_input_selectors(self.midi_input_device_ids)
-        self.launchpad_enabled = bool(getattr(self.settings, "launchpad_enabled", False))
-        self.launchpad_device_selector = str(getattr(self.settings, "launchpad_device_selector", "")).strip()
-        self.launchpad_output_device_id = str(getattr(self.settings, "launchpad_output_device_id", "")).strip()
-        self.launchpad_layout = normalize_launchpad_layout(getattr(self.settings, "launchpad_layout", "bottom_six"))
+        self.launchpad_enabled = bool(getattr(s, "launchpad_enabled", False))
+        self.launchpad_device_selector = str(getattr(s, "launchpad_device_selector", "")).strip()
+        self.launchpad_output_device_id = str(getattr(s, "launchpad_output_device_id", "")).strip()
+        self.launchpad_layout = normalize_launchpad_layout(getattr(s, "launchpad_layout", "bottom_six"))
         self.launchpad_turn_off_empty_sound_button_lights = bool(
-            getattr(self.settings, "launchpad_turn_off_empty_sound_button_lights", True)
+            getattr(s, "launchpad_turn_off_empty_sound_button_lights", True)
         )
-        self.launchpad_control_bindings = [str(value or "").strip() for value in getattr(self.settings, "launchpad_control_bindings", [])[:16]]
+        self.launchpad_control_bindings = [str(value or "").strip() for value in getattr(s, "launchpad_control_bindings", [])[:16]]
         if len(self.launchpad_control_bindings) < 16:
             self.launchpad_control_bindings.extend(["" for _ in range(16 - len(self.launchpad_control_bindings))])
         if self.launchpad_enabled and self.launchpad_device_selector:
             self.midi_input_device_ids = [
                 selector for selector in self.midi_input_device_ids if str(selector).strip() != self.launchpad_device_selector
             ]
-        self.midi_hotkeys: Dict[str, tuple[str, str]] = {
-            "new_set": (self.settings.midi_hotkey_new_set_1, self.settings.midi_hotkey_new_set_2),
-            "open_set": (self.settings.midi_hotkey_open_set_1, self.settings.midi_hotkey_open_set_2),
-            "save_set": (self.settings.midi_hotkey_save_set_1, self.settings.midi_hotkey_save_set_2),
-            "save_set_as": (self.settings.midi_hotkey_save_set_as_1, self.settings.midi_hotkey_save_set_as_2),
-            "search": (self.settings.midi_hotkey_search_1, self.settings.midi_hotkey_search_2),
-            "options": (self.settings.midi_hotkey_options_1, self.settings.midi_hotkey_options_2),
-            "play_selected_pause": (
-                self.settings.midi_hotkey_play_selected_pause_1,
-                self.settings.midi_hotkey_play_selected_pause_2,
-            ),
-            "play_selected": (self.settings.midi_hotkey_play_selected_1, self.settings.midi_hotkey_play_selected_2),
-            "pause_toggle": (self.settings.midi_hotkey_pause_toggle_1, self.settings.midi_hotkey_pause_toggle_2),
-            "stop_playback": (self.settings.midi_hotkey_stop_playback_1, self.settings.midi_hotkey_stop_playback_2),
-            "talk": (self.settings.midi_hotkey_talk_1, self.settings.midi_hotkey_talk_2),
-            "next_group": (self.settings.midi_hotkey_next_group_1, self.settings.midi_hotkey_next_group_2),
-            "prev_group": (self.settings.midi_hotkey_prev_group_1, self.settings.midi_hotkey_prev_group_2),
-            "next_page": (self.settings.midi_hotkey_next_page_1, self.settings.midi_hotkey_next_page_2),
-            "prev_page": (self.settings.midi_hotkey_prev_page_1, self.settings.midi_hotkey_prev_page_2),
-            "next_sound_button": (self.settings.midi_hotkey_next_sound_button_1, self.settings.midi_hotkey_next_sound_button_2),
-            "prev_sound_button": (self.settings.midi_hotkey_prev_sound_button_1, self.settings.midi_hotkey_prev_sound_button_2),
-            "multi_play": (self.settings.midi_hotkey_multi_play_1, self.settings.midi_hotkey_multi_play_2),
-            "go_to_playing": (self.settings.midi_hotkey_go_to_playing_1, self.settings.midi_hotkey_go_to_playing_2),
-            "loop": (self.settings.midi_hotkey_loop_1, self.settings.midi_hotkey_loop_2),
-            "next": (self.settings.midi_hotkey_next_1, self.settings.midi_hotkey_next_2),
-            "rapid_fire": (self.settings.midi_hotkey_rapid_fire_1, self.settings.midi_hotkey_rapid_fire_2),
-            "shuffle": (self.settings.midi_hotkey_shuffle_1, self.settings.midi_hotkey_shuffle_2),
-            "reset_page": (self.settings.midi_hotkey_reset_page_1, self.settings.midi_hotkey_reset_page_2),
-            "play_list": (self.settings.midi_hotkey_play_list_1, self.settings.midi_hotkey_play_list_2),
-            "fade_in": (self.settings.midi_hotkey_fade_in_1, self.settings.midi_hotkey_fade_in_2),
-            "cross_fade": (self.settings.midi_hotkey_cross_fade_1, self.settings.midi_hotkey_cross_fade_2),
-            "fade_out": (self.settings.midi_hotkey_fade_out_1, self.settings.midi_hotkey_fade_out_2),
-            "mute": (self.settings.midi_hotkey_mute_1, self.settings.midi_hotkey_mute_2),
-            "volume_up": (self.settings.midi_hotkey_volume_up_1, self.settings.midi_hotkey_volume_up_2),
-            "volume_down": (self.settings.midi_hotkey_volume_down_1, self.settings.midi_hotkey_volume_down_2),
-            "lock_toggle": (self.settings.midi_hotkey_lock_toggle_1, self.settings.midi_hotkey_lock_toggle_2),
-            "open_hide_lyric_navigator": (
-                self.settings.midi_hotkey_open_hide_lyric_navigator_1,
-                self.settings.midi_hotkey_open_hide_lyric_navigator_2,
-            ),
-        }
-        self.midi_quick_action_enabled = bool(self.settings.midi_quick_action_enabled)
-        self.midi_quick_action_bindings = [normalize_midi_binding(v) for v in self.settings.midi_quick_action_bindings[:48]]
-        if len(self.midi_quick_action_bindings) < 48:
-            self.midi_quick_action_bindings.extend(["" for _ in range(48 - len(self.midi_quick_action_bindings))])
-        self.midi_sound_button_hotkey_enabled = bool(self.settings.midi_sound_button_hotkey_enabled)
-        self.midi_sound_button_hotkey_priority = (
-            self.settings.midi_sound_button_hotkey_priority
-            if self.settings.midi_sound_button_hotkey_priority in {"system_first", "sound_button_first"}
-            else "system_first"
-        )
-        self.midi_sound_button_hotkey_go_to_playing = bool(self.settings.midi_sound_button_hotkey_go_to_playing)
-        self.midi_rotary_enabled = bool(getattr(self.settings, "midi_rotary_enabled", False))
-        self.midi_rotary_group_binding = normalize_midi_binding(getattr(self.settings, "midi_rotary_group_binding", ""))
-        self.midi_rotary_page_binding = normalize_midi_binding(getattr(self.settings, "midi_rotary_page_binding", ""))
-        self.midi_rotary_sound_button_binding = normalize_midi_binding(
-            getattr(self.settings, "midi_rotary_sound_button_binding", "")
-        )
-        self.midi_rotary_jog_binding = normalize_midi_binding(getattr(self.settings, "midi_rotary_jog_binding", ""))
-        self.midi_rotary_volume_binding = normalize_midi_binding(getattr(self.settings, "midi_rotary_volume_binding", ""))
-        self.midi_rotary_group_invert = bool(getattr(self.settings, "midi_rotary_group_invert", False))
-        self.midi_rotary_page_invert = bool(getattr(self.settings, "midi_rotary_page_invert", False))
-        self.midi_rotary_sound_button_invert = bool(getattr(self.settings, "midi_rotary_sound_button_invert", False))
-        self.midi_rotary_jog_invert = bool(getattr(self.settings, "midi_rotary_jog_invert", False))
-        self.midi_rotary_volume_invert = bool(getattr(self.settings, "midi_rotary_volume_invert", False))
-        self.midi_rotary_group_sensitivity = max(
-            1, min(20, int(getattr(self.settings, "midi_rotary_group_sensitivity", 1)))
-        )
-        self.midi_rotary_page_sensitivity = max(
-            1, min(20, int(getattr(self.settings, "midi_rotary_page_sensitivity", 1)))
-        )
-        self.midi_rotary_sound_button_sensitivity = max(
-            1, min(20, int(getattr(self.settings, "midi_rotary_sound_button_sensitivity", 1)))
-        )
-        self.midi_rotary_group_relative_mode = self._normalize_midi_relative_mode(
-            getattr(self.settings, "midi_rotary_group_relative_mode", "auto")
-        )
-        self.midi_rotary_page_relative_mode = self._normalize_midi_relative_mode(
-            getattr(self.settings, "midi_rotary_page_relative_mode", "auto")
-        )
-        self.midi_rotary_sound_button_relative_mode = self._normalize_midi_relative_mode(
-            getattr(self.settings, "midi_rotary_sound_button_relative_mode", "auto")
-        )
-        self.midi_rotary_jog_relative_mode = self._normalize_midi_relative_mode(
-            getattr(self.settings, "midi_rotary_jog_relative_mode", "auto")
-        )
-        self.midi_rotary_volume_relative_mode = self._normalize_midi_relative_mode(
-            getattr(self.settings, "midi_rotary_volume_relative_mode", "auto")
-        )
-        mode = str(getattr(self.settings, "midi_rotary_volume_mode", "relative")).strip().lower()
-        self.midi_rotary_volume_mode = mode if mode in {"absolute", "relative"} else "relative"
-        self.midi_rotary_volume_step = max(1, min(20, int(getattr(self.settings, "midi_rotary_volume_step", 2))))
-        self.midi_rotary_jog_step_ms = max(10, min(5000, int(getattr(self.settings, "midi_rotary_jog_step_ms", 250))))
+        self.midi_hotkeys: Mapping[str, tuple[str, str]] = _HotkeyView(s, "midi_hotkey")
+        self.midi_quick_action_enabled = bool(s.midi_quick_action_enabled)
+        self.midi_quick_action_bindings = [""] * 48
+        for index, value in enumerate(s.midi_quick_action_bindings[:48]):
+            self.midi_quick_action_bindings[index] = normalize_midi_binding(value)
+        self.midi_sound_button_hotkey_enabled = bool(s.midi_sound_button_hotkey_enabled)
+        self.midi_sound_button_hotkey_go_to_playing = bool(s.midi_sound_button_hotkey_go_to_playing)
+        self.midi_rotary_enabled = bool(s.midi_rotary_enabled)
+        for target in _ROTARY_TARGETS:
+            prefix = f"midi_rotary_{target}"
+            setattr(self, f"{prefix}_binding", normalize_midi_binding(getattr(s, f"{prefix}_binding")))
+            setattr(self, f"{prefix}_invert", bool(getattr(s, f"{prefix}_invert")))
+            setattr(
+                self,
+                f"{prefix}_relative_mode",
+                self._normalize_midi_relative_mode(getattr(s, f"{prefix}_relative_mode")),
+            )
+        for target in _ROTARY_SENSITIVITY_TARGETS:
+            name = f"midi_rotary_{target}_sensitivity"
+            setattr(self, name, _clamp_int(getattr(s, name), 1, 20, 1))
+        self.midi_rotary_volume_step = _clamp_int(s.midi_rotary_volume_step, 1, 20, 2)
+        self.midi_rotary_jog_step_ms = _clamp_int(s.midi_rotary_jog_step_ms, 10, 5000, 250)
         self._web_remote_server: Optional[WebRemoteServer] = None
         self._main_thread_executor = MainThreadExecutor(self)
         self._audio_service = AudioServiceController(self)
@@ -518,9 +411,11 @@ class MainWindow(
                 "Falling back to system default output device."
             )
             self.audio_output_device = ""
-            self.settings.audio_output_device = ""
+            s.audio_output_device = ""
         else:
             set_output_device(configured_device)
+        self.player = None
+        self.player_b = None
         try:
             ensure_audio_decoder_ready()
             self._init_audio_players()
@@ -528,7 +423,7 @@ class MainWindow(
             self._dispose_audio_players()
             set_output_device("")
             self.audio_output_device = ""
-            self.settings.audio_output_device = ""
+            s.audio_output_device = ""
             try:
                 ensure_audio_decoder_ready()
                 self._init_audio_players()
@@ -555,6 +450,8 @@ class MainWindow(
         self.cue_page: List[SoundButtonData] = [SoundButtonData() for _ in range(SLOTS_PER_PAGE)]
         self.cue_mode = False
         self.current_set_path = ""
+        self._sound_bindings_cache: Optional[Dict[str, Tuple[str, int, int]]] = None
+        self._sound_midi_bindings_cache: Optional[Dict[str, Tuple[str, int, int]]] = None
         self._reset_set_data()
 
         self.group_buttons: Dict[str, QPushButton] = {}
@@ -619,8 +516,12 @@ class MainWindow(
         self._tool_windows: Dict[str, ToolListWindow] = {}
         self._tool_window_matches: Dict[str, List[dict]] = {}
         self._menu_actions: Dict[str, QAction] = {}
-        self._runtime_hotkey_shortcuts: List[QShortcut] = []
+        self._runtime_hotkey_shortcuts: Dict[Tuple[str, str, object], QShortcut] = {}
         self._modifier_hotkey_handlers: Dict[int, List[Callable[[], None]]] = {}
+        self._runtime_action_handlers_cache = self._build_runtime_action_handlers()
+        self._ordered_system_keys: Tuple[str, ...] = tuple(
+            k for k in SYSTEM_HOTKEY_ORDER_DEFAULT if k in self._runtime_action_handlers_cache
+        )
         self._modifier_hotkey_down: set[int] = set()
         self._ui_locked = False
         self._automation_locked = False
@@ -654,16 +555,19 @@ class MainWindow(
         self._flash_slot_until = 0.0
         self._hotkey_selected_slot_key: Optional[Tuple[str, int, int]] = None
         self._pre_mute_volume: Optional[int] = None
+        self._restore_depth = 0
+        self._restore_dirty = False
         self.timecode_dock: Optional[QDockWidget] = None
         self.timecode_panel: Optional[TimecodePanel] = None
-        self._mtc_sender = MtcMidiOutput(lambda: self.timecode_mtc_idle_behavior)
-        self._ltc_sender = LtcAudioOutput()
-        self._timecode_follow_anchor_ms = 0.0
-        self._timecode_follow_anchor_t = time.perf_counter()
-        self._timecode_follow_playing = False
-        self._timecode_follow_intent_pending = False
-        self._timecode_last_media_ms = 0.0
-        self._timecode_last_media_t = 0.0
+        self._timecode_panel_frame_bucket: Optional[Tuple[int, int]] = None
+        self._timecode_panel_refresh_pending = False
+        self._mtc_sender_instance: Optional[MtcMidiOutput] = None
+        self._ltc_sender_instance: Optional[LtcAudioOutput] = None
+        self._timecode_output_config: Optional[tuple] = None
+        self._ltc_device_resolved: Optional[str] = None
+        self._on_timecode_audio_device_changed()
+        self._midi_output_devices_cache: Optional[Dict[str, str]] = None
+        self._midi_output_devices_cache_t = 0.0
         self._timecode_event_guard_until = 0.0
         self._auto_end_fade_track: Optional[Tuple[str, int, int]] = None
         self._auto_end_fade_done = False
@@ -718,7 +622,7 @@ class MainWindow(
         self._update_timecode_status_label()
         self._update_web_remote_status_label()
         self._sync_lock_ui_state()
-        if self.lock_restart_state == "lock_on_restart" and bool(getattr(self.settings, "lock_was_locked_on_exit", False)):
+        if self.lock_restart_state == "lock_on_restart" and bool(getattr(s, "lock_was_locked_on_exit", False)):
             self._engage_lock_screen()
         self.statusBar().addWidget(self.status_hover_label)
         self.statusBar().addWidget(self.status_now_playing_label, 1)
@@ -727,10 +631,6 @@ class MainWindow(
         self.statusBar().addPermanentWidget(self.status_totals_label)
         self.preload_status_icon.setAlignment(Qt.AlignCenter)
         self.preload_status_icon.setFixedSize(34, 18)
-        self.preload_status_icon.setStyleSheet(
-            "QLabel{font-size:9pt;font-weight:bold;color:#4A4F55;background:#C8CDD4;border:1px solid #8C939D;border-radius:8px;}"
-        )
-        self.preload_status_icon.setToolTip("RAM preload idle")
         self.statusBar().addPermanentWidget(self.preload_status_icon)
         if sys.platform == "darwin":
             self.lock_screen_button = self._create_lock_screen_button(self.statusBar(), auto_raise=False)
@@ -738,9 +638,12 @@ class MainWindow(
             self.statusBar().addPermanentWidget(self.lock_screen_button)
             self._sync_lock_ui_state()
         self._update_talk_button_visual()
-        self.volume_slider.setValue(self.settings.volume)
+        self.volume_slider.setValue(s.volume)
         self._set_player_volume(self.player, self._effective_slot_target_volume(self._player_slot_volume_pct))
         self._set_player_volume(self.player_b, self._effective_slot_target_volume(self._player_b_slot_volume_pct))
+        self.current_group = s.last_group
+        self.current_page = s.last_page
+        self.cue_mode = False
         self._refresh_group_buttons()
         self._refresh_page_list()
         self._refresh_sound_grid()
@@ -753,66 +656,56 @@ class MainWindow(
         self._on_sound_button_hover(None)
         self._update_status_now_playing()
 
-        self.meter_timer = QTimer(self)
-        self.meter_timer.timeout.connect(self._tick_meter)
-        self.meter_timer.start(60)
-
         self.timecode_mtc_timer = QTimer(self)
         self.timecode_mtc_timer.timeout.connect(self._tick_timecode_mtc)
         self.timecode_mtc_timer.start(10)
 
-        self.fade_timer = QTimer(self)
-        self.fade_timer.timeout.connect(self._tick_fades)
-        self.fade_timer.start(30)
-
-        self._preload_trim_timer = QTimer(self)
-        self._preload_trim_timer.timeout.connect(enforce_audio_preload_limits)
-        self._preload_trim_timer.start(2000)
-
-        self._preload_status_timer = QTimer(self)
-        self._preload_status_timer.timeout.connect(self._tick_preload_status_icon)
-        self._preload_status_timer.start(350)
+        self._ui_tick_count = 0
+        self._ui_tick_timer = QTimer(self)
+        self._ui_tick_timer.timeout.connect(self._tick_ui)
+        self._ui_tick_timer.start(30)
         self._tick_preload_status_icon()
 
-        self.talk_blink_timer = QTimer(self)
-        self.talk_blink_timer.timeout.connect(self._tick_talk_blink)
-        self.talk_blink_timer.start(280)
-
-        self.current_group = self.settings.last_group
-        self.current_page = self.settings.last_page
-        self.cue_mode = False
         self._sync_playlist_shuffle_buttons()
-        self._refresh_group_buttons()
-        self._refresh_page_list()
-        self._refresh_sound_grid()
-        self._update_group_status()
-        self._update_page_status()
-        self._queue_current_page_audio_preload()
         self._update_button_drag_control_state()
         self._update_button_drag_visual_state()
         self._update_timecode_multiplay_warning_banner()
+        self._startup_audio_warning = startup_audio_warning
+        QTimer.singleShot(0, self._finish_startup)
+
+    def _finish_startup(self) -> None:
         self._restore_last_set_on_startup()
         if self.reset_all_on_startup:
             self._reset_all_played_state()
             self._refresh_sound_grid()
         self._apply_web_remote_state()
-        if startup_audio_warning:
-            QMessageBox.warning(self, "Audio Device", startup_audio_warning)
+        if self._startup_audio_warning:
+            QMessageBox.warning(self, "Audio Device", self._startup_audio_warning)
         self._suspend_settings_save = False
         if self._show_getting_started_on_startup:
             QTimer.singleShot(0, lambda: self._open_getting_started_window(startup=True))
         if self.tips_open_on_startup:
             QTimer.singleShot(0, lambda: self._open_tips_window(startup=True))
 
+    def _tick_ui(self) -> None:
+        self._ui_tick_count += 1
+        count = self._ui_tick_count
+        self._tick_fades()
+        if count % 2 == 0:
+            self._tick_meter()
+        if count % 9 == 0:
+            self._tick_talk_blink()
+        if count % 12 == 0:
+            self._tick_preload_status_icon()
+        if count % 67 == 0:
+            enforce_audio_preload_limits()
+
     def _shutdown_runtime_threads(self) -> None:
-        try:
-            self._ltc_sender.shutdown()
-        except Exception:
-            pass
-        try:
-            self._mtc_sender.shutdown()
-        except Exception:
-            pass
+        for sender in self._timecode_senders():
+            try:
+                sender.shutdown()
+            except Exception:
+                pass
         try:
             self._audio_service.shutdown()
         except Exception:
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
+import time
 from copy import deepcopy
-from datetime import datetime
 from typing import Dict, List, Optional, Tuple
 
 from PyQt5.QtCore import QEvent, QPoint, QRect, Qt, QTimer, pyqtSignal
@@ -185,6 +185,19 @@ def gadgets_to_legacy_layout_visibility(gadgets: Dict[str, Dict[str, object]]) -
     return order, visibility
 
 
+_BOLD_FONTS: Dict[int, QFont] = {}
+
+
+def _bold_font(point_size: int) -> QFont:
+    font = _BOLD_FONTS.get(point_size)
+    if font is None:
+        font = QFont()
+        font.setPointSize(point_size)
+        font.setBold(True)
+        _BOLD_FONTS[point_size] = font
+    return font
+
+
 class _GadgetFrame(QFrame):
     changed = pyqtSignal(str)
     selected = pyqtSignal(str)
@@ -234,14 +247,8 @@ class _GadgetFrame(QFrame):
     def _apply_fonts(self) -> None:
         area = max(1, self.width() * self.height())
         scale = max(0.8, min(3.8, (area / 170000.0) ** 0.5))
-        title_font = QFont(self.title_label.font())
-        title_font.setPointSize(max(11, int(13 * scale)))
-        title_font.setBold(True)
-        self.title_label.setFont(title_font)
-        value_font = QFont(self.value_label.font())
-        value_font.setPointSize(max(16, int(24 * scale)))
-        value_font.setBold(True)
-        self.value_label.setFont(value_font)
+        self.title_label.setFont(_bold_font(max(11, int(13 * scale))))
+        self.value_label.setFont(_bold_font(max(16, int(24 * scale))))
 
     def apply_config(self, orientation: str, hide_text: bool, hide_border: bool) -> None:
         token = str(orientation or "").strip().lower()
@@ -456,6 +463,7 @@ class StageDisplayWindow(QWidget):
             widget.set_selected(False)
 
         self._status_state = "not_playing"
+        self._status_shown = False
         self._alert_text = ""
         self._alert_active = False
         self._datetime_timer = QTimer(self)
@@ -517,7 +525,7 @@ class StageDisplayWindow(QWidget):
         progress_style: str = "",
     ) -> None:
         values = {
-            "current_time": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "current_time": time.strftime("%Y-%m-%d %H:%M:%S"),
             "alert": self._alert_text,
             "total_time": total_time,
             "elapsed": elapsed,
@@ -541,7 +549,14 @@ class StageDisplayWindow(QWidget):
 
     def set_playback_status(self, state: str) -> None:
         token = str(state or "").strip().lower()
+        if token == self._status_state and self._status_shown:
+            return
         self._status_state = token
+        self._show_playback_status()
+
+    def _show_playback_status(self) -> None:
+        token = self._status_state
+        self._status_shown = True
         if token == "playing":
             self._status_value.setText(f"> {tr('Playing')}")
         elif token == "paused":
@@ -559,7 +574,7 @@ class StageDisplayWindow(QWidget):
                 widget.title_label.setText(tr("Next Playing"))
             else:
                 widget.title_label.setText(tr(labels.get(key, key)))
-        self.set_playback_status(self._status_state)
+        self._show_playback_status()
         self._update_datetime()
         self._apply_alert_visibility()
 
@@ -574,7 +589,9 @@ class StageDisplayWindow(QWidget):
     def _update_datetime(self) -> None:
         current_widget = self._canvas._widgets.get("current_time")
         if current_widget is not None:
-            current_widget.value_label.setText(datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+            text = time.strftime("%Y-%m-%d %H:%M:%S")
+            if current_widget.value_label.text() != text:
+                current_widget.value_label.setText(text)
 
     def _apply_alert_visibility(self) -> None:
         alert_widget = self._canvas._widgets.get("alert")
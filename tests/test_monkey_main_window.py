@@ -272,12 +272,8 @@ def test_monkey_main_window_pairwise_settings_combo(qapp, monkeypatch, tmp_path)
                 assert calls["stop_playback"] == 0
     finally:
         for timer_name in [
-            "meter_timer",
             "timecode_mtc_timer",
-            "fade_timer",
-            "_preload_trim_timer",
-            "_preload_status_timer",
-            "talk_blink_timer",
+            "_ui_tick_timer",
             "_midi_poll_timer",
         ]:
             timer = getattr(window, timer_name, None)
@@ -398,12 +394,8 @@ def test_pick_sound_limits_verify_and_lyric_scan_to_available_slots(qapp, monkey
         assert window.data["A"][0][0].file_path == str(audio_paths[0])
     finally:
         for timer_name in [
-            "meter_timer",
             "timecode_mtc_timer",
-            "fade_timer",
-            "_preload_trim_timer",
-            "_preload_status_timer",
-            "talk_blink_timer",
+            "_ui_tick_timer",
             "_midi_poll_timer",
         ]:
             timer = getattr(window, timer_name, None)
@@ -531,12 +523,8 @@ def test_drop_audio_files_on_sound_button_uses_add_sound_flow(qapp, monkeypatch,
         assert calls["lyric"] == 1
     finally:
         for timer_name in [
-            "meter_timer",
             "timecode_mtc_timer",
-            "fade_timer",
-            "_preload_trim_timer",
-            "_preload_status_timer",
-            "talk_blink_timer",
+            "_ui_tick_timer",
             "_midi_poll_timer",
         ]:
             timer = getattr(window, timer_name, None)
@@ -646,12 +634,8 @@ def test_vocal_removed_indicator_uses_stripe_without_page_missing_track_warning(
         assert window.vocal_removed_warning_banner.text() == ""
     finally:
         for timer_name in [
-            "meter_timer",
             "timecode_mtc_timer",
-            "fade_timer",
-            "_preload_trim_timer",
-            "_preload_status_timer",
-            "talk_blink_timer",
+            "_ui_tick_timer",
             "_midi_poll_timer",
         ]:
             timer = getattr(window, timer_name, None)
@@ -754,12 +738,8 @@ def test_sound_button_text_wrap_and_status_legend(qapp, monkeypatch, tmp_path):
         assert "Vocal Removed Stripe" in legend_labels
     finally:
         for timer_name in [
-            "meter_timer",
             "timecode_mtc_timer",
-            "fade_timer",
-            "_preload_trim_timer",
-            "_preload_status_timer",
-            "talk_blink_timer",
+            "_ui_tick_timer",
             "_midi_poll_timer",
         ]:
             timer = getattr(window, timer_name, None)
@@ -851,12 +831,8 @@ def test_colour_legend_toggle_action_updates_visibility_and_setting(qapp, monkey
         assert window.settings.show_colour_legend is True
     finally:
         for timer_name in [
-            "meter_timer",
             "timecode_mtc_timer",
-            "fade_timer",
-            "_preload_trim_timer",
-            "_preload_status_timer",
-            "talk_blink_timer",
+            "_ui_tick_timer",
             "_midi_poll_timer",
         ]:
             timer = getattr(window, timer_name, None)
@@ -985,12 +961,8 @@ def test_pick_sound_skip_lyric_scan_keeps_add_and_uses_partial_results(qapp, mon
         assert any("partial scan results" in msg.lower() for msg in notices)
     finally:
         for timer_name in [
-            "meter_timer",
             "timecode_mtc_timer",
-            "fade_timer",
-            "_preload_trim_timer",
-            "_preload_status_timer",
-            "talk_blink_timer",
+            "_ui_tick_timer",
             "_midi_poll_timer",
         ]:
             timer = getattr(window, timer_name, None)
@@ -1103,12 +1075,8 @@ def test_preload_queue_respects_path_safety_toggle(qapp, monkeypatch, tmp_path):
         assert str(unsafe_audio) in captured[-1]
     finally:
         for timer_name in [
-            "meter_timer",
             "timecode_mtc_timer",
-            "fade_timer",
-            "_preload_trim_timer",
-            "_preload_status_timer",
-            "talk_blink_timer",
+            "_ui_tick_timer",
             "_midi_poll_timer",
         ]:
             timer = getattr(window, timer_name, None)
@@ -1120,3 +1088,210 @@ def test_preload_queue_respects_path_safety_toggle(qapp, monkeypatch, tmp_path):
         window.hide()
         window.deleteLater()
         qapp.processEvents()
+
+
+def _open_minimal_main_window(qapp, monkeypatch) -> "mw.MainWindow":
+    class _DummyLtcSender:
+        def set_output(self, *_args, **_kwargs):
+            return None
+
+        def update(self, *_args, **_kwargs):
+            return None
+
+        def request_resync(self):
+            return None
+
+        def shutdown(self):
+            return None
+
+    class _DummyMtcSender:
+        def __init__(self, *_args, **_kwargs):
+            pass
+
+        def set_device(self, *_args, **_kwargs):
+            return None
+
+        def update(self, *_args, **_kwargs):
+            return None
+
+        def request_resync(self):
+            return None
+
+        def shutdown(self):
+            return None
+
+    monkeypatch.setattr(mw, "LtcAudioOutput", _DummyLtcSender)
+    monkeypatch.setattr(mw, "MtcMidiOutput", _DummyMtcSender)
+    monkeypatch.setattr(mw, "set_output_device", lambda _name: True)
+    monkeypatch.setattr(mw, "configure_audio_preload_cache_policy", lambda *args, **kwargs: None)
+    monkeypatch.setattr(mw, "configure_waveform_disk_cache", lambda *args, **kwargs: "")
+    monkeypatch.setattr(mw, "shutdown_audio_preload", lambda: None)
+    monkeypatch.setattr(mw, "save_settings", lambda _settings: None)
+    monkeypatch.setattr(mw.MainWindow, "_hard_stop_all", lambda self: None)
+    monkeypatch.setattr(mw.MainWindow, "_stop_web_remote_service", lambda self: None)
+    monkeypatch.setattr(mw.MainWindow, "closeEvent", lambda self, event: event.accept())
+
+    settings = AppSettings()
+    settings.tips_open_on_startup = False
+    settings.reset_all_on_startup = False
+    settings.last_group = "A"
+    settings.last_page = 0
+    settings.web_remote_enabled = False
+    monkeypatch.setattr(mw, "load_settings", lambda s=settings: s)
+
+    window = mw.MainWindow()
+    window.show()
+    qapp.processEvents()
+    return window
+
+
+def _close_main_window(qapp, window) -> None:
+    for timer_name in [
+        "timecode_mtc_timer",
+        "_ui_tick_timer",
+        "_midi_poll_timer",
+    ]:
+        timer = getattr(window, timer_name, None)
+        if timer is not None:
+            try:
+                timer.stop()
+            except Exception:
+                pass
+    window.hide()
+    window.deleteLater()
+    qapp.processEvents()
+
+
+def _banner_background(banner: QLabel) -> str:
+    # Sample inside the padding so the label text never covers the pixel.
+    return banner.grab().toImage().pixelColor(3, 3).name()
+
+
+@pytest.mark.monkey
+def test_notice_banner_keeps_its_colour_in_button_drag_mode(qapp, monkeypatch):
+    window = _open_minimal_main_window(qapp, monkeypatch)
+    try:
+        banner = window.save_notice_banner
+        banner.setText("")
+        banner.setVisible(True)
+        qapp.processEvents()
+        assert _banner_background(banner) == "#e4f7e7"
+
+        window._toggle_button_drag_mode(True)
+        qapp.processEvents()
+        assert window._is_button_drag_enabled() is True
+        assert _banner_background(banner) == "#e4f7e7"
+        assert _banner_background(window.drag_mode_banner) == "#fff0a6"
+
+        window._toggle_button_drag_mode(False)
+        qapp.processEvents()
+        assert window._is_button_drag_enabled() is False
+        assert _banner_background(banner) == "#e4f7e7"
+    finally:
+        _close_main_window(qapp, window)
+
+
+@pytest.mark.monkey
+def test_apply_hotkeys_only_rebuilds_changed_shortcuts(qapp, monkeypatch):
+    window = _open_minimal_main_window(qapp, monkeypatch)
+    try:
+        window.quick_action_enabled = True
+        window.quick_action_keys = [""] * 48
+        window.quick_action_keys[0] = "Ctrl+Alt+Shift+1"
+        window.quick_action_keys[1] = "Ctrl+Alt+Shift+2"
+        window._apply_hotkeys()
+        first = dict(window._runtime_hotkey_shortcuts)
+        first_key = (window._normalize_hotkey_text("Ctrl+Alt+Shift+1"), "quick_action", 0)
+        second_key = (window._normalize_hotkey_text("Ctrl+Alt+Shift+2"), "quick_action", 1)
+        assert first_key in first
+        assert second_key in first
+
+        window._apply_hotkeys()
+        again = window._runtime_hotkey_shortcuts
+        assert again.keys() == first.keys()
+        assert all(again[key] is shortcut for key, shortcut in first.items())
+
+        window.quick_action_keys[0] = "Ctrl+Alt+Shift+3"
+        window.quick_action_keys[1] = ""
+        window._apply_hotkeys()
+        changed = dict(window._runtime_hotkey_shortcuts)
+        added_key = (window._normalize_hotkey_text("Ctrl+Alt+Shift+3"), "quick_action", 0)
+        assert set(first) - set(changed) == {first_key, second_key}
+        assert set(changed) - set(first) == {added_key}
+        assert all(changed[key] is first[key] for key in set(first) & set(changed))
+        assert first[first_key].parent() is None
+        assert first[second_key].parent() is None
+        assert changed[added_key].parent() is window
+    finally:
+        _close_main_window(qapp, window)
+
+
+@pytest.mark.monkey
+def test_set_dirty_rebuilds_cached_sound_button_hotkeys(qapp, monkeypatch, tmp_path):
+    audio = tmp_path / "hotkey.wav"
+    _write_dummy_wav(audio)
+    window = _open_minimal_main_window(qapp, monkeypatch)
+    try:
+        window._reset_set_data()
+        slot = window.data["A"][0][0]
+        slot.file_path = str(audio)
+        slot.sound_hotkey = "K"
+        window._set_dirty(True)
+
+        bindings = window._collect_sound_button_hotkey_bindings()
+        assert bindings == {window._normalize_hotkey_text("K"): ("A", 0, 0)}
+        assert window._collect_sound_button_hotkey_bindings() is bindings
+
+        slot.sound_hotkey = "L"
+        window._set_dirty(True)
+
+        rebuilt = window._collect_sound_button_hotkey_bindings()
+        assert rebuilt is not bindings
+        assert rebuilt == {window._normalize_hotkey_text("L"): ("A", 0, 0)}
+    finally:
+        _close_main_window(qapp, window)
+
+
+@pytest.mark.monkey
+def test_progress_ticks_reuse_waveform_pixmaps(qapp, monkeypatch):
+    window = _open_minimal_main_window(qapp, monkeypatch)
+    try:
+        label = window.progress_label
+        window.main_progress_display_mode = "waveform"
+        label.set_display_mode("waveform")
+        window.current_duration_ms = 10000
+        window._main_progress_waveform = [0.2, 0.8, 0.5, 1.0] * 64
+        label.set_waveform(window._main_progress_waveform)
+
+        window._set_progress_display(0.25)
+        label.grab()
+        cache = label._waveform_pixmap_cache
+        assert cache is not None
+
+        window._set_progress_display(0.5)
+        label.grab()
+        assert label._waveform_pixmap_cache is cache
+    finally:
+        _close_main_window(qapp, window)
+
+
+@pytest.mark.monkey
+def test_waveform_mode_switch_forgets_last_playhead(qapp, monkeypatch):
+    window = _open_minimal_main_window(qapp, monkeypatch)
+    try:
+        label = window.progress_label
+        label.set_display_mode("waveform")
+        label.set_transport_state(0.8, 0.0, 1.0, False)
+        assert label._last_play_x is not None
+
+        label.set_display_mode("progress_bar")
+        label.set_transport_state(0.1, 0.0, 1.0, False)
+        label.set_display_mode("waveform")
+        assert label._last_play_x is None
+
+        label.set_transport_state(0.1, 0.0, 1.0, False)
+        assert label._last_play_x is not None
+        label.set_waveform([0.5, 0.5])
+        assert label._last_play_x is None
+    finally:
+        _close_main_window(qapp, window)